@@ -1,19 +1,20 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
-import logging
-import logging.config
-import multiprocessing
+from __future__ import annotations
+
 from functools import lru_cache, wraps
-from importlib import metadata
 from importlib.machinery import PathFinder
 from os import environ
 from pathlib import Path
-from traceback import FrameSummary, StackSummary, extract_stack
-from typing import Callable, Final, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Final, FrozenSet, List, Optional
 
-import urllib3
+if TYPE_CHECKING:
+    from traceback import FrameSummary, StackSummary
 
-USER_AGENT = f"{__package__}/{metadata.version(__package__)}"
+# attributes computed on first access (see __getattr__), so "import catalystwan" stays cheap
+__version__: str
+USER_AGENT: str
+pkg_src_list: List[Path]
 
 
 def with_proc_info_header(method: Callable[..., str]) -> Callable[..., str]:
@@ -23,6 +24,9 @@ def with_proc_info_header(method: Callable[..., str]) -> Callable[..., str]:
 
     @wraps(method)
     def wrapper(*args, **kwargs) -> str:
+        import multiprocessing
+        from traceback import extract_stack
+
         wrapped = method(*args, **kwargs)
         header = f"{multiprocessing.current_process()}"
         if frame_summary := get_first_external_stack_frame(extract_stack()):
@@ -55,7 +59,7 @@ def is_file_in_package(fname: str) -> bool:
     Checks if filepath given by string
     is part of catalystwan source code
     """
-    return Path(fname) in pkg_src_list
+    return Path(fname) in package_sources()
 
 
 def list_package_sources() -> List[Path]:
@@ -70,13 +74,42 @@ def list_package_sources() -> List[Path]:
     return pkg_srcs
 
 
+@lru_cache()
+def package_sources() -> FrozenSet[Path]:
+    """Paths to all python source files for current package, globbed once on first use"""
+    return frozenset(list_package_sources())
+
+
+@lru_cache()
+def _distribution_version() -> str:
+    from importlib import metadata
+
+    return metadata.version(__package__)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _distribution_version()
+    elif name == "USER_AGENT":
+        value = f"{__package__}/{_distribution_version()}"
+    elif name == "pkg_src_list":
+        value = list(package_sources())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
 LOGGING_CONF_DIR: Final[str] = str(Path(__file__).parents[0] / "logging.conf")
-__version__ = metadata.version(__package__)
-pkg_src_list = list_package_sources()
 
 
 if environ.get("catalystwan_devel") is not None:
+    import logging
+    import logging.config
+
+    import urllib3
+
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     catalystwan_logger = logging.getLogger(__name__)
     logging.config.fileConfig(LOGGING_CONF_DIR, disable_existing_loggers=False)
-    catalystwan_logger.debug(f"catalystwan {__version__}")
+    catalystwan_logger.debug(f"catalystwan {_distribution_version()}")
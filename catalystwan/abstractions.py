@@ -1,6 +1,7 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
-from typing import Optional, Protocol, Type, TypeVar
+from pathlib import Path
+from typing import Any, Optional, Protocol, Type, TypeVar
 
 from packaging.version import Version  # type: ignore
 
@@ -45,6 +46,28 @@ class APIEndpointClient(Protocol):
     def request(self, method: str, url: str, **kwargs) -> APIEndpointClientResponse:
         ...
 
+    def get_file(self, url: str, filename: Path) -> Any:
+        """Streams body of GET response to file (instead of reading it into memory)"""
+        ...
+
+    @property
+    def api_version(self) -> Optional[Version]:
+        ...
+
+    @property
+    def session_type(self) -> Optional[SessionType]:
+        ...
+
+
+class AsyncAPIEndpointClient(Protocol):
+    """
+    Interface to asynchronous client object.
+    Same as APIEndpointClient but 'request' is a coroutine function so many requests can be awaited concurrently.
+    """
+
+    async def request(self, method: str, url: str, **kwargs) -> APIEndpointClientResponse:
+        ...
+
     @property
     def api_version(self) -> Optional[Version]:
         ...
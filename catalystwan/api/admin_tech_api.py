@@ -6,7 +6,6 @@ Module for handling admintech logs for a device
 from __future__ import annotations
 
 import logging
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
 
@@ -16,6 +15,7 @@ from requests.exceptions import HTTPError
 from catalystwan.dataclasses import AdminTech, DeviceAdminTech
 from catalystwan.exceptions import CatalystwanException
 from catalystwan.utils.creation_tools import create_dataclass
+from catalystwan.waiter import Backoff, wait_until
 
 if TYPE_CHECKING:
     from catalystwan.session import ManagerSession
@@ -95,7 +95,7 @@ class AdminTechAPI:
             exclude_logs: exclude logs in generated admintech log file
             request_timeout: wait time in seconds to generate admintech after request
             polling_timeout: retry period in seconds for successfull request
-            polling_interval: polling interval in seconds between request attempts
+            polling_interval: polling interval in seconds between request attempts (first attempts are more frequent)
         Returns:
             filename of generated admintech log
         """
@@ -106,29 +106,37 @@ class AdminTechAPI:
             "exclude-tech": exclude_tech,
             "exclude-logs": exclude_logs,
         }
-        polling_timer = polling_timeout
-        while polling_timer > 0:
+
+        def post_admin_tech() -> Response:
             logger.info(
                 f"Starting AdminTech log creation for {device_id}, waiting up to {request_timeout} seconds to complete"
             )
             try:
-                response = self.session.post(
+                return self.session.post(
                     url="/dataservice/device/tools/admintech",
                     json=body,
                     timeout=request_timeout,
                 )
             except HTTPError as http_error:
-                response = http_error.response  # type: ignore
-            if response.status_code == 200:
-                return response.json()["fileName"]
+                return http_error.response  # type: ignore
+
+        def in_progress(response: Response) -> bool:
             if response.status_code == 400 and create_admin_tech_error_msgs in response.json().get("error", {}).get(
                 "details", ""
             ):
-                logger.warning(f"Admin tech creation already in progress, retrying in {polling_interval} seconds")
-            else:
-                raise GenerateAdminTechLogError(f"It is not possible to generate admintech log for {device_id}")
-            time.sleep(polling_interval)
-            polling_timer -= polling_interval
+                logger.warning(f"Admin tech creation already in progress for {device_id}, retrying")
+                return True
+            return False
+
+        result = wait_until(
+            post_admin_tech,
+            until=lambda response: response.status_code == 200,
+            abort_if=lambda response: not in_progress(response),
+            timeout=polling_timeout,
+            backoff=Backoff.from_interval(polling_interval),
+        )
+        if result.satisfied and result.value is not None:
+            return result.value.json()["fileName"]
         raise GenerateAdminTechLogError(f"It is not possible to generate admintech log for {device_id}")
 
     def _get_token_id(self, filename: str) -> str:
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
-
-from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set
 
 from catalystwan.dataclasses import AlarmData
+from catalystwan.pagination import ScrollPagination, iterate_pages
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass, flatten_dict
+from catalystwan.waiter import Backoff, wait_until
 
 if TYPE_CHECKING:
     from catalystwan.session import ManagerSession
@@ -53,6 +53,39 @@ class AlarmsAPI:
             >>> alarms = AlarmsAPI(session).get()
             >>> critical_alarms = alarms.filter(severity=Severity.CRITICAL)
         """
+        query = self._query(from_time)
+        response = self.session.post(url=AlarmsAPI.URL, json=query).json()["data"]
+        alarms = [create_dataclass(AlarmData, flatten_dict(alarm)) for alarm in response]
+        logger.info("Current alarms collected successfully.")
+
+        return DataSequence(AlarmData, alarms)
+
+    def iterate(
+        self, from_time: Optional[int] = None, page_size: int = 1000, read_ahead: bool = True
+    ) -> Iterator[AlarmData]:
+        """Lazily iterates over alarms fetched page by page, so large number of alarms is never held in memory.
+
+        Args:
+            from_time: Gets alarms from time in hour. Defaults to None - gets all alarms.
+            page_size: Number of alarms fetched with single request.
+            read_ahead: Fetches next page while current page is consumed.
+
+        Returns:
+            Iterator[AlarmData] of getted alarms.
+
+        Examples:
+            >>> for alarm in AlarmsAPI(session).iterate(from_time=24):
+            >>>     archive.write(alarm)
+        """
+        query = self._query(from_time)
+        return iterate_pages(
+            lambda params: self.session.post(url=f"{AlarmsAPI.URL}/page", json=query, params=params),
+            lambda response: [create_dataclass(AlarmData, flatten_dict(alarm)) for alarm in response.json()["data"]],
+            ScrollPagination(count=page_size, read_ahead=read_ahead),
+        )
+
+    @staticmethod
+    def _query(from_time: Optional[int] = None) -> Dict[str, Any]:
         query: Dict[str, Any] = {"query": {"condition": "AND", "rules": []}}
         if from_time:
             query["query"]["rules"].append(
@@ -63,12 +96,7 @@ class AlarmsAPI:
                     "operator": "last_n_hours",
                 }
             )
-
-        response = self.session.post(url=AlarmsAPI.URL, json=query).json()["data"]
-        alarms = [create_dataclass(AlarmData, flatten_dict(alarm)) for alarm in response]
-        logger.info("Current alarms collected successfully.")
-
-        return DataSequence(AlarmData, alarms)
+        return query
 
     def mark_all_as_viewed(self) -> None:
         """Marks all alarms as viewed."""
@@ -157,20 +185,7 @@ class AlarmVerification:
         self.found: Set[AlarmData] = set()
         self.not_found: Set[AlarmData] = set()
 
-        def _log_exception(retry_state):
-            self.logger.error(f"Cannot found alarms in {timeout_seconds}.")
-            self.logger.error(f"Original exception: {retry_state.outcome.exception()}.")
-
-        def check(founds):
-            return expected != founds
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check),
-            retry_error_callback=_log_exception,
-        )
-        def wait_for_alarms():
+        def find_alarms() -> Set[AlarmData]:
             self.logger.info(f"waiting for alarms: {expected ^ self.found}")
             for expected_alarm in expected ^ self.found:
                 if self.__check(expected_alarm):
@@ -178,4 +193,11 @@ class AlarmVerification:
             self.not_found = expected ^ self.found
             return self.found
 
-        wait_for_alarms()
+        result = wait_until(
+            find_alarms,
+            until=lambda found: found == expected,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        )
+        if not result.satisfied:
+            self.logger.error(f"Cannot found alarms in {timeout_seconds}: {self.not_found}.")
@@ -7,16 +7,16 @@ import logging
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Iterator, List, Union
 
-from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
-
 from catalystwan.dataclasses import BfdSessionData, Connection, Device, WanInterface
 from catalystwan.endpoints.real_time_monitoring.reboot_history import RebootEntry
 from catalystwan.exceptions import CatalystwanException
+from catalystwan.fan_out import DEFAULT_MAX_WORKERS, fan_out_dataseq
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 from catalystwan.utils.operation_status import OperationStatus
 from catalystwan.utils.personality import Personality
 from catalystwan.utils.reachability import Reachability
+from catalystwan.waiter import Backoff, wait_until
 
 if TYPE_CHECKING:
     from catalystwan.session import ManagerSession
@@ -32,7 +32,8 @@ class DevicesAPI:
         session: logged in API client session
     """
 
-    max_params = 1000
+    max_params = 1000  # maximum number of device IDs in single request
+    max_workers = DEFAULT_MAX_WORKERS  # maximum number of concurrent requests
 
     def __init__(self, session: ManagerSession) -> None:
         self.session = session
@@ -109,22 +110,8 @@ class DevicesAPI:
             bool: True if all ok, False like something wrong
         """
 
-        def _log_exception(retry_state):
-            self.session.__get_logger(f"Orignial exception: {retry_state.outcome.exception()}.")
-
-        def check_state(action_data):
-            list_action = [action["status"] == OperationStatus.SUCCESS.value for action in action_data]
-            return not all(list_action)
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_state),
-            retry_error_callback=_log_exception,
-        )
-        def wait_for_state():
-            status_api = f"/dataservice/device/action/status/{action_id}"
-            return self.session.get_data(f"{status_api}")
+        def all_succeeded(action_data) -> bool:
+            return all(action["status"] == OperationStatus.SUCCESS.value for action in action_data)
 
         response = self.session.post("/dataservice/certificate/vedge/list?action=push").json()
         if response.get("id"):
@@ -132,7 +119,15 @@ class DevicesAPI:
         else:
             raise CatalystwanException("Failed to push edges list certificates")
 
-        return True if wait_for_state() else False
+        result = wait_until(
+            lambda: self.session.get_data(f"/dataservice/device/action/status/{action_id}"),
+            until=all_succeeded,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        )
+        if not result.satisfied:
+            logger.warning(f"Pushing certificates to controllers not completed after {result.elapsed:.1f} seconds.")
+        return bool(result.satisfied and result.value)
 
     def get(self, rediscover: bool = False) -> DataSequence[Device]:
         """Data sequence of all devices.
@@ -155,13 +150,11 @@ class DevicesAPI:
             self.session.post(url=api)
         devices = self.session.endpoints.monitoring_device_details.list_all_devices()
         device_ids = [device.device_id for device in devices]
-        devices_sys_info = DataSequence(Device, [])
-        for i in range(0, len(device_ids), self.max_params):
-            params = {"deviceId": device_ids[i : i + self.max_params]}
-            resp = self.session.get(url="/dataservice/device/system/info", params=params)
-            devices_sys_info += resp.dataseq(Device)
 
-        return devices_sys_info
+        def get_system_info(chunk: List[str]) -> DataSequence[Device]:
+            return self.session.get(url="/dataservice/device/system/info", params={"deviceId": chunk}).dataseq(Device)
+
+        return fan_out_dataseq(Device, get_system_info, device_ids, self.max_params, self.max_workers)
 
 
 class DeviceStateAPI:
@@ -281,20 +274,28 @@ class DeviceStateAPI:
         sleep_seconds: int = 5,
         timeout_seconds: int = 60,
         exp_state: str = "up",
-    ):
-        def check_state(bfd_sessions):
-            return not all([bfd_session.state == exp_state for bfd_session in bfd_sessions])
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_state),
-        )
-        def wait_for_bfd_session_come_up():
-            return self.get_bfd_sessions(system_ip)
-            # from my observation it is necessary to wait minimum 5 seconds for BFD's session gets up state
+    ) -> None:
+        """Waits until all BFD sessions of device are in expected state.
 
-        wait_for_bfd_session_come_up()
+        Args:
+            system_ip: device system IP
+            sleep_seconds: maximum seconds between polls is twice this value, first polls are more frequent
+            timeout_seconds: failure timeout
+            exp_state: expected state of BFD sessions
+
+        Raises:
+            WaitTimeoutError: when BFD sessions are not in expected state before timeout
+        """
+
+        def all_in_state(bfd_sessions: List[BfdSessionData]) -> bool:
+            return all(bfd_session.state == exp_state for bfd_session in bfd_sessions)
+
+        wait_until(
+            lambda: self.get_bfd_sessions(system_ip),
+            until=all_in_state,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        ).value_or_raise(f"BFD sessions of {system_ip} are not {exp_state}")
 
     def wait_for_device_state(
         self,
@@ -302,37 +303,29 @@ class DeviceStateAPI:
         sleep_seconds: int = 5,
         timeout_seconds: int = 600,
         exp_state: Reachability = Reachability.REACHABLE,
-    ):
+    ) -> bool:
         """
         Waiting for the state of the machine.
 
         Args:
           device_id(Str): Device ID (usually system-ip)
           timeout_seconds(int): Failure timeout.
-          sleep_seconds(int): Sleep time.
+          sleep_seconds(int): Maximum sleep time is twice this value, first polls are more frequent.
           exp_state(Reachability): The expected state of the machine
 
         Returns:
           True if the expected state has been achieved
 
         """
-
-        def _log_exception(retry_state):
-            self.session.__get_logger(f"Orignial exception: {retry_state.outcome.exception()}.")
-
-        def check_state(state):
-            return state == exp_state.value
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_state),
-            retry_error_callback=_log_exception,
+        result = wait_until(
+            lambda: self.get_system_status(device_id).reachability,
+            until=lambda reachability: reachability == exp_state,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
         )
-        def wait_for_state():
-            return self.get_system_status(device_id).reachability
-
-        return True if wait_for_state() else False
+        if not result.satisfied:
+            logger.warning(f"Device {device_id} is {result.value} after {result.elapsed:.1f} seconds.")
+        return result.satisfied
 
 
 __all__ = ["Device"]
@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-
-from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from catalystwan.api.basic_api import DevicesAPI, DeviceStateAPI
 from catalystwan.dataclasses import Device
@@ -15,6 +13,7 @@ from catalystwan.utils.operation_status import OperationStatus
 from catalystwan.utils.personality import Personality
 from catalystwan.utils.reachability import Reachability
 from catalystwan.utils.validate_status import ValidateStatus
+from catalystwan.waiter import Backoff, wait_until
 
 logger = logging.getLogger(__name__)
 
@@ -90,31 +89,30 @@ class RebootAction(DeviceActionAPI):
         expected_status: str = OperationStatus.SUCCESS.value,
         expected_reachability: str = Reachability.REACHABLE.value,
     ):
-        def check_status(action_data):
-            return not action_data == expected_status
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_status),
-        )
-        def wait_for_come_up():
-            status_api = f"{self.action_status_api}{self.action_id}"
-            # from my observation it is necessary to wait minimum 1 second for data related with reboot
+        """Waits until reboot action has expected status and device has expected reachability.
+
+        Raises:
+            WaitTimeoutError: when reboot is not completed before timeout
+        """
+        status_api = f"{self.action_status_api}{self.action_id}"
+
+        def get_state() -> Tuple[str, str]:
             try:
-                action_data = self.session.get_data(f"{status_api}")[0]["status"]
-                logger.debug(f"Status of device {self.dev.hostname} reboot is: {action_data}")
+                action_status = self.session.get_data(status_api)[0]["status"]
+                logger.debug(f"Status of device {self.dev.hostname} reboot is: {action_status}")
             except IndexError:
-                action_data = ""
-            status = DeviceStateAPI(self.session).get_system_status(self.dev.id)
+                action_status = ""
             # it is necessary to wait also for Success of reboot because device can be reachable even several
             # seconds after execute reboot
-            if status.reachability.value == expected_reachability:
-                return action_data
-            else:
-                return None
+            status = DeviceStateAPI(self.session).get_system_status(self.dev.id)
+            return action_status, status.reachability.value
 
-        wait_for_come_up()
+        wait_until(
+            get_state,
+            until=lambda state: state == (expected_status, expected_reachability),
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        ).value_or_raise(f"Reboot of {self.dev.hostname} not completed")
 
 
 class ValidateAction(DeviceActionAPI):  # TODO check
@@ -152,22 +150,18 @@ class ValidateAction(DeviceActionAPI):  # TODO check
         expected_status: str = ValidateStatus.validate.value,
         expected_reachability: str = Reachability.REACHABLE.value,
     ):
-        def check_status(action_data):
-            return not action_data["validity"] == expected_status
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_status),
-        )
-        def wait_for_come_up():
+        def get_device_data() -> Optional[dict]:
             status = DeviceStateAPI(self.session).get_system_status(self.dev.id)
             if status.reachability.value == expected_reachability:
                 return self.session.get_data(f"/dataservice/device?host-name={self.dev.hostname}")[0]
-            else:
-                return None
+            return None
 
-        wait_for_come_up()
+        wait_until(
+            get_device_data,
+            until=lambda device_data: device_data is not None and device_data["validity"] == expected_status,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        ).value_or_raise(f"Validation of {self.dev.hostname} not completed")
 
 
 class DecommissionAction(DeviceActionAPI):
@@ -198,19 +192,15 @@ class DecommissionAction(DeviceActionAPI):
         expected_status: str = CertificateStatus.generated.value,
         expected_reachability=Reachability.UNREACHABLE.value,
     ):
-        def check_status(action_data):
-            return not action_data.vedgeCertificateState == expected_status
-
-        @retry(
-            wait=wait_fixed(sleep_seconds),
-            stop=stop_after_attempt(int(timeout_seconds / sleep_seconds)),
-            retry=retry_if_result(check_status),
-        )
-        def wait_for_status():
+        def get_device() -> Optional[Device]:
             status = DevicesAPI(self.session).get_device_details(self.dev.uuid)
             if status.reachability.value == expected_reachability:
                 return status
-            else:
-                return None
-
-        wait_for_status()
+            return None
+
+        wait_until(
+            get_device,
+            until=lambda device: device is not None and device.vedgeCertificateState == expected_status,
+            timeout=timeout_seconds,
+            backoff=Backoff.from_interval(sleep_seconds),
+        ).value_or_raise(f"Decommission of {self.dev.hostname} not completed")
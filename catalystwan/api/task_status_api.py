@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 from tenacity import retry, retry_if_result, stop_after_attempt, wait_fixed  # type: ignore
 
@@ -23,6 +30,47 @@ from catalystwan.utils.operation_status import OperationStatus, OperationStatusI
 logger = logging.getLogger(__name__)
 
 
+def check_validation_status(task: TaskData) -> None:
+    """Raises TaskValidationError when task validation failed"""
+    if not task.validation:
+        return None
+    if task.validation.status in (OperationStatus.FAILURE, OperationStatus.VALIDATION_FAILURE):
+        raise TaskValidationError(f"Task status validation failed, validation status is: {task.validation.status}")
+
+
+class TaskStatusCriteria:
+    """Statuses and status IDs which mark sub-tasks as completed with success or failure"""
+
+    def __init__(
+        self,
+        success_statuses: List[OperationStatus] = [OperationStatus.SUCCESS],
+        failure_statuses: List[OperationStatus] = [OperationStatus.FAILURE],
+        success_statuses_ids: List[OperationStatusId] = [OperationStatusId.SUCCESS],
+        failure_statuses_ids: List[OperationStatusId] = [OperationStatusId.FAILURE],
+    ):
+        self.success_statuses = [cast(OperationStatus, exit_status.value) for exit_status in success_statuses]
+        self.failure_statuses = [cast(OperationStatus, exit_status.value) for exit_status in failure_statuses]
+        self.success_statuses_ids = [
+            cast(OperationStatusId, exit_status_id.value) for exit_status_id in success_statuses_ids
+        ]
+        self.failure_statuses_ids = [
+            cast(OperationStatusId, exit_status_id.value) for exit_status_id in failure_statuses_ids
+        ]
+
+    def is_completed(self, task_data: List[SubTaskData]) -> bool:
+        """All sub-tasks have success or failure status (or all have success or failure status ID)"""
+        if not task_data:
+            return False
+        completed_statuses = self.success_statuses + self.failure_statuses
+        completed_statuses_ids = self.success_statuses_ids + self.failure_statuses_ids
+        return all(task.status in completed_statuses for task in task_data) or all(
+            task.status_id in completed_statuses_ids for task in task_data
+        )
+
+    def is_success(self, task_data: List[SubTaskData]) -> bool:
+        return all([sub_task.status in self.success_statuses for sub_task in task_data])
+
+
 class Task:
     """
     API class for getting data about task/sub-tasks
@@ -35,10 +83,7 @@ class Task:
         self.task_data: List[SubTaskData]
 
     def __check_validation_status(self, task: TaskData):
-        if not task.validation:
-            return None
-        if task.validation.status in (OperationStatus.FAILURE, OperationStatus.VALIDATION_FAILURE):
-            raise TaskValidationError(f"Task status validation failed, validation status is: {task.validation.status}")
+        check_validation_status(task)
 
     def wait_for_completed(
         self,
@@ -93,14 +138,7 @@ class Task:
             TaskResult(): result attr is True if all subtasks are success
              or is False if at least one is failed
         """
-        success_statuses = [cast(OperationStatus, exit_status.value) for exit_status in success_statuses]
-        failure_statuses = [cast(OperationStatus, exit_status.value) for exit_status in failure_statuses]
-        success_statuses_ids = [
-            cast(OperationStatusId, exit_status_id.value) for exit_status_id in success_statuses_ids
-        ]
-        failure_statuses_ids = [
-            cast(OperationStatusId, exit_status_id.value) for exit_status_id in failure_statuses_ids
-        ]
+        criteria = TaskStatusCriteria(success_statuses, failure_statuses, success_statuses_ids, failure_statuses_ids)
 
         def check_status(task_data: List[SubTaskData]) -> bool:
             """
@@ -113,22 +151,7 @@ class Task:
             Returns:
                 bool: False if condition is met
             """
-            if not task_data:
-                return True
-            task_statuses_success = [task.status in success_statuses for task in task_data]
-            task_statuses_failure = [task.status in failure_statuses for task in task_data]
-            task_statuses_id_success = [task.status_id in success_statuses_ids for task in task_data]
-            task_statuses_id_failure = [task.status_id in failure_statuses_ids for task in task_data]
-
-            all_subtasks_completed_status: List[bool] = [
-                any(task_status) for task_status in zip(task_statuses_success, task_statuses_failure)
-            ]
-            all_subtasks_completed_status_id: List[bool] = [
-                any(task_status_id) for task_status_id in zip(task_statuses_id_success, task_statuses_id_failure)
-            ]
-            if all(all_subtasks_completed_status) or all(all_subtasks_completed_status_id):
-                return False
-            return True
+            return not criteria.is_completed(task_data)
 
         def log_exception(self) -> None:
             logger.error("Operation status not achieved in given time")
@@ -160,9 +183,205 @@ class Task:
             return self.task_data
 
         wait_for_action_finish()
-        result = all([sub_task.status in success_statuses for sub_task in self.task_data])
+        result = criteria.is_success(self.task_data)
         if result:
             logger.info("Task polling finished, because all subtasks successfully finished.")
         else:
             logger.info("Task polling finished, because at least one subtask failed or task is timeout.")
-        return TaskResult(result=result, sub_tasks_data=self.task_data)
+        return TaskResult(result=result, sub_tasks_data=self.task_data, task_id=self.task_id)
+
+
+@dataclass
+class _WatchedTask:
+    task_id: str
+    future: Future
+    deadline: float
+    interval: float
+    statuses: List[Tuple[str, str]] = field(default_factory=list)
+    task_data: List[SubTaskData] = field(default_factory=list)
+
+
+class TaskWatcher:
+    """Tracks completion of many tasks, polling their statuses from single scheduler.
+
+    Each task is polled first time immediately, then with interval growing from min_interval to max_interval
+    while sub-task statuses do not change (interval is reset when they change), so short tasks complete fast
+    and long-running tasks (eg. upgrades) are polled rarely. Watching the same task ID again returns the same future.
+    Polls are sent by at most max_workers threads.
+
+    Example:
+        >>> with TaskWatcher(session) as watcher:
+        >>>     for task_id in task_ids:
+        >>>         watcher.watch(task_id, callback=lambda result: print(result.task_id, result.result))
+        >>>     for result in watcher.as_completed():
+        >>>         print(result.task_id, result.result)
+
+    Args:
+        session: session used to poll task statuses
+        timeout_seconds: default time after which task is completed with failed result (as in Task.wait_for_completed)
+        min_interval: seconds between first polls of task
+        max_interval: maximum seconds between polls of long-running task
+        backoff: interval multiplier applied after poll without sub-task status change
+        max_workers: maximum number of polls sent at the same time
+        criteria: sub-task statuses considered completed and successful
+    """
+
+    def __init__(
+        self,
+        session: ManagerSession,
+        timeout_seconds: float = 300,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        max_workers: int = 4,
+        criteria: Optional[TaskStatusCriteria] = None,
+    ):
+        self.session = session
+        self.timeout_seconds = timeout_seconds
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.criteria = criteria or TaskStatusCriteria()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="catalystwan-task-watcher")
+        self._tasks: Dict[str, _WatchedTask] = {}
+        self._queue: List[Tuple[float, int, _WatchedTask]] = []
+        self._sequence = count()
+        self._condition = Condition()
+        self._scheduler: Optional[Thread] = None
+        self._closed = False
+
+    def watch(
+        self,
+        task_id: str,
+        timeout_seconds: Optional[float] = None,
+        callback: Optional[Callable[[TaskResult], None]] = None,
+    ) -> Future:
+        """Starts tracking given task (or returns future of task already tracked)
+
+        Args:
+            task_id: ID of task (eg. returned by template attach or software action)
+            timeout_seconds: overrides default timeout of the watcher
+            callback: called with TaskResult when task is completed (not called when polling failed)
+
+        Returns:
+            Future: completed with TaskResult, or with exception raised by polling (eg. TaskValidationError)
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("TaskWatcher is closed")
+            if (task := self._tasks.get(task_id)) is None:
+                deadline = monotonic() + (self.timeout_seconds if timeout_seconds is None else timeout_seconds)
+                task = self._tasks[task_id] = _WatchedTask(task_id, Future(), deadline, self.min_interval)
+                self._schedule(task, monotonic())
+            if self._scheduler is None:
+                self._scheduler = Thread(target=self._run, name="catalystwan-task-scheduler", daemon=True)
+                self._scheduler.start()
+        if callback is not None:
+            task.future.add_done_callback(lambda future: self._notify(future, callback))
+        return task.future
+
+    def watch_many(self, task_ids: Iterable[str], timeout_seconds: Optional[float] = None) -> List[Future]:
+        return [self.watch(task_id, timeout_seconds) for task_id in task_ids]
+
+    def as_completed(
+        self, task_ids: Optional[Iterable[str]] = None, timeout: Optional[float] = None
+    ) -> Iterator[TaskResult]:
+        """Yields results of given tasks (all watched tasks by default) in order of completion
+
+        Raises:
+            Exception: exception raised by polling of task
+            TimeoutError: results are not available within given timeout
+        """
+        if task_ids is None:
+            with self._condition:
+                futures = [task.future for task in self._tasks.values()]
+        else:
+            futures = self.watch_many(task_ids)
+        for future in futures_as_completed(futures, timeout):
+            yield future.result()
+
+    def wait(self, task_ids: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> List[TaskResult]:
+        """Waits for given tasks (all watched tasks by default) and returns results in order of completion"""
+        return list(self.as_completed(task_ids, timeout))
+
+    @staticmethod
+    def _notify(future: Future, callback: Callable[[TaskResult], None]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            callback(future.result())
+
+    def _schedule(self, task: _WatchedTask, when: float) -> None:
+        heappush(self._queue, (when, next(self._sequence), task))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (not self._queue or self._queue[0][0] > monotonic()):
+                    self._condition.wait(self._queue[0][0] - monotonic() if self._queue else None)
+                if self._closed:
+                    return
+                due = []
+                now = monotonic()
+                while self._queue and self._queue[0][0] <= now:
+                    due.append(heappop(self._queue)[2])
+            for task in due:
+                self._executor.submit(self._poll, task)
+
+    def _poll(self, task: _WatchedTask) -> None:
+        if task.future.cancelled():
+            return
+        try:
+            task_status = ConfigurationDashboardStatus(self.session).find_status(task.task_id)
+            check_validation_status(task_status)
+        except Exception as error:
+            logger.error(f"Polling status of task {task.task_id} failed: {error!r}")
+            self._complete(task, error)
+            return
+        task.task_data = task_status.data
+        if self.criteria.is_completed(task.task_data):
+            self._complete(task, TaskResult(result=self.criteria.is_success(task.task_data), **self._data(task)))
+            return
+        now = monotonic()
+        if now >= task.deadline:
+            logger.error(f"Operation status of task {task.task_id} not achieved in given time")
+            self._complete(task, TaskResult(result=False, **self._data(task)))
+            return
+        statuses = [(sub_task.status, sub_task.status_id) for sub_task in task.task_data]
+        if statuses != task.statuses:
+            task.interval = self.min_interval
+        else:
+            task.interval = min(task.interval * self.backoff, self.max_interval)
+        task.statuses = statuses
+        with self._condition:
+            if not self._closed:
+                self._schedule(task, min(now + task.interval, task.deadline))
+
+    @staticmethod
+    def _data(task: _WatchedTask) -> dict:
+        return {"sub_tasks_data": task.task_data, "task_id": task.task_id}
+
+    @staticmethod
+    def _complete(task: _WatchedTask, outcome: object) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+        if isinstance(outcome, BaseException):
+            task.future.set_exception(outcome)
+        else:
+            task.future.set_result(outcome)
+
+    def close(self) -> None:
+        """Stops polling, futures of tasks not completed yet are cancelled"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._scheduler is not None:
+            self._scheduler.join()
+        self._executor.shutdown(wait=True)
+        for task in self._tasks.values():
+            task.future.cancel()
+
+    def __enter__(self) -> TaskWatcher:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
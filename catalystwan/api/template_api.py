@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import Future, as_completed
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional, Type, overload
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Mapping, Optional, Sequence, Type, overload
 
 from ciscoconfparse import CiscoConfParse  # type: ignore
 
-from catalystwan.api.task_status_api import Task
+from catalystwan.api.task_status_api import Task, TaskWatcher
 from catalystwan.api.templates.cli_template import CLITemplate
 from catalystwan.api.templates.device_template.device_template import (
     DeviceSpecificValue,
@@ -40,7 +41,9 @@ from catalystwan.api.templates.models.system_vsmart_model import SystemVsmart
 from catalystwan.dataclasses import Device, DeviceTemplateInfo, FeatureTemplateInfo, FeatureTemplatesTypes, TemplateInfo
 from catalystwan.endpoints.configuration_device_template import FeatureToCLIPayload
 from catalystwan.exceptions import AttachedError, TemplateNotFoundError
+from catalystwan.fan_out import chunks
 from catalystwan.response import ManagerResponse
+from catalystwan.response_cache import CachePolicy, cached_get
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.device_model import DeviceModel
 from catalystwan.utils.dict import merge
@@ -52,6 +55,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# feature template types change only with vManage upgrade, they are checked for each feature template created
+FEATURE_TEMPLATE_TYPES_CACHE = CachePolicy(ttl=3600)
+
+# devices attached with single request by attach_many, keeps payloads and created tasks within vManage limits
+ATTACH_CHUNK_SIZE: Final[int] = 200
+
 
 class DeviceModelError(Exception):
     """Used when unsupported device model used in template."""
@@ -105,7 +114,11 @@ class TemplatesAPI:
     ) -> DataSequence[FeatureTemplateInfo]:
         """In a multitenant vManage system, this API is only available in the Provider view."""
         endpoint = "/dataservice/template/feature"
-        params = {"summary": summary}
+        params: Dict[str, Any] = {"summary": summary}
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
 
         fr_templates = self.session.get(url=endpoint, params=params)
 
@@ -122,20 +135,22 @@ class TemplatesAPI:
         return templates.dataseq(DeviceTemplateInfo)
 
     def attach(self, name: str, device: Device, timeout_seconds: int = 300, **kwargs):
-        template_type = self.get(DeviceTemplate).filter(name=name).single_or_default().config_type
-        if template_type == TemplateType.CLI:
+        template = self.get(DeviceTemplate).filter(name=name).single_or_default()
+        if template is None:
+            raise TemplateNotFoundError(name)
+        if template.config_type == TemplateType.CLI:
             return self._attach_cli(name, device, timeout_seconds=timeout_seconds, **kwargs)
 
-        if template_type == TemplateType.FEATURE:
-            return self._attach_feature(name, device, timeout_seconds=timeout_seconds, **kwargs)
+        if template.config_type == TemplateType.FEATURE:
+            return self._attach_feature(template, device, timeout_seconds=timeout_seconds, **kwargs)
 
         raise NotImplementedError()
 
-    def _attach_feature(self, name: str, device: Device, timeout_seconds: int = 300, **kwargs):
+    def _attach_feature(self, template: DeviceTemplateInfo, device: Device, timeout_seconds: int = 300, **kwargs):
         """Attach Device Template created with Feature Templates.
 
         Args:
-            name: Name of the Device Template to be attached.
+            template: Device Template to be attached.
             device: Device object under which the template should be attached.
             **device_specific_vars: For parameters in a feature template that you configure as device-specific,
                 when you attach a device template to a device, Cisco vManage prompts you for the values to use
@@ -143,50 +158,22 @@ class TemplatesAPI:
                 or if you are deploying a small network. This method generally does not scale well for larger networks.
         """
 
-        def get_device_specific_variables(name: str):
-            endpoint = "/dataservice/template/device/config/exportcsv"
-            template_id = self.get(DeviceTemplate).filter(name=name).single_or_default().id
-            body = {
-                "templateId": template_id,
-                "isEdited": False,
-                "isMasterEdited": False,
-            }
-
-            values = self.session.post(endpoint, json=body).json()["header"]["columns"]
-            return [DeviceSpecificValue(**value) for value in values]
-
-        vars = get_device_specific_variables(name)
-        template_id = self.get(DeviceTemplate).filter(name=name).single_or_default().id
+        name = template.name
+        template_id = template.id
+        device_variables = self._get_device_specific_variables(template_id)
         payload = {
             "deviceTemplateList": [
                 {
                     "templateId": template_id,
                     "device": [
-                        {
-                            "csv-status": "complete",
-                            "csv-deviceId": device.uuid,
-                            "csv-deviceIP": device.id,
-                            "csv-host-name": device.hostname,
-                            "csv-templateId": template_id,
-                        }
+                        self._device_attach_values(
+                            template_id, device, device_variables, kwargs.get("device_specific_vars", {})
+                        )
                     ],
                 }
             ]
         }
 
-        invalid = False
-        for var in vars:
-            if var.property not in payload["deviceTemplateList"][0]["device"][0]:
-                pointer = payload["deviceTemplateList"][0]["device"][0]
-                if var.property not in kwargs["device_specific_vars"]:
-                    invalid = True
-                    logger.error(f"{var.property} should be provided in attach method as device_specific_vars kwarg.")
-                else:
-                    pointer[var.property] = kwargs["device_specific_vars"][var.property]  # type: ignore
-
-        if invalid:
-            raise TypeError()
-
         endpoint = "/dataservice/template/device/config/attachfeature"
         logger.info(f"Attaching a template: {name} to the device: {device.hostname}.")
         response = self.session.post(url=endpoint, json=payload).json()
@@ -197,6 +184,136 @@ class TemplatesAPI:
         logger.warning(f"Task activity information: {task.sub_tasks_data[0].activity}")
         return False
 
+    def attach_many(
+        self,
+        name: str,
+        devices: Sequence[Device],
+        variables_by_device: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        timeout_seconds: int = 300,
+        chunk_size: int = ATTACH_CHUNK_SIZE,
+    ) -> Dict[str, bool]:
+        """Attach Device Template created with Feature Templates to many devices.
+
+        Template and its device-specific variables are resolved once, devices are attached with one request
+        per chunk_size devices and created tasks are tracked together.
+        CLI Device Template is attached to each device in turn (see attach).
+
+        Args:
+            name: Name of the Device Template to be attached.
+            devices: Devices under which the template should be attached.
+            variables_by_device: Values of device-specific variables (see attach) by device UUID.
+            timeout_seconds: Time to wait for completion of attach tasks.
+            chunk_size: Maximum number of devices attached in single request.
+
+        Returns:
+            Dict[str, bool]: attach result by device UUID, devices of chunk which could not be submitted
+                or whose task status could not be polled are reported as failed (errors are logged)
+
+        Raises:
+            TemplateNotFoundError: when Device Template with given name does not exist
+            TypeError: when values of device-specific variables are missing
+            NotImplementedError: when Device Template is neither feature nor CLI template
+        """
+        template = self.get(DeviceTemplate).filter(name=name).single_or_default()
+        if template is None:
+            raise TemplateNotFoundError(name)
+        if template.config_type == TemplateType.CLI:
+            return {device.uuid: self._attach_cli(name, device, timeout_seconds=timeout_seconds) for device in devices}
+        if template.config_type != TemplateType.FEATURE:
+            raise NotImplementedError()
+
+        variables = variables_by_device or {}
+        columns = self._get_device_specific_variables(template.id)
+        attach_values = [
+            (device, self._device_attach_values(template.id, device, columns, variables.get(device.uuid, {})))
+            for device in devices
+        ]
+
+        results: Dict[str, bool] = {}
+        endpoint = "/dataservice/template/device/config/attachfeature"
+        with TaskWatcher(self.session, timeout_seconds=timeout_seconds) as watcher:
+            futures: Dict[Future, List[Device]] = {}
+            submitted: List[str] = []
+            for chunk in chunks(attach_values, chunk_size):
+                chunk_devices = [device for device, _ in chunk]
+                payload = {
+                    "deviceTemplateList": [{"templateId": template.id, "device": [values for _, values in chunk]}]
+                }
+                logger.info(f"Attaching a template: {name} to {len(chunk)} devices.")
+                try:
+                    task_id = self.session.post(url=endpoint, json=payload).json()["id"]
+                except Exception as error:
+                    # chunks already submitted are attached by server, their tasks are still tracked
+                    logger.error(
+                        f"Failed to attach template: {name} to the devices: {[d.hostname for d in chunk_devices]} "
+                        f"({error!r}), attach tasks already submitted: {submitted}"
+                    )
+                    results.update({device.uuid: False for device in chunk_devices})
+                    continue
+                submitted.append(task_id)
+                futures[watcher.watch(task_id)] = chunk_devices
+            for future in as_completed(futures):
+                try:
+                    task = future.result()
+                except Exception as error:
+                    hostnames = [device.hostname for device in futures[future]]
+                    logger.error(f"Failed to get status of attaching template: {name} to {hostnames} ({error!r}).")
+                    results.update({device.uuid: False for device in futures[future]})
+                    continue
+                sub_tasks = {sub_task.uuid: sub_task for sub_task in task.sub_tasks_data}
+                for device in futures[future]:
+                    sub_task = sub_tasks.get(device.uuid)
+                    results[device.uuid] = watcher.criteria.is_success([sub_task]) if sub_task else task.result
+                    if not results[device.uuid]:
+                        activity = sub_task.activity if sub_task else None
+                        logger.warning(f"Failed to attach tempate: {name} to the device: {device.hostname}.")
+                        logger.warning(f"Task activity information: {activity}")
+        return {device.uuid: results[device.uuid] for device in devices}
+
+    def _get_device_specific_variables(self, template_id: str) -> List[DeviceSpecificValue]:
+        endpoint = "/dataservice/template/device/config/exportcsv"
+        body = {
+            "templateId": template_id,
+            "isEdited": False,
+            "isMasterEdited": False,
+        }
+
+        values = self.session.post(endpoint, json=body).json()["header"]["columns"]
+        return [DeviceSpecificValue(**value) for value in values]
+
+    @staticmethod
+    def _device_attach_values(
+        template_id: str,
+        device: Device,
+        device_variables: List[DeviceSpecificValue],
+        device_specific_vars: Mapping[str, Any],
+    ) -> Dict[str, Any]:
+        """Builds device entry of attach payload with values of device-specific variables.
+
+        Raises:
+            TypeError: when values of device-specific variables are missing
+        """
+        values: Dict[str, Any] = {
+            "csv-status": "complete",
+            "csv-deviceId": device.uuid,
+            "csv-deviceIP": device.id,
+            "csv-host-name": device.hostname,
+            "csv-templateId": template_id,
+        }
+        missing = []
+        for var in device_variables:
+            if var.property in values:
+                continue
+            if var.property not in device_specific_vars:
+                missing.append(var.property)
+                logger.error(f"{var.property} should be provided in attach method as device_specific_vars kwarg.")
+            else:
+                values[var.property] = device_specific_vars[var.property]
+
+        if missing:
+            raise TypeError(f"Missing device specific variables for {device.hostname}: {missing}")
+        return values
+
     def _attach_cli(self, name: str, device: Device, is_edited: bool = False, timeout_seconds: int = 300) -> bool:
         """
 
@@ -482,6 +599,7 @@ class TemplatesAPI:
                 return general_template
 
         fr_templates = self.get(FeatureTemplate)  # type: ignore
+        fr_templates.index_by("name")  # filter by name is called for every (sub)template
         device_template.general_templates = list(
             map(lambda x: parse_general_template(x, fr_templates), device_template.general_templates)  # type: ignore
         )
@@ -616,7 +734,7 @@ class TemplatesAPI:
 
         endpoint = "/dataservice/template/feature/types"
         params = {"type": type}
-        response = self.session.get(endpoint, params=params)
+        response = cached_get(self.session, endpoint, FEATURE_TEMPLATE_TYPES_CACHE, params=params)
 
         return response.dataseq(FeatureTemplatesTypes)
 
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Union, cast
 
 from jinja2 import DebugUndefined, Environment, FileSystemLoader, meta  # type: ignore
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from catalystwan.api.templates.device_variable import DeviceVariable
 from catalystwan.utils.device_model import DeviceModel
@@ -21,6 +21,8 @@ if TYPE_CHECKING:
 
 
 class FeatureTemplateValidator(BaseModel, ABC):
+    model_config = ConfigDict(defer_build=True)  # schemas of feature template models are built on first use
+
     @model_validator(mode="before")
     @classmethod
     def map_fields(cls, values: Union[Any, Dict[str, Union[List[FlattenedDictValue], Any]]]):
@@ -35,6 +35,8 @@ class TenantModel(FeatureTemplate):
     def generate_payload(self, session: ManagerSession) -> str:
         tenant_infos = session.endpoints.tenant_management.get_all_tenants()
         tier_infos = session.endpoints.monitoring_device_details.get_tiers()
+        tenant_infos.index_by("org_name")
+        tier_infos.index_by("name")
 
         for tenant in self.tenants:
             tenant.tier_info = tier_infos.filter(name=tenant.tier_name).single_or_default()
@@ -6,6 +6,7 @@ import logging
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote
 
 from packaging.version import Version  # type: ignore
 
@@ -67,11 +68,9 @@ class TenantMigrationAPI:
 
         Args:
             download_path (Path): full download path containing a filename eg.: Path("/home/user/tenant-export.tar.gz")
-            remote_filename (str): path to exported tenant migration file on vManage
+            remote_filename (str): path to exported tenant migration file on vManage (it is URL-quoted)
         """
-        tenant_data = self.session.endpoints.tenant_migration.download_tenant_data(remote_filename)
-        with open(download_path, "wb") as file:
-            file.write(tenant_data)
+        self.session.endpoints.tenant_migration.download_tenant_data_to_file(download_path, quote(remote_filename))
 
     def import_tenant(self, import_file: Path, migration_key: Optional[str] = None) -> ImportTask:
         """Imports the deployment and configuration data into multi-tenant vManage instance.
@@ -0,0 +1,648 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextvars import ContextVar
+from inspect import isawaitable
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, ClassVar, Dict, Optional, Union
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from packaging.version import Version  # type: ignore
+from requests import PreparedRequest, Request, Response
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError, RequestException, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from catalystwan import USER_AGENT
+from catalystwan.abstractions import AsyncAPIEndpointClient
+from catalystwan.endpoints import current_retry_policy
+from catalystwan.endpoints.client import AboutInfo, AsyncClient, ServerInfo
+from catalystwan.exceptions import (
+    DefaultPasswordError,
+    ManagerHTTPError,
+    ManagerReadyTimeout,
+    ManagerRequestException,
+    SessionNotCreatedError,
+    TenantSubdomainNotFound,
+)
+from catalystwan.json_codec import JsonCodec, encode_json_kwarg
+from catalystwan.metrics import MetricsRegistry
+from catalystwan.models.tenant import Tenant
+from catalystwan.rate_limit import RequestLimiter
+from catalystwan.response import ManagerResponse, RequestTrace, response_history_debug
+from catalystwan.response_cache import ResponseCache
+from catalystwan.retry import RetryPolicy
+from catalystwan.session import ManagerSessionState, UserMode, create_base_url, determine_session_type
+from catalystwan.utils.session_type import SessionType
+from catalystwan.version import NullVersion, parse_api_version
+from catalystwan.vmanage_auth import UnauthorizedAccessError
+
+# marks coroutines executed as part of login, so they do not trigger relogin themselves
+_login_in_progress: ContextVar[bool] = ContextVar("_login_in_progress", default=False)
+
+
+def to_manager_response(response: httpx.Response, json_codec: Optional[JsonCodec] = None) -> ManagerResponse:
+    """Converts received httpx.Response to ManagerResponse,
+    so response processing (parsing, error info, expired JSESSIONID detection) is common for all sessions.
+
+    Args:
+        response: httpx.Response with already read content
+        json_codec: decodes JSON body of converted response (requests stdlib decoding when None)
+
+    Returns:
+        ManagerResponse
+    """
+    prepared_request = PreparedRequest()
+    prepared_request.method = response.request.method
+    prepared_request.url = str(response.request.url)
+    prepared_request.headers = CaseInsensitiveDict(response.request.headers.items())
+    try:
+        prepared_request.body = response.request.content
+    except httpx.RequestNotRead:
+        prepared_request.body = None
+    converted = Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.headers = CaseInsensitiveDict(response.headers.items())
+    try:
+        converted._content = response.content
+    except httpx.ResponseNotRead:
+        converted._content = b""  # body was streamed to file
+    converted.encoding = response.encoding
+    converted.url = str(response.url)
+    try:
+        converted.elapsed = response.elapsed
+    except RuntimeError:
+        pass  # response stream not closed by transport, elapsed time is unknown
+    converted.request = prepared_request
+    converted.history = [to_manager_response(item) for item in response.history]
+    return ManagerResponse(converted, json_codec)
+
+
+def to_request_exception(error: httpx.TransportError) -> RequestException:
+    """Converts httpx transport error to equivalent requests exception,
+    so retry policies (defined with requests exception types) are common for all sessions.
+    """
+    converted: RequestException
+    if isinstance(error, httpx.ConnectTimeout):
+        converted = ConnectTimeout(str(error))
+    elif isinstance(error, httpx.TimeoutException):
+        converted = Timeout(str(error))
+    elif isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        converted = ConnectionError(str(error))
+    else:
+        converted = RequestException(str(error))
+    converted.__cause__ = error
+    return converted
+
+
+async def create_async_manager_session(
+    url: str,
+    username: str,
+    password: str,
+    port: Optional[int] = None,
+    subdomain: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+    limiter: Optional[RequestLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    json_codec: Optional[JsonCodec] = None,
+) -> AsyncManagerSession:
+    """Factory coroutine that creates asynchronous session object and performs login according to parameters
+
+    Args:
+        url (str): IP address or domain name
+        username (str): username
+        password (str): password
+        port (int): port
+        subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
+            works only on provider user mode
+        logger: override default module logger
+        limiter: client-side request limiter (eg. TokenBucket, AdaptiveConcurrency), can be shared with other sessions
+        retry_policy: retry policy for requests without policy defined by endpoint decorator or APIEndpoints class
+        json_codec: JSON codec for request payloads and responses (eg. OrjsonCodec), defaults to standard library json
+
+    Returns:
+        AsyncManagerSession: logged-in and operative session to perform tasks on SDWAN Manager.
+    """
+    session = AsyncManagerSession(
+        url=url,
+        username=username,
+        password=password,
+        port=port,
+        subdomain=subdomain,
+        limiter=limiter,
+        retry_policy=retry_policy,
+        json_codec=json_codec,
+    )
+
+    if logger:
+        session.logger = logger
+
+    await session.change_state(ManagerSessionState.LOGIN)
+    if isawaitable(result := session.on_session_create_hook()):
+        await result
+    return session
+
+
+class AsyncManagerSession(AsyncAPIEndpointClient):
+    """Asynchronous API session for vManage client (requires optional 'httpx' dependency).
+
+    Provides the same login, relogin and restart handling as ManagerSession but all requests are coroutines,
+    so many requests can be awaited concurrently from one event loop over shared connection pool.
+
+    Args:
+        url: IP address or domain name, i.e. '10.0.1.200' or 'example.com'
+        username: username
+        password: password
+        verify: controls whether we verify the server's TLS certificate
+        port: port
+        subdomain: subdomain specifying to which view switch when creating provider as a tenant session
+        max_connections: maximum number of concurrent connections opened to server
+        timeout: requests timeout in seconds, defaults to None (no timeout)
+        transport: custom httpx transport
+        limiter: client-side request limiter (eg. TokenBucket, AdaptiveConcurrency), can be shared with other sessions,
+            its blocking acquire is awaited in executor thread
+        retry_policy: retry policy for requests without policy defined by endpoint decorator or APIEndpoints class
+        json_codec: JSON codec for request payloads and responses (eg. OrjsonCodec), defaults to standard library json
+
+    Attributes:
+        enable_relogin (bool): defaults to True, in case that session is not properly logged-in, session will try to
+            relogin and try the same request again
+        request_tracer (Optional[Callable[[RequestTrace], Any]]): called with RequestTrace record of each request
+        metrics (Optional[MetricsRegistry]): when set, requests are aggregated into per-endpoint metrics
+        response_cache (Optional[ResponseCache]): when set, responses of endpoints with CachePolicy are cached
+
+    Example usage:
+        async with await create_async_manager_session(url, username, password) as session:
+            peers = await asyncio.gather(
+                *[session.get_data(f"/dataservice/device/omp/peers?deviceId={id}") for id in device_ids]
+            )
+    """
+
+    on_session_create_hook: ClassVar[Callable[[AsyncManagerSession], Any]] = lambda *args: None
+
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        verify: bool = False,
+        port: Optional[int] = None,
+        subdomain: Optional[str] = None,
+        max_connections: int = 100,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limiter: Optional[RequestLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
+        self.url = url
+        self.port = port
+        self.base_url = create_base_url(url, port)
+        self.username = username
+        self.password = password
+        self.subdomain = subdomain
+        self.verify = verify
+        self._session_type = SessionType.NOT_DEFINED
+        self.server_name: Optional[str] = None
+        self.logger = logging.getLogger(__name__)
+        self.enable_relogin: bool = True
+        self.response_trace: Callable[
+            [Optional[Response], Union[Request, PreparedRequest, None]], str
+        ] = response_history_debug
+        self.request_tracer: Optional[Callable[[RequestTrace], Any]] = None
+        self.metrics: Optional[MetricsRegistry] = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.json_codec = json_codec
+        self.http_client = httpx.AsyncClient(
+            verify=verify,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            follow_redirects=True,
+            transport=transport,
+        )
+        self.client_endpoints = AsyncClient(self)
+        self._platform_version: str = ""
+        self._api_version: Version = NullVersion()
+        self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._login_generation: int = 0
+        self.restart_timeout: int = 1200
+        self.polling_requests_timeout: int = 10
+
+    @property
+    def state(self) -> ManagerSessionState:
+        return self._state
+
+    async def change_state(self, state: ManagerSessionState) -> None:
+        """Resets the session to given state and manages transition to desired OPERATIONAL state"""
+        self._state = state
+        self.logger.debug(f"Session entered state: {self.state.name}")
+
+        if state == ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART:
+            await self.wait_server_ready(self.restart_timeout)
+            await self.change_state(ManagerSessionState.LOGIN)
+        elif state == ManagerSessionState.LOGIN:
+            await self.login()
+            await self.change_state(ManagerSessionState.OPERATIVE)
+
+    def restart_imminent(self, restart_timeout_override: Optional[int] = None):
+        """Notify session that restart is imminent.
+        ConnectionError and status code 503 will cause session to wait for connectivity and perform login again
+
+        Args:
+            restart_timeout_override (Optional[int], optional): override session property which controls restart timeout
+        """
+        if restart_timeout_override is not None:
+            self.restart_timeout = restart_timeout_override
+        self._state = ManagerSessionState.RESTART_IMMINENT
+        self.logger.debug(f"Session entered state: {self.state.name}")
+
+    async def login(self) -> AsyncManagerSession:
+        """Performs login to SDWAN Manager and fetches important server info to instance variables
+
+        Raises:
+            SessionNotCreatedError: indicates session configuration is not consistent
+
+        Returns:
+            AsyncManagerSession: (self)
+        """
+        token = _login_in_progress.set(True)
+        try:
+            await self._authenticate()
+            if self.subdomain:
+                tenant_id = await self.get_tenant_id()
+                vsession_id = await self.get_virtual_session_id(tenant_id)
+                self.http_client.headers.update({"VSessionId": vsession_id})
+            try:
+                server_info = await self.server()
+            except DefaultPasswordError:
+                server_info = ServerInfo.parse_obj({})
+        finally:
+            _login_in_progress.reset(token)
+
+        self.server_name = server_info.server
+
+        tenancy_mode = server_info.tenancy_mode
+        user_mode = server_info.user_mode
+        view_mode = server_info.view_mode
+
+        self._session_type = determine_session_type(tenancy_mode, user_mode, view_mode)
+        if user_mode is UserMode.TENANT and self.subdomain:
+            raise SessionNotCreatedError(
+                f"Session not created. Subdomain {self.subdomain} passed to tenant session, "
+                "cannot switch to tenant from tenant user mode."
+            )
+        elif self._session_type is SessionType.NOT_DEFINED:
+            self.logger.warning(
+                "Cannot determine session type for "
+                f"tenancy-mode: {tenancy_mode}, user-mode: {user_mode}, view-mode: {view_mode}"
+            )
+
+        self.logger.info(
+            f"Logged to vManage({self.platform_version}) as {self.username}. The session type is {self.session_type}"
+        )
+        self._login_generation += 1
+        return self
+
+    async def _authenticate(self) -> None:
+        """Obtains JSESSIONID cookie and XSRF token, both are stored in http client and sent with each request"""
+        self.http_client.cookies.clear()
+        self.http_client.headers.pop("x-xsrf-token", None)
+        security_payload = {
+            "j_username": self.username,
+            "j_password": self.password,
+        }
+        response = await self.http_client.post(
+            self.get_full_url("/j_security_check"),
+            data=security_payload,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        self.logger.debug(f"Authenticating: {self.username} POST {response.url} <{response.status_code}>")
+        if response.text != "":
+            raise UnauthorizedAccessError(self.username, self.password)
+        response = await self.http_client.get(
+            self.get_full_url("/dataservice/client/token"), headers={"Content-Type": "application/json"}
+        )
+        self.logger.debug(f"Authenticating: {self.username} GET {response.url} <{response.status_code}>")
+        self.http_client.headers.update({"x-xsrf-token": response.text})
+
+    async def _relogin(self, generation: int) -> None:
+        """Performs single login for all coroutines which detected expired session with the same login generation"""
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if generation == self._login_generation:
+                await self.change_state(ManagerSessionState.LOGIN)
+
+    async def wait_server_ready(self, timeout: int, poll_period: int = 10) -> None:
+        """Waits until server is ready for API requests with given timeout in seconds"""
+
+        begin = monotonic()
+        self.logger.info(f"Waiting for server ready with timeout {timeout} seconds.")
+
+        def elapsed() -> float:
+            return monotonic() - begin
+
+        async with httpx.AsyncClient(
+            verify=self.verify, timeout=self.polling_requests_timeout, headers={"User-Agent": USER_AGENT}
+        ) as client:
+            # wait for http available
+            while elapsed() < timeout:
+                try:
+                    resp = await client.head(self.base_url)
+                    self.logger.debug(f"HEAD {self.base_url} <{resp.status_code}>")
+                    if resp.status_code != 503:
+                        break
+                except httpx.TransportError as error:
+                    self.logger.debug(error)
+                await asyncio.sleep(poll_period)
+
+            # wait server ready flag
+            server_ready_url = self.get_full_url("/dataservice/client/server/ready")
+            while elapsed() < timeout:
+                try:
+                    resp = await client.get(server_ready_url)
+                except httpx.TransportError as exception:
+                    self.logger.debug(exception)
+                    raise ManagerRequestException(str(exception))
+                self.logger.debug(f"GET {server_ready_url} <{resp.status_code}>")
+                if resp.status_code == 200:
+                    if resp.json().get("isServerReady") is True:
+                        self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
+                        return
+                await asyncio.sleep(poll_period)
+
+        raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
+
+    def _trace(self, response: ManagerResponse) -> None:
+        """Passes RequestTrace record to request_tracer and metrics and logs request-response history
+        (only when DEBUG enabled)"""
+        if self.request_tracer is not None or self.metrics is not None:
+            if (record := RequestTrace.create(response, None)) is not None:
+                if self.metrics is not None:
+                    self.metrics.observe(record)
+                if self.request_tracer is not None:
+                    self.request_tracer(record)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self.response_trace(response, None))
+
+    async def _send(self, method: str, url: str, download_to: Optional[Path], **kwargs) -> httpx.Response:
+        """Sends request (streaming successful response body to file when download_to is given),
+        waiting for limiter when configured"""
+        if self.limiter is None:
+            return await self._send_unlimited(method, url, download_to, **kwargs)
+        limiter = self.limiter
+        acquired = asyncio.get_running_loop().run_in_executor(None, limiter.acquire)  # acquire blocks thread
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            acquired.add_done_callback(lambda _: limiter.release(None, None))
+            raise
+        status: Optional[int] = None
+        elapsed: Optional[float] = None
+        try:
+            response = await self._send_unlimited(method, url, download_to, **kwargs)
+            status = response.status_code
+            try:
+                elapsed = response.elapsed.total_seconds()
+            except RuntimeError:
+                pass  # response stream not closed by transport, elapsed time is unknown
+            return response
+        finally:
+            limiter.release(status, elapsed)
+
+    async def _send_unlimited(self, method: str, url: str, download_to: Optional[Path], **kwargs) -> httpx.Response:
+        if download_to is None:
+            return await self.http_client.request(method, url, **kwargs)
+        async with self.http_client.stream(method, url, **kwargs) as response:
+            if response.is_success:
+                with open(download_to, "wb") as file:
+                    async for chunk in response.aiter_bytes():
+                        file.write(chunk)
+            else:
+                await response.aread()  # error info is parsed from body
+        return response
+
+    async def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        return await self._request_with_retries(method, url, None, kwargs)
+
+    async def _request_with_retries(
+        self, method: str, url: str, download_to: Optional[Path], kwargs: Dict[str, Any]
+    ) -> ManagerResponse:
+        """Sends request with retry policy of endpoint (or session), retries are awaited with asyncio.sleep"""
+        policy = current_retry_policy.get() or self.retry_policy
+        if policy is None:
+            return await self._request(method, url, download_to, kwargs)
+        begin = monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await self._request(method, url, download_to, kwargs)
+            except ManagerRequestException as error:
+                if (delay := policy.next_delay(method, attempt, monotonic() - begin, error)) is None:
+                    raise
+                self.logger.warning(f"Request {method} {url} failed ({error}), retrying in {delay:.2f} seconds")
+                if self.metrics is not None:
+                    self.metrics.increment(method, urlparse(self.get_full_url(url)).path, "retries")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _request(
+        self, method: str, url: str, download_to: Optional[Path], kwargs: Dict[str, Any]
+    ) -> ManagerResponse:
+        """Sends single request handling server restart and relogin"""
+        full_url = self.get_full_url(url)
+        generation = self._login_generation
+        try:
+            response = to_manager_response(
+                await self._send(method, full_url, download_to, **self._translate_kwargs(kwargs)), self.json_codec
+            )
+            self._trace(response)
+            if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
+                await self.change_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+        except httpx.TransportError as exception:
+            self.logger.debug(exception)
+            if self.metrics is not None:
+                self.metrics.observe(RequestTrace(method, urlparse(full_url).path, None, None, None, None))
+            if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(
+                exception, (httpx.NetworkError, httpx.RemoteProtocolError)
+            ):
+                await self.change_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+                if self.metrics is not None:
+                    self.metrics.increment(method, urlparse(full_url).path, "retries")
+                return await self._request(method, url, download_to, kwargs)
+            raise ManagerRequestException(str(exception)) from to_request_exception(exception)
+
+        if (
+            self.enable_relogin
+            and response.jsessionid_expired
+            and self.state in (ManagerSessionState.OPERATIVE, ManagerSessionState.LOGIN)
+            and not _login_in_progress.get()
+        ):
+            self.logger.warning("Logging to session. Reason: expired JSESSIONID detected in response headers")
+            if self.metrics is not None:
+                self.metrics.increment(method, urlparse(full_url).path, "relogins")
+            await self._relogin(generation)
+            return await self._request(method, url, download_to, kwargs)
+
+        if response.request.url and "passwordReset.html" in response.request.url:
+            raise DefaultPasswordError("Password must be changed to use this session.")
+
+        try:
+            response.raise_for_status()
+        except HTTPError as error:
+            self.logger.debug(error)
+            error_info = response.get_error_info()
+            raise ManagerHTTPError(error_info=error_info, request=error.request, response=error.response)
+        return response
+
+    def _translate_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Translates requests-like keyword arguments (as used by APIEndpoints) to httpx ones"""
+        _kwargs = dict(kwargs) if self.json_codec is None else encode_json_kwarg(kwargs, self.json_codec)
+        if isinstance(_kwargs.get("data"), (str, bytes)):
+            _kwargs["content"] = _kwargs.pop("data")
+        if "allow_redirects" in _kwargs:
+            _kwargs["follow_redirects"] = _kwargs.pop("allow_redirects")
+        return _kwargs
+
+    async def get(self, url: str, **kwargs) -> ManagerResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> ManagerResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> ManagerResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> ManagerResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    def get_full_url(self, url_path: str) -> str:
+        """Returns base API url plus given url path."""
+        return urljoin(self.base_url, url_path)
+
+    async def about(self) -> AboutInfo:
+        return await self.client_endpoints.about()
+
+    async def server(self) -> ServerInfo:
+        server_info = await self.client_endpoints.server()
+        self.platform_version = server_info.platform_version
+        return server_info
+
+    async def get_data(self, url: str) -> Any:
+        return (await self.get_json(url))["data"]
+
+    async def get_json(self, url: str) -> Any:
+        response = await self.get(url)
+        return response.json()
+
+    async def get_file(self, url: str, filename: Path) -> ManagerResponse:
+        """Get a file streaming its content to disk, without holding whole file in memory.
+        Request is sent with the same relogin, retry and error handling as other requests.
+
+        Args:
+            url: dataservice api.
+            filename: Filename to write download file to.
+
+        Returns:
+            http response (without body, which was written to file)
+        """
+        return await self._request_with_retries("GET", url, Path(filename), {})
+
+    async def get_tenant_id(self) -> str:
+        """Gets tenant UUID for its subdomain.
+
+        Returns:
+            Tenant UUID.
+        """
+        tenants = (await self.get("dataservice/tenant")).dataseq(Tenant)
+        tenant = tenants.filter(subdomain=self.subdomain).single_or_default()
+
+        if not tenant or not tenant.tenant_id:
+            raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {self.subdomain} not found")
+
+        return tenant.tenant_id
+
+    async def get_virtual_session_id(self, tenant_id: str) -> str:
+        """Get VSessionId for a specific tenant
+
+        Note: In a multitenant vManage system, this API is only available in the Provider view.
+
+        Args:
+            tenant_id: provider or tenant UUID
+        Returns:
+            Virtual session token
+        """
+        url_path = f"/dataservice/tenant/{tenant_id}/vsessionid"
+        response = await self.post(url_path)
+        return response.json()["VSessionId"]
+
+    async def logout(self) -> Optional[ManagerResponse]:
+        response = None
+        if isinstance((version := self.api_version), NullVersion):
+            self.logger.warning("Cannot perform logout operation without known api_version.")
+            return response
+        else:
+            # disable automatic relogin before performing logout request
+            _relogin = self.enable_relogin
+            try:
+                self.enable_relogin = False
+                if version >= Version("20.12"):
+                    response = await self.post("/logout")
+                else:
+                    response = await self.get("/logout")
+            finally:
+                # restore original setting after performing logout request
+                self.enable_relogin = _relogin
+        return response
+
+    async def close(self) -> None:
+        """Closes the AsyncManagerSession.
+
+        Firstly it cleans up any resources associated with vManage.
+        Then it closes underlying http client and its connection pool.
+        """
+        try:
+            await self.logout()
+        finally:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> AsyncManagerSession:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session_type(self) -> SessionType:
+        return self._session_type
+
+    @property
+    def platform_version(self) -> str:
+        return self._platform_version
+
+    @platform_version.setter
+    def platform_version(self, version: str):
+        self._platform_version = version
+        self._api_version = parse_api_version(version)
+
+    @property
+    def api_version(self) -> Version:
+        return self._api_version
+
+    def __str__(self) -> str:
+        return f"{self.username}@{self.base_url}"
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}('{self.url}', '{self.username}', '{self.password}', port={self.port}, "
+            f"subdomain='{self.subdomain}')"
+        )
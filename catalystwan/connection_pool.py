@@ -0,0 +1,152 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""HTTP connection pool configuration and statistics for ManagerSession.
+
+By default requests.Session keeps at most 10 connections per host, so any threaded fan-out above that
+opens and discards TLS connections for each request. ManagerHTTPAdapter allows to size the pool
+and counts how connections are used, so the pool can be tuned for given number of concurrent workers.
+"""
+from __future__ import annotations
+
+import socket
+from dataclasses import dataclass, field, fields
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@dataclass
+class PoolConfig:
+    """Connection pool options applied to all connections opened by ManagerSession
+
+    Attributes:
+        pool_connections (int): number of per-host pools to cache
+        pool_maxsize (int): maximum number of connections per host kept in the pool,
+            should be at least equal to number of threads sharing the session
+        pool_block (bool): when True and all connections are in use, request waits for free connection
+            instead of opening new one (which would be discarded afterwards)
+        max_idle_time (Optional[float]): connections idle for longer than given seconds are closed
+            and reopened instead of being reused (avoids reusing connections already dropped by server/proxy)
+        tcp_keepalive (bool): enables TCP keep-alive probes on opened sockets
+        tcp_keepalive_idle (int): idle seconds before first keep-alive probe is sent
+        tcp_keepalive_interval (int): seconds between keep-alive probes
+        tcp_keepalive_count (int): number of failed probes after which connection is considered dead
+    """
+
+    pool_connections: int = DEFAULT_POOLSIZE
+    pool_maxsize: int = DEFAULT_POOLSIZE
+    pool_block: bool = DEFAULT_POOLBLOCK
+    max_idle_time: Optional[float] = None
+    tcp_keepalive: bool = False
+    tcp_keepalive_idle: int = 60
+    tcp_keepalive_interval: int = 10
+    tcp_keepalive_count: int = 6
+
+    def socket_options(self) -> Optional[List[Tuple[int, int, int]]]:
+        """Socket options for urllib3 connections, None keeps urllib3 defaults"""
+        if not self.tcp_keepalive:
+            return None
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        for name, value in (
+            ("TCP_KEEPIDLE", self.tcp_keepalive_idle),
+            ("TCP_KEEPINTVL", self.tcp_keepalive_interval),
+            ("TCP_KEEPCNT", self.tcp_keepalive_count),
+        ):
+            if (option := getattr(socket, name, None)) is not None:
+                options.append((socket.IPPROTO_TCP, option, value))
+        return options
+
+
+@dataclass
+class PoolStats:
+    """Thread-safe counters of connection pool usage
+
+    Attributes:
+        created (int): number of new connections opened
+        reused (int): number of requests sent over already opened connection taken from the pool
+        discarded (int): number of connections closed because pool was full when they were returned
+            (increase PoolConfig.pool_maxsize or set PoolConfig.pool_block when this grows)
+        expired (int): number of pooled connections closed because they exceeded PoolConfig.max_idle_time
+    """
+
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+    expired: int = 0
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.created = self.reused = self.discarded = self.expired = 0
+
+    def asdict(self) -> Dict[str, int]:
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+
+class _PoolStatsMixin:
+    """Collects PoolStats and closes idle connections for urllib3 connection pools"""
+
+    stats: PoolStats
+    max_idle_time: Optional[float]
+
+    def _new_conn(self):
+        conn = super()._new_conn()  # type: ignore
+        self.stats.increment("created")
+        return conn
+
+    def _get_conn(self, timeout: Optional[float] = None):
+        conn = super()._get_conn(timeout)  # type: ignore
+        released_at = getattr(conn, "_catalystwan_released_at", None)
+        if released_at is None:
+            return conn
+        if self.max_idle_time is not None and monotonic() - released_at > self.max_idle_time:
+            conn.close()  # urllib3 reconnects closed connection object on next request
+            self.stats.increment("expired")
+        else:
+            self.stats.increment("reused")
+        conn._catalystwan_released_at = None
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        pool = self.pool  # type: ignore
+        if conn is not None:
+            conn._catalystwan_released_at = monotonic()
+            if pool is not None and pool.full():
+                self.stats.increment("discarded")
+        super()._put_conn(conn)  # type: ignore
+
+
+class ManagerHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter configured with PoolConfig which records usage of its connection pools in PoolStats"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["pool_config", "pool_stats"]
+
+    def __init__(self, config: Optional[PoolConfig] = None, stats: Optional[PoolStats] = None, **kwargs):
+        self.pool_config = config or PoolConfig()
+        self.pool_stats = stats or PoolStats()
+        super().__init__(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            pool_block=self.pool_config.pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = DEFAULT_POOLBLOCK, **pool_kwargs: Any):
+        if (socket_options := self.pool_config.socket_options()) is not None:
+            pool_kwargs.setdefault("socket_options", socket_options)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        namespace = {"stats": self.pool_stats, "max_idle_time": self.pool_config.max_idle_time}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("HTTPConnectionPool", (_PoolStatsMixin, HTTPConnectionPool), namespace),
+            "https": type("HTTPSConnectionPool", (_PoolStatsMixin, HTTPSConnectionPool), namespace),
+        }
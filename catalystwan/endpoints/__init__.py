@@ -27,23 +27,37 @@ Method decorated with @request has no body, as decorator constructs and sends re
 To send request instantiate API with logged ManagerSession:
 >>> api = TenantManagementAPI(session)
 >>> api.delete_tenant_async_bulk(TenantBulkDeleteRequest(password="", tenantIdList=["TNT00005"]))
+
+Endpoints served by asynchronous client (eg. AsyncManagerSession) are defined the same way
+by sub-classing AsyncAPIEndpoints and using awaitable decorators: async_get, async_post, async_put, async_delete.
+>>> class ClientAsync(AsyncAPIEndpoints):
+>>>     @async_get("/client/server", "data")
+>>>     async def server(self) -> ServerInfo:
+>>>         ...
+>>>
+>>> server_info = await ClientAsync(async_session).server()
 """
 from __future__ import annotations
 
-import json
+import collections.abc
 import logging
+from contextvars import ContextVar
 from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
 from inspect import _empty, isclass, signature
 from io import BufferedReader
 from string import Formatter
 from typing import (
     Any,
+    AsyncIterator,
     BinaryIO,
+    Callable,
     ClassVar,
     Dict,
     Final,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -54,6 +68,7 @@ from typing import (
     Tuple,
     TypeVar,
     Union,
+    cast,
     runtime_checkable,
 )
 from uuid import UUID
@@ -61,17 +76,27 @@ from uuid import UUID
 from packaging.specifiers import SpecifierSet  # type: ignore
 from packaging.version import Version  # type: ignore
 from pydantic import BaseModel as BaseModelV2
+from pydantic import TypeAdapter
 from pydantic.v1 import BaseModel as BaseModelV1
 from typing_extensions import Annotated, get_args, get_origin
 
-from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse
+from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse, AsyncAPIEndpointClient
 from catalystwan.exceptions import APIEndpointError, APIRequestPayloadTypeError, APIVersionError, APIViewError
+from catalystwan.json_codec import STDLIB_JSON_CODEC, JsonCodec
+from catalystwan.pagination import Paginator, aiterate_pages, iterate_pages
+from catalystwan.response import ManagerResponse
+from catalystwan.response_cache import CachePolicy, ResponseCache, principal_of
+from catalystwan.retry import RetryPolicy
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.session_type import SessionType
 
 BASE_PATH: Final[str] = "/dataservice"
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
+# endpoint template (eg. "GET /device/{device_id}") of @request decorated method being executed in current context
+current_endpoint: ContextVar[Optional[str]] = ContextVar("current_endpoint", default=None)
+# retry policy of @request decorated method (or its APIEndpoints class) being executed in current context
+current_retry_policy: ContextVar[Optional[RetryPolicy]] = ContextVar("current_retry_policy", default=None)
 
 
 @runtime_checkable
@@ -144,16 +169,36 @@ class PreparedPayload:
         return result
 
 
-def dict_values_to_str(field_names: Set[str], kwargs: Dict[str, Any]) -> Dict[str, str]:
+@dataclass(frozen=True)
+class CallPlan:
+    """Steps of sending request and decoding response of @request decorated method.
+    Compiled once at decoration time, so signature and return type are not inspected on each call."""
+
+    arg_names: Tuple[str, ...]
+    defaults: Dict[str, Any]
+    build_url: Callable[[Dict[str, Any]], str]
+    static_kwargs: Dict[str, Any]
+    decode: Callable[[APIEndpointClientResponse], Any]
+
+
+def url_value_to_str(value: Any) -> str:
     # this is to keep compatiblity and have seme behavior for (str, Enum) mixin after 3.11 for url formatting
-    result: Dict[str, str] = {}
-    for field_name in field_names:
-        field_value = kwargs.get(field_name)
-        if isinstance(field_value, Enum):
-            result[field_name] = str(field_value.value)
-        else:
-            result[field_name] = str(field_value)
-    return result
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def dict_values_to_str(field_names: Set[str], kwargs: Dict[str, Any]) -> Dict[str, str]:
+    return {field_name: url_value_to_str(kwargs.get(field_name)) for field_name in field_names}
+
+
+def _decode_none(response: APIEndpointClientResponse) -> None:
+    return None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_type: type) -> TypeAdapter:
+    return TypeAdapter(List[model_type])  # type: ignore[valid-type]
 
 
 class APIEndpoints:
@@ -164,16 +209,18 @@ class APIEndpoints:
     """
 
     @classmethod
-    def _prepare_payload(cls, payload: PayloadType, force_json: bool = False) -> PreparedPayload:
+    def _prepare_payload(
+        cls, payload: PayloadType, force_json: bool = False, codec: JsonCodec = STDLIB_JSON_CODEC
+    ) -> PreparedPayload:
         """Helper method to prepare data for sending based on type"""
         if force_json or isinstance(payload, dict):
-            return PreparedPayload(data=json.dumps(payload), headers={"content-type": "application/json"})
+            return PreparedPayload(data=codec.dumps(payload), headers={"content-type": "application/json"})
         if isinstance(payload, (str, bytes)):
             return PreparedPayload(data=payload)
         elif isinstance(payload, (BaseModelV1, BaseModelV2)):
             return cls._prepare_basemodel_payload(payload)
         elif isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
-            return cls._prepare_sequence_payload(payload)  # type: ignore[arg-type]
+            return cls._prepare_sequence_payload(payload, codec)  # type: ignore[arg-type]
             # offender is List[JSON] which is also a Sequence can be ignored as long as force_json is passed correctly
         elif isinstance(payload, CustomPayloadType):
             return payload.prepared()
@@ -192,16 +239,24 @@ class APIEndpoints:
         )
 
     @classmethod
-    def _prepare_sequence_payload(cls, payload: Iterable[Union[BaseModelV1, BaseModelV2]]) -> PreparedPayload:
-        """Helper method to prepare sequences for sending"""
+    def _prepare_sequence_payload(
+        cls, payload: Iterable[Union[BaseModelV1, BaseModelV2]], codec: JsonCodec = STDLIB_JSON_CODEC
+    ) -> PreparedPayload:
+        """Helper method to prepare sequences for sending.
+        Sequence of pydantic v2 models of the same type is serialized in one pass without intermediate dicts."""
+        models = list(payload)
+        if models and isinstance(models[0], BaseModelV2):
+            model_type = type(models[0])
+            if all(type(item) is model_type for item in models):
+                data = _list_adapter(model_type).dump_json(models, exclude_none=True, by_alias=True)
+                return PreparedPayload(data=data, headers={"content-type": "application/json"})
         items = []
-        for item in payload:
+        for item in models:
             if isinstance(item, BaseModelV1):
                 items.append(item.dict(exclude_none=True, by_alias=True))
             elif isinstance(item, BaseModelV2):
                 items.append(item.model_dump(exclude_none=True, by_alias=True))
-        data = json.dumps(items)
-        return PreparedPayload(data=data, headers={"content-type": "application/json"})
+        return PreparedPayload(data=codec.dumps(items), headers={"content-type": "application/json"})
 
     @classmethod
     def _prepare_params(cls, params: RequestParamsType) -> Dict[str, Any]:
@@ -212,10 +267,27 @@ class APIEndpoints:
             return params.model_dump(exclude_none=True, by_alias=True)
         return params
 
+    retry_policy: ClassVar[Optional[RetryPolicy]] = None  # applies to all endpoints of the class
+
     def __init__(self, client: APIEndpointClient):
         self._client = client
         self._basepath = BASE_PATH
 
+    def _prepare_request_kwargs(
+        self,
+        payload: Optional[ModelPayloadType] = None,
+        params: Optional[RequestParamsType] = None,
+        force_json_payload: bool = False,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Prepares keyword arguments passed to client request method"""
+        _kwargs = dict(kwargs)
+        if payload is not None:
+            _kwargs.update(self._prepare_payload(payload, force_json_payload, self._json_codec).asdict())
+        if params is not None:
+            _kwargs.update({"params": self._prepare_params(params)})
+        return _kwargs
+
     def _request(
         self,
         method: str,
@@ -226,22 +298,49 @@ class APIEndpoints:
         **kwargs,
     ) -> APIEndpointClientResponse:
         """Prepares and sends request using client protocol"""
-        _kwargs = dict(kwargs)
-        if payload is not None:
-            _kwargs.update(self._prepare_payload(payload, force_json_payload).asdict())
-        if params is not None:
-            _kwargs.update({"params": self._prepare_params(params)})
+        _kwargs = self._prepare_request_kwargs(payload, params, force_json_payload, **kwargs)
         return self._client.request(method, self._basepath + url, **_kwargs)
 
     @property
     def _api_version(self) -> Optional[Version]:
         return self._client.api_version
 
+    @property
+    def _json_codec(self) -> JsonCodec:
+        """JSON codec of client or standard library json when client does not define it"""
+        codec = getattr(self._client, "json_codec", None)
+        return codec if isinstance(codec, JsonCodec) else STDLIB_JSON_CODEC
+
     @property
     def _session_type(self) -> Optional[SessionType]:
         return self._client.session_type
 
 
+class AsyncAPIEndpoints(APIEndpoints):
+    """
+    Class to be used as base for API endpoints served by client with awaitable 'request' method
+    (eg. catalystwan.async_session.AsyncManagerSession). Endpoints are defined with awaitable decorators:
+    async_get, async_post, async_put, async_delete.
+    """
+
+    def __init__(self, client: AsyncAPIEndpointClient):
+        self._client = client  # type: ignore[assignment]
+        self._basepath = BASE_PATH
+
+    async def _request(  # type: ignore[override]
+        self,
+        method: str,
+        url: str,
+        payload: Optional[ModelPayloadType] = None,
+        params: Optional[RequestParamsType] = None,
+        force_json_payload: bool = False,
+        **kwargs,
+    ) -> APIEndpointClientResponse:
+        """Prepares and sends request using async client protocol"""
+        _kwargs = self._prepare_request_kwargs(payload, params, force_json_payload, **kwargs)
+        return await self._client.request(method, self._basepath + url, **_kwargs)  # type: ignore[misc]
+
+
 class APIEndpointsDecorator:
     @classmethod
     def get_check_instance(cls, _self, *args, **kwargs) -> APIEndpoints:
@@ -264,6 +363,7 @@ class versions(APIEndpointsDecorator):
     def __init__(self, supported_versions: str, raises: bool = False):
         self.supported_versions = SpecifierSet(supported_versions)
         self.raises = raises
+        self.compatibility: Dict[Version, bool] = {}  # SpecifierSet check is costly, result is cached per version
 
     def __call__(self, func):
         original_func = getattr(func, "_ofunc", func)  # grab original function
@@ -274,7 +374,7 @@ class versions(APIEndpointsDecorator):
             _self = self.get_check_instance(*args, **kwargs)  # _self refers to APIEndpoints instance
             current = _self._api_version
             supported = self.supported_versions
-            if current and current not in supported:
+            if current and not self.is_compatible(current):
                 if self.raises:
                     raise APIVersionError(func, supported, current)
                 else:
@@ -286,6 +386,11 @@ class versions(APIEndpointsDecorator):
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
         return wrapper
 
+    def is_compatible(self, current: Version) -> bool:
+        if (compatible := self.compatibility.get(current)) is None:
+            compatible = self.compatibility[current] = current in self.supported_versions
+        return compatible
+
 
 class view(APIEndpointsDecorator):
     """
@@ -326,6 +431,10 @@ class request(APIEndpointsDecorator):
     Decorator to annotate endpoints with HTTP method, URL and optionally json key from which
     modelled data will be parsed (usually "data", but defaults to whole json payload).
     Additional kwargs can be injected which will be passed to request method (eg. custom headers)
+    Optional retry policy (catalystwan.retry.RetryPolicy) overrides policy of APIEndpoints class and session.
+    Optional cache policy (catalystwan.response_cache.CachePolicy) enables caching of responses
+    when session has response_cache assigned, invalidates tags are removed from that cache after request is sent.
+    Optional paginator (catalystwan.pagination) makes decorated method return lazy Iterator of models from all pages.
 
     Decorated method parameters and return type annotations are checked:
 
@@ -349,11 +458,22 @@ class request(APIEndpointsDecorator):
     """
 
     forbidden_url_field_names = {"self", "payload", "params"}
+    page_iterator_type: ClassVar[type] = collections.abc.Iterator  # return type of paginated endpoints
     request_lookup: ClassVar[
         Dict[str, APIEndpointRequestMeta]
     ] = {}  # maps decorated method instance to it's meta information
 
-    def __init__(self, http_method: str, url: str, resp_json_key: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        http_method: str,
+        url: str,
+        resp_json_key: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[CachePolicy] = None,
+        invalidates: Iterable[str] = (),
+        paginate: Optional[Paginator] = None,
+        **kwargs,
+    ):
         self.http_method = http_method
         formatter = Formatter()
         url_field_names = {item[1] for item in formatter.parse(url) if item[1] is not None}
@@ -362,6 +482,10 @@ class request(APIEndpointsDecorator):
         self.url = url
         self.url_field_names = url_field_names
         self.resp_json_key = resp_json_key
+        self.retry_policy = retry
+        self.cache_policy = cache
+        self.invalidates = frozenset(invalidates)
+        self.paginator = paginate
         self.return_spec = TypeSpecifier.not_present()
         self.payload_spec = TypeSpecifier.not_present()
         self.kwargs = kwargs
@@ -386,6 +510,17 @@ class request(APIEndpointsDecorator):
                 "APIEndpoint methods decorated with @request must specify return type, "
                 "use None annotation if function does not return any value"
             )
+        if (type_origin := get_origin(annotation)) and isclass(type_origin) and self.paginator is not None:
+            if (
+                type_origin is self.page_iterator_type
+                and (type_args := get_args(annotation))
+                and isclass(type_args[0])
+                and issubclass(type_args[0], (BaseModelV1, BaseModelV2))
+            ):
+                return TypeSpecifier(True, type_origin, type_args[0])
+            raise APIEndpointError(f"Expected: {self.page_iterator_type.__name__}[Model] but return type {annotation}")
+        if self.paginator is not None:
+            raise APIEndpointError(f"Expected: {self.page_iterator_type.__name__}[Model] but return type {annotation}")
         if (type_origin := get_origin(annotation)) and isclass(type_origin) and issubclass(type_origin, DataSequence):
             if (
                 (type_args := get_args(annotation))
@@ -528,14 +663,18 @@ class request(APIEndpointsDecorator):
 
         Returns: Dict[str, Any]: all passed args as keyword arguments (excluding "self")
         """
-        all_args_names = [key for key in self.sig.parameters.keys()]
-        all_args_dict = dict(self.defaults)
-        all_args_dict.update(dict(zip(all_args_names, positional_args)))
+        all_args_dict = dict(self.plan.defaults)
+        all_args_dict.update(zip(self.plan.arg_names, positional_args))
         all_args_dict.update(keyword_args)
         all_args_dict.pop("self", None)
         return all_args_dict
 
-    def __call__(self, func):
+    def prepare(self, func) -> Any:
+        """Inspects decorated method signature and registers endpoint meta information.
+
+        Returns:
+            Any: original (undecorated) function
+        """
         original_func = getattr(func, "_ofunc", func)  # grab original function
         self.sig = signature(original_func)
         self.defaults = {
@@ -544,51 +683,239 @@ class request(APIEndpointsDecorator):
         self.return_spec = self.specify_return_type()
         self.payload_spec = self.specify_payload_type()
         self.check_params()
+        self.http_request = f"{self.http_method} {self.url}"
         self.request_lookup[original_func.__qualname__] = APIEndpointRequestMeta(
             func=original_func,
-            http_request=f"{self.http_method} {self.url}",
+            http_request=self.http_request,
             payload_spec=self.payload_spec,
             return_spec=self.return_spec,
         )
+        self.plan = self.compile_plan()
+        return original_func
+
+    def compile_plan(self) -> CallPlan:
+        """Compiles argument binding, url builder and response decoder for inspected signature"""
+        return CallPlan(
+            arg_names=tuple(self.sig.parameters.keys()),
+            defaults=self.defaults,
+            build_url=self.compile_url_builder(),
+            static_kwargs=dict(force_json_payload=self.payload_spec.is_json, **self.kwargs),
+            decode=self.compile_decoder(),
+        )
+
+    def compile_url_builder(self) -> Callable[[Dict[str, Any]], str]:
+        url = self.url
+        field_names = tuple(self.url_field_names)
+        if not field_names:
+            return lambda _: url
+
+        def build_url(arguments: Dict[str, Any]) -> str:
+            return url.format_map({name: url_value_to_str(arguments.get(name)) for name in field_names})
+
+        return build_url
+
+    def compile_decoder(self) -> Callable[[APIEndpointClientResponse], Any]:
+        """Selects response decoder according to decorated method return type"""
+        spec = self.return_spec
+        key = self.resp_json_key
+        if not spec.present:
+            return _decode_none
+        if spec.is_json:
+            if key is None:
+                return lambda response: response.json()
+
+            def decode_json_key(response: APIEndpointClientResponse) -> Any:
+                full_json = response.json()
+                if isinstance(full_json, dict):
+                    return full_json.get(key)
+                raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
+
+            return decode_json_key
+        model = spec.payload_type
+        if model is None:
+            return _decode_none
+        if issubclass(model, (BaseModelV1, BaseModelV2)):
+            if spec.sequence_type is not None:  # DataSequence or page of paginated endpoint
+                return lambda response: response.dataseq(model, key)  # type: ignore[arg-type]
+            return lambda response: response.dataobj(model, key)  # type: ignore[arg-type]
+        if issubclass(model, str):
+            return lambda response: response.text
+        if issubclass(model, bytes):
+            return lambda response: response.content
+        if issubclass(model, dict):
+            return lambda response: response.json()
+        return _decode_none
+
+    def bind_request(self, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Binds decorated method arguments to request url and keyword arguments accepted by APIEndpoints._request
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: formatted url and keyword arguments
+        """
+        _kwargs = self.merge_args(args, kwargs)
+        request_kwargs = dict(payload=_kwargs.get("payload"), params=_kwargs.get("params"), **self.plan.static_kwargs)
+        return self.plan.build_url(_kwargs), request_kwargs
+
+    def parse_response(self, response: APIEndpointClientResponse) -> Any:
+        """Parses received response according to decorated method return type"""
+        return self.plan.decode(response)
+
+    def get_retry_policy(self, _self: APIEndpoints) -> Optional[RetryPolicy]:
+        """Retry policy given in decorator, or defined for APIEndpoints class"""
+        return self.retry_policy or _self.retry_policy
+
+    def get_response_cache(self, _self: APIEndpoints) -> Optional[ResponseCache]:
+        """Response cache of client when it is enabled for client and decorated method"""
+        cache = getattr(_self._client, "response_cache", None)
+        return cache if isinstance(cache, ResponseCache) else None
+
+    def cache_key(self, _self: APIEndpoints, url: str, request_kwargs: Dict[str, Any]) -> str:
+        params = request_kwargs.get("params")
+        prepared_params = _self._prepare_params(params) if params is not None else None
+        return ResponseCache.key(self.http_method, _self._basepath + url, prepared_params, principal_of(_self._client))
+
+    @staticmethod
+    def with_headers(request_kwargs: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """Adds (conditional request) headers to request keyword arguments"""
+        if not headers:
+            return request_kwargs
+        return dict(request_kwargs, headers={**request_kwargs.get("headers", {}), **headers})
+
+    def send(self, _self: APIEndpoints, url: str, request_kwargs: Dict[str, Any]) -> APIEndpointClientResponse:
+        """Sends request (or gets its response from client response cache) and invalidates cached responses"""
+        cache = self.get_response_cache(_self)
+        if cache is None:
+            return _self._request(self.http_method, url, **request_kwargs)
+        if self.cache_policy is not None:
+            return cache.fetch(
+                self.cache_key(_self, url, request_kwargs),
+                self.cache_policy,
+                lambda headers: cast(
+                    ManagerResponse, _self._request(self.http_method, url, **self.with_headers(request_kwargs, headers))
+                ),
+            )
+        try:
+            return _self._request(self.http_method, url, **request_kwargs)
+        finally:
+            cache.invalidate(*self.invalidates)  # also after failure, as request could be partially processed
+
+    def send_in_context(
+        self, _self: APIEndpoints, url: str, request_kwargs: Dict[str, Any]
+    ) -> APIEndpointClientResponse:
+        """Sends request with decorator context (endpoint, retry policy) visible to client"""
+        token = current_endpoint.set(self.http_request)
+        retry_token = current_retry_policy.set(policy) if (policy := self.get_retry_policy(_self)) else None
+        try:
+            return self.send(_self, url, request_kwargs)
+        finally:
+            current_endpoint.reset(token)
+            if retry_token is not None:
+                current_retry_policy.reset(retry_token)
+
+    def paginate(self, _self: APIEndpoints, url: str, request_kwargs: Dict[str, Any]) -> Iterator[Any]:
+        """Lazily sends requests for pages selected by paginator and yields parsed items"""
+        params = request_kwargs.pop("params")
+        return iterate_pages(
+            lambda page_params: self.send_in_context(_self, url, dict(request_kwargs, params=page_params)),
+            self.parse_response,
+            cast(Paginator, self.paginator),
+            _self._prepare_params(params) if params is not None else None,
+        )
+
+    def __call__(self, func):
+        original_func = self.prepare(func)
 
         def wrapper(*args, **kwargs):
             """Executes each time decorated method is called"""
             _self = self.get_check_instance(*args, **kwargs)  # _self refers to APIEndpoints instance
-            _kwargs = self.merge_args(args, kwargs)
-            payload = _kwargs.get("payload")
-            params = _kwargs.get("params")
-            url_kwargs = dict_values_to_str(self.url_field_names, _kwargs)
-            formatted_url = self.url.format_map(url_kwargs)
-            response = _self._request(
-                self.http_method,
-                formatted_url,
-                payload=payload,
-                force_json_payload=self.payload_spec.is_json,
-                params=params,
-                **self.kwargs,
-            )
-            if self.return_spec.present:
-                if self.return_spec.is_json:
-                    full_json = response.json()
-                    if self.resp_json_key is not None:
-                        if isinstance(full_json, dict):
-                            return full_json.get(self.resp_json_key)
-                        else:
-                            raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
-                    return full_json
-                if self.return_spec.payload_type is None:
-                    pass
-                elif issubclass(self.return_spec.payload_type, (BaseModelV1, BaseModelV2)):
-                    if self.return_spec.sequence_type == DataSequence:
-                        return response.dataseq(self.return_spec.payload_type, self.resp_json_key)
-                    else:
-                        return response.dataobj(self.return_spec.payload_type, self.resp_json_key)
-                elif issubclass(self.return_spec.payload_type, str):
-                    return response.text
-                elif issubclass(self.return_spec.payload_type, bytes):
-                    return response.content
-                elif issubclass(self.return_spec.payload_type, dict):
-                    return response.json()
+            url, request_kwargs = self.bind_request(args, kwargs)
+            if self.paginator is not None:
+                return self.paginate(_self, url, request_kwargs)
+            return self.parse_response(self.send_in_context(_self, url, request_kwargs))
+
+        wrapper._ofunc = original_func  # provide original function to next decorator in chain
+        return wrapper
+
+
+class async_request(request):
+    """
+    Awaitable variant of @request decorator, can be used only for AsyncAPIEndpoints coroutine methods.
+    Decorated method parameters and return type annotations are checked the same way as for @request.
+    """
+
+    page_iterator_type: ClassVar[type] = collections.abc.AsyncIterator
+
+    @classmethod
+    def get_check_instance(cls, _self, *args, **kwargs) -> AsyncAPIEndpoints:
+        """Gets wrapped coroutine function instance (first argument)"""
+        if not isinstance(_self, AsyncAPIEndpoints):
+            raise APIEndpointError(f"Only AsyncAPIEndpoints instance methods can be annotated with @{cls} decorator")
+        return _self
+
+    async def send(  # type: ignore[override]
+        self, _self: AsyncAPIEndpoints, url: str, request_kwargs: Dict[str, Any]
+    ) -> APIEndpointClientResponse:
+        """Awaits request (or gets its response from client response cache) and invalidates cached responses"""
+        cache = self.get_response_cache(_self)
+        if cache is None:
+            return await _self._request(self.http_method, url, **request_kwargs)
+        if self.cache_policy is not None:
+            key = self.cache_key(_self, url, request_kwargs)
+            entry, cached_response = cache.lookup(key)
+            if cached_response is not None:
+                return cached_response
+            headers = cache.conditional_headers(entry, self.cache_policy)
+            response = await _self._request(self.http_method, url, **self.with_headers(request_kwargs, headers))
+            return cache.update(key, self.cache_policy, entry, cast(ManagerResponse, response))
+        try:
+            return await _self._request(self.http_method, url, **request_kwargs)
+        finally:
+            cache.invalidate(*self.invalidates)
+
+    async def send_in_context(  # type: ignore[override]
+        self, _self: AsyncAPIEndpoints, url: str, request_kwargs: Dict[str, Any]
+    ) -> APIEndpointClientResponse:
+        """Awaits request with decorator context (endpoint, retry policy) visible to client"""
+        token = current_endpoint.set(self.http_request)
+        retry_token = current_retry_policy.set(policy) if (policy := self.get_retry_policy(_self)) else None
+        try:
+            return await self.send(_self, url, request_kwargs)
+        finally:
+            current_endpoint.reset(token)
+            if retry_token is not None:
+                current_retry_policy.reset(retry_token)
+
+    def paginate(  # type: ignore[override]
+        self, _self: AsyncAPIEndpoints, url: str, request_kwargs: Dict[str, Any]
+    ) -> AsyncIterator[Any]:
+        """Lazily awaits requests for pages selected by paginator and yields parsed items"""
+        params = request_kwargs.pop("params")
+        return aiterate_pages(
+            lambda page_params: self.send_in_context(_self, url, dict(request_kwargs, params=page_params)),
+            self.parse_response,
+            cast(Paginator, self.paginator),
+            _self._prepare_params(params) if params is not None else None,
+        )
+
+    def __call__(self, func):
+        original_func = self.prepare(func)
+
+        if self.paginator is not None:
+
+            def paginated_wrapper(*args, **kwargs):
+                """Returns async iterator each time decorated method is called"""
+                _self = self.get_check_instance(*args, **kwargs)  # _self refers to AsyncAPIEndpoints instance
+                url, request_kwargs = self.bind_request(args, kwargs)
+                return self.paginate(_self, url, request_kwargs)
+
+            paginated_wrapper._ofunc = original_func  # provide original function to next decorator in chain
+            return paginated_wrapper
+
+        async def wrapper(*args, **kwargs):
+            """Executes each time decorated method is awaited"""
+            _self = self.get_check_instance(*args, **kwargs)  # _self refers to AsyncAPIEndpoints instance
+            url, request_kwargs = self.bind_request(args, kwargs)
+            return self.parse_response(await self.send_in_context(_self, url, request_kwargs))
 
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
         return wrapper
@@ -612,3 +939,23 @@ class post(request):
 class delete(request):
     def __init__(self, url: str, resp_json_key: Optional[str] = None, **kwargs):
         super().__init__("DELETE", url, resp_json_key, **kwargs)
+
+
+class async_get(async_request):
+    def __init__(self, url: str, resp_json_key: Optional[str] = None, **kwargs):
+        super().__init__("GET", url, resp_json_key, **kwargs)
+
+
+class async_put(async_request):
+    def __init__(self, url: str, resp_json_key: Optional[str] = None, **kwargs):
+        super().__init__("PUT", url, resp_json_key, **kwargs)
+
+
+class async_post(async_request):
+    def __init__(self, url: str, resp_json_key: Optional[str] = None, **kwargs):
+        super().__init__("POST", url, resp_json_key, **kwargs)
+
+
+class async_delete(async_request):
+    def __init__(self, url: str, resp_json_key: Optional[str] = None, **kwargs):
+        super().__init__("DELETE", url, resp_json_key, **kwargs)
@@ -7,7 +7,7 @@ from typing import Any, List, Optional
 from packaging.version import Version  # type: ignore
 from pydantic.v1 import BaseModel, Field
 
-from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.endpoints import APIEndpoints, AsyncAPIEndpoints, async_get, get
 
 
 class VersionField(Version):
@@ -75,3 +75,17 @@ class Client(APIEndpoints):
     @get("/client/about", "data")
     def about(self) -> AboutInfo:
         ...
+
+
+class AsyncClient(AsyncAPIEndpoints):
+    @async_get("/client/server", "data")
+    async def server(self) -> ServerInfo:
+        ...
+
+    @async_get("/client/server/ready")
+    async def server_ready(self) -> ServerReady:
+        ...
+
+    @async_get("/client/about", "data")
+    async def about(self) -> AboutInfo:
+        ...
@@ -8,6 +8,7 @@ from typing import Optional
 from pydantic.v1 import BaseModel
 
 from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.response_cache import CachePolicy
 from catalystwan.typed_list import DataSequence
 
 
@@ -66,7 +67,7 @@ class ClusterManagement(APIEndpoints):
         # GET /clusterManagement/{tenantId}/connectedDevices/{vmanageIP}
         ...
 
-    @get("/clusterManagement/tenancy/mode", "data")
+    @get("/clusterManagement/tenancy/mode", "data", cache=CachePolicy(ttl=300))
     def get_tenancy_mode(self) -> TenancyMode:
         ...
 
@@ -25,6 +25,7 @@ class SubTaskData(BaseModel):
 class TaskResult(BaseModel):
     result: bool
     sub_tasks_data: List[SubTaskData]
+    task_id: Optional[str] = None
 
 
 class RunningTaskData(BaseModel):
@@ -3,6 +3,7 @@
 # mypy: disable-error-code="empty-body"
 from catalystwan.endpoints import APIEndpointClient, APIEndpoints, get
 from catalystwan.models.misc.application_protocols import ApplicationProtocolMap
+from catalystwan.response_cache import CachePolicy
 from catalystwan.typed_list import DataSequence
 
 
@@ -11,7 +12,7 @@ class MiscellaneousEndpoints(APIEndpoints):
         self._client = client
         self._basepath = ""
 
-    @get("/app/json/application_protocol.json", "data")
+    @get("/app/json/application_protocol.json", "data", cache=CachePolicy(ttl=3600))
     def get_application_protocols(self) -> DataSequence[ApplicationProtocolMap]:
         """Not in spec, provides protocol name to protocol/port number mapping
 
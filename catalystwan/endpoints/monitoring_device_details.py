@@ -5,7 +5,8 @@ from typing import List, Optional
 
 from pydantic.v1 import BaseModel, Field
 
-from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.endpoints import APIEndpoints, delete, get
+from catalystwan.response_cache import CachePolicy
 from catalystwan.typed_list import DataSequence
 
 
@@ -80,8 +81,8 @@ class MonitoringDeviceDetails(APIEndpoints):
         #  POST /device/tier
         ...
 
-    def delete_tier(self):
-        #  DELETE /device/tier/{tierName}
+    @delete("/device/tier/{tier_name}", invalidates={"tiers"})
+    def delete_tier(self, tier_name: str) -> None:
         ...
 
     def enable_sdavcon_device(self):
@@ -156,7 +157,7 @@ class MonitoringDeviceDetails(APIEndpoints):
         #  GET /device/queues
         ...
 
-    @get("/device/tier", "data")
+    @get("/device/tier", "data", cache=CachePolicy(ttl=300, tags=frozenset({"tiers"})))
     def get_tiers(self) -> DataSequence[Tier]:
         ...
 
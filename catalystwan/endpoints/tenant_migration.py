@@ -2,11 +2,21 @@
 
 # mypy: disable-error-code="empty-body"
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qsl, urlsplit
 
 from pydantic.v1 import BaseModel, Field
 
-from catalystwan.endpoints import APIEndpoints, CustomPayloadType, PreparedPayload, get, post, versions, view
+from catalystwan.endpoints import (
+    APIEndpoints,
+    CustomPayloadType,
+    PreparedPayload,
+    get,
+    post,
+    url_value_to_str,
+    versions,
+    view,
+)
 from catalystwan.models.tenant import TenantExport
 from catalystwan.utils.session_type import ProviderView, SingleTenantView
 
@@ -53,6 +63,12 @@ class TenantMigration(APIEndpoints):
     def download_tenant_data(self, path: str = "default.tar.gz") -> bytes:
         ...
 
+    @view({SingleTenantView, ProviderView})
+    @versions(">=20.6")
+    def download_tenant_data_to_file(self, filename: Path, path: str = "default.tar.gz") -> Any:
+        """Streams exported tenant data to file instead of reading it into memory (same url as download_tenant_data)"""
+        return self._client.get_file(f"{self._basepath}/tenantmigration/download/{url_value_to_str(path)}", filename)
+
     @view({SingleTenantView, ProviderView})
     @versions(">=20.6")
     @post("/tenantmigration/export")
@@ -176,6 +176,24 @@ class ManagerReadyTimeout(CatalystwanException):
     pass
 
 
+class WaitTimeoutError(CatalystwanException):
+    """Raised when awaited condition was not met before deadline"""
+
+    pass
+
+
+class WaitAbortedError(CatalystwanException):
+    """Raised when waiting was stopped early because awaited condition cannot be met anymore"""
+
+    pass
+
+
+class WaitCancelledError(CatalystwanException):
+    """Raised when waiting was cancelled"""
+
+    pass
+
+
 class CatalystwanDeprecationWarning(DeprecationWarning):
     """Warning issued when using deprecated features or functionality in the Catalystwan SDK.
 
@@ -0,0 +1,76 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Concurrent requests for long lists of parameters (eg. device IDs) split into chunks.
+
+Server limits number of values accepted in single request, so large lists are split into chunks
+which are requested concurrently by bounded number of threads sharing the session:
+>>> devices = fan_out_dataseq(
+>>>     Device,
+>>>     lambda ids: session.get("/dataservice/device/system/info", params={"deviceId": ids}).dataseq(Device),
+>>>     device_ids,
+>>>     chunk_size=1000,
+>>> )
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import chain
+from typing import Callable, Final, Iterable, Iterator, List, Sequence, Type, TypeVar
+
+from catalystwan.typed_list import DataSequence
+
+P = TypeVar("P")
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS: Final[int] = 8
+
+
+def chunks(items: Sequence[P], size: int) -> Iterator[List[P]]:
+    """Splits items into lists of given size (last one can be shorter)"""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    for begin in range(0, len(items), size):
+        yield list(items[begin : begin + size])
+
+
+def fan_out(
+    fetch: Callable[[List[P]], Iterable[T]],
+    items: Sequence[P],
+    chunk_size: int,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[T]:
+    """Calls fetch for each chunk of items concurrently and merges results in order of chunks
+
+    Args:
+        fetch: sends request for given chunk of items and returns its results
+        items: parameters to be split into chunks
+        chunk_size: maximum number of items passed to single fetch call
+        max_workers: maximum number of fetch calls executed at the same time
+
+    Raises:
+        Exception: first exception raised by fetch (in order of chunks), chunks not yet started are cancelled
+    """
+    batches = list(chunks(items, chunk_size))
+    if len(batches) <= 1 or max_workers <= 1:
+        return list(chain.from_iterable(fetch(batch) for batch in batches))
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(batches)), thread_name_prefix="catalystwan-fan-out")
+    # context (eg. endpoint and retry policy of decorated method) is visible to fetch in worker threads
+    futures = [executor.submit(copy_context().run, fetch, batch) for batch in batches]
+    try:
+        return list(chain.from_iterable(future.result() for future in futures))
+    finally:
+        for future in futures:
+            future.cancel()  # only chunks not yet started are cancelled
+        executor.shutdown(wait=True)
+
+
+def fan_out_dataseq(
+    cls: Type[T],
+    fetch: Callable[[List[P]], Iterable[T]],
+    items: Sequence[P],
+    chunk_size: int,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> DataSequence[T]:
+    """Same as fan_out but results are merged into one DataSequence"""
+    return DataSequence(cls, fan_out(fetch, items, chunk_size, max_workers))
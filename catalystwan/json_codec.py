@@ -0,0 +1,119 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""JSON codecs used by sessions to serialize request payloads and decode response bodies.
+
+Standard library json is used by default. Faster codecs can be selected per session when optional
+packages are installed (pip install catalystwan[orjson] or catalystwan[msgspec]):
+>>> session = create_manager_session(url, username, password, json_codec=OrjsonCodec())
+>>> session.json_codec = fastest_json_codec()  # orjson, msgspec or stdlib, whichever is available
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, List, Union
+
+from requests.exceptions import JSONDecodeError
+
+JSONData = Union[str, bytes]
+
+
+class JsonCodec(ABC):
+    """Base class for JSON codecs. Decoding errors are reported as requests.exceptions.JSONDecodeError."""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> JSONData:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: JSONData) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: JSONData) -> Any:
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError as error:
+            raise JSONDecodeError(error.msg, error.doc, error.pos)
+
+
+class OrjsonCodec(JsonCodec):
+    """Requires orjson package"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # type: ignore
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: JSONData) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError as error:
+            raise JSONDecodeError(error.msg, error.doc, error.pos)
+
+
+class MsgspecCodec(JsonCodec):
+    """Requires msgspec package"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec  # type: ignore
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: JSONData) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as error:
+            raise JSONDecodeError(str(error), data if isinstance(data, str) else repr(data), 0)
+
+
+STDLIB_JSON_CODEC = StdlibJsonCodec()
+
+
+def encode_json_kwarg(kwargs: Dict[str, Any], codec: JsonCodec) -> Dict[str, Any]:
+    """Replaces requests-like "json" keyword argument with "data" serialized by given codec"""
+    if kwargs.get("json") is None or kwargs.get("data") is not None:
+        return kwargs
+    _kwargs = dict(kwargs)
+    _kwargs["data"] = codec.dumps(_kwargs.pop("json"))
+    _kwargs["headers"] = {"content-type": "application/json", **(_kwargs.get("headers") or {})}
+    return _kwargs
+
+
+def available_json_codecs() -> List[JsonCodec]:
+    """Codecs which can be used in current environment, fastest first"""
+    codecs: List[JsonCodec] = []
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            continue
+    codecs.append(STDLIB_JSON_CODEC)
+    return codecs
+
+
+def fastest_json_codec() -> JsonCodec:
+    return available_json_codecs()[0]
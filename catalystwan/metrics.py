@@ -0,0 +1,198 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Per-endpoint request metrics for ManagerSession.
+
+Metrics are opt-in: assign MetricsRegistry to session.metrics and every request is aggregated
+under template of @request decorated endpoint which sent it (eg. "GET /device/{device_id}"),
+or under "METHOD /path" for requests sent directly with session methods.
+>>> session.metrics = MetricsRegistry()
+>>> session.api.devices.get()
+>>> session.metrics.asdict()
+{'GET /device': {'calls': 1, 'errors': 0, 'relogins': 0, 'retries': 0, ...}}
+>>> print(session.metrics.to_prometheus())
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Final, List, Optional, Tuple
+
+from catalystwan.endpoints import current_endpoint
+from catalystwan.response import RequestTrace
+
+DEFAULT_BUCKETS: Final[Tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """Latency histogram with fixed bucket upper bounds (in seconds), last bucket counts values above all bounds"""
+
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates quantile by linear interpolation within bucket containing it"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                if index == len(self.buckets):
+                    return self.max  # no upper bound to interpolate to
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                return min(lower + (upper - lower) * (rank - cumulative) / bucket_count, self.max)
+            cumulative += bucket_count
+        return self.max
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated metrics of single endpoint
+
+    Attributes:
+        calls (int): number of sent requests
+        errors (int): number of requests without response or with HTTP error status (>= 400)
+        relogins (int): number of responses which triggered relogin (request is then sent again)
+        retries (int): number of requests sent again after failure
+        request_bytes (int): total size of sent bodies
+        response_bytes (int): total size of received bodies
+        latency (LatencyHistogram): time to response headers
+    """
+
+    calls: int = 0
+    errors: int = 0
+    relogins: int = 0
+    retries: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def asdict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "relogins": self.relogins,
+            "retries": self.retries,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency": {
+                "count": self.latency.count,
+                "sum": self.latency.sum,
+                "p50": self.latency.quantile(0.5),
+                "p95": self.latency.quantile(0.95),
+                "p99": self.latency.quantile(0.99),
+            },
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe registry of EndpointMetrics keyed by endpoint template"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def key(method: Optional[str], path: str) -> str:
+        """Endpoint template of @request decorated method being executed, or "METHOD /path" of plain request"""
+        return current_endpoint.get() or f"{method} {path}"
+
+    def _get(self, key: str) -> EndpointMetrics:
+        if (metrics := self._endpoints.get(key)) is None:
+            metrics = self._endpoints[key] = EndpointMetrics(latency=LatencyHistogram(self.buckets))
+        return metrics
+
+    def observe(self, trace: RequestTrace) -> None:
+        """Records completed request"""
+        with self._lock:
+            metrics = self._get(self.key(trace.method, trace.path))
+            metrics.calls += 1
+            if trace.status is None or trace.status >= 400:
+                metrics.errors += 1
+            if trace.elapsed is not None:
+                metrics.latency.observe(trace.elapsed)
+            metrics.request_bytes += trace.request_bytes or 0
+            metrics.response_bytes += trace.response_bytes or 0
+
+    def increment(self, method: Optional[str], path: str, counter: str) -> None:
+        """Increments relogins or retries counter of endpoint"""
+        with self._lock:
+            metrics = self._get(self.key(method, path))
+            setattr(metrics, counter, getattr(metrics, counter) + 1)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def asdict(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of all endpoints, ordered by total latency (endpoints dominating runtime first)"""
+        with self._lock:
+            ordered = sorted(self._endpoints.items(), key=lambda item: item[1].latency.sum, reverse=True)
+            return {key: metrics.asdict() for key, metrics in ordered}
+
+    def to_prometheus(self, prefix: str = "catalystwan") -> str:
+        """Metrics of all endpoints in Prometheus text exposition format"""
+        counters = [
+            ("requests_total", "Number of requests sent", "calls"),
+            ("request_errors_total", "Number of failed requests", "errors"),
+            ("relogins_total", "Number of relogins triggered by expired session", "relogins"),
+            ("retries_total", "Number of retried requests", "retries"),
+            ("request_bytes_total", "Total size of request bodies", "request_bytes"),
+            ("response_bytes_total", "Total size of response bodies", "response_bytes"),
+        ]
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines: List[str] = []
+            for name, help, attribute in counters:
+                lines.append(f"# HELP {prefix}_{name} {help}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for key, metrics in endpoints:
+                    lines.append(f'{prefix}_{name}{{endpoint="{_escape(key)}"}} {getattr(metrics, attribute)}')
+            name = f"{prefix}_request_duration_seconds"
+            lines.append(f"# HELP {name} Time to response headers")
+            lines.append(f"# TYPE {name} histogram")
+            for key, metrics in endpoints:
+                label = f'endpoint="{_escape(key)}"'
+                cumulative = 0
+                bounds = [str(bound) for bound in metrics.latency.buckets] + ["+Inf"]
+                for bound, bucket_count in zip(bounds, metrics.latency.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{label}}} {metrics.latency.sum}")
+                lines.append(f"{name}_count{{{label}}} {metrics.latency.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
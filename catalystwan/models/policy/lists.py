@@ -4,7 +4,7 @@ from ipaddress import IPv4Address, IPv4Network, IPv6Network
 from typing import Any, List, Literal, Optional, Set, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from catalystwan.models.common import InterfaceType, TLOCColor, WellKnownBGPCommunities
 from catalystwan.models.policy.lists_entries import (
@@ -43,6 +43,7 @@ from catalystwan.models.policy.lists_entries import (
 
 
 class PolicyListBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)  # schemas of list types are built on first use
     name: str = Field(
         pattern="^[a-zA-Z0-9_-]{1,32}$",
         description="Can include only alpha-numeric characters, hyphen '-' or underscore '_'; maximum 32 characters",
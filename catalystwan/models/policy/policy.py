@@ -20,7 +20,7 @@ class NGFirewallZoneListEntry(BaseModel):
 class AssemblyItemBase(BaseModel):
     definition_id: UUID = Field(serialization_alias="definitionId", validation_alias="definitionId")
     type: str
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class ZoneBasedFWAssemblyItem(AssemblyItemBase):
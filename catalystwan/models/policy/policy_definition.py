@@ -905,6 +905,7 @@ class Action(BaseModel):
 
 
 class PolicyDefinitionSequenceBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     sequence_id: int = Field(default=0, serialization_alias="sequenceId", validation_alias="sequenceId")
     sequence_name: str = Field(serialization_alias="sequenceName", validation_alias="sequenceName")
     base_action: PolicyActionType = Field(
@@ -1078,6 +1079,7 @@ class DefinitionWithSequencesCommonBase(BaseModel):
 
 
 class PolicyDefinitionBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     name: str = Field(
         pattern="^[a-zA-Z0-9_-]{1,128}$",
         description="Can include only alpha-numeric characters, hyphen '-' or underscore '_'; maximum 128 characters",
@@ -0,0 +1,176 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Lazy iteration over collections served page by page.
+
+Endpoint returning paginated collection is defined with paginator given to decorator
+and Iterator (AsyncIterator for async_request decorators) of models as return type:
+>>> class ExampleAPI(APIEndpoints):
+>>>     @get("/template/feature", "data", paginate=OffsetPagination(limit=500, read_ahead=True))
+>>>     def get_feature_templates(self) -> Iterator[FeatureTemplateInfo]:
+>>>         ...
+
+Pages are requested only when previous page is consumed (or while it is consumed when read_ahead is set),
+so memory used is bounded by page size instead of collection size.
+Iteration stops at page starting with the same item as previous page, as server ignoring pagination parameters
+returns whole collection for each page request.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Protocol, Sequence, TypeVar
+
+from catalystwan.abstractions import APIEndpointClientResponse
+
+T = TypeVar("T")
+R = TypeVar("R", bound=APIEndpointClientResponse)
+
+
+class Paginator(Protocol):
+    @property
+    def read_ahead(self) -> bool:
+        """Next page is requested while current one is consumed"""
+        ...
+
+    def first(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Query parameters of first page request"""
+        ...
+
+    def next(self, params: Dict[str, Any], response: APIEndpointClientResponse, count: int) -> Optional[Dict[str, Any]]:
+        """Query parameters of next page request or None when given page (with count items) is the last one"""
+        ...
+
+
+@dataclass(frozen=True)
+class OffsetPagination:
+    """Pages selected by offset of first item and page size (limit).
+    Page larger than limit means server ignores pagination parameters and returned whole collection."""
+
+    limit: int = 100
+    offset_param: str = "offset"
+    limit_param: str = "limit"
+    read_ahead: bool = False
+
+    def first(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {self.offset_param: 0, **params, self.limit_param: self.limit}
+
+    def next(self, params: Dict[str, Any], response: APIEndpointClientResponse, count: int) -> Optional[Dict[str, Any]]:
+        if count != self.limit:
+            return None
+        return dict(params, **{self.offset_param: int(params[self.offset_param]) + count})
+
+
+@dataclass(frozen=True)
+class PageNumberPagination:
+    """Pages selected by page number and page size (page larger than page size is the whole collection)"""
+
+    page_size: int = 100
+    page_param: str = "page"
+    size_param: str = "pageSize"
+    first_page: int = 1
+    read_ahead: bool = False
+
+    def first(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {self.page_param: self.first_page, **params, self.size_param: self.page_size}
+
+    def next(self, params: Dict[str, Any], response: APIEndpointClientResponse, count: int) -> Optional[Dict[str, Any]]:
+        if count != self.page_size:
+            return None
+        return dict(params, **{self.page_param: int(params[self.page_param]) + 1})
+
+
+@dataclass(frozen=True)
+class ScrollPagination:
+    """vManage scroll pages: next page is selected by scrollId returned in "pageInfo" of previous page"""
+
+    count: int = 1000
+    scroll_param: str = "scrollId"
+    count_param: str = "count"
+    read_ahead: bool = False
+
+    def first(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {**params, self.count_param: self.count}
+
+    def next(self, params: Dict[str, Any], response: APIEndpointClientResponse, count: int) -> Optional[Dict[str, Any]]:
+        page_info = response.json().get("pageInfo") or {}
+        if not count or not page_info.get("hasMoreData") or not (scroll_id := page_info.get("scrollId")):
+            return None
+        return dict(params, **{self.scroll_param: scroll_id})
+
+
+def _repeats(previous: Optional[T], items: Sequence[T]) -> bool:
+    """Checks whether page starts with first item of previous page (server ignored pagination parameters)"""
+    return previous is not None and bool(items) and items[0] == previous
+
+
+def iterate_pages(
+    send: Callable[[Dict[str, Any]], R],
+    decode: Callable[[R], Sequence[T]],
+    paginator: Paginator,
+    params: Optional[Dict[str, Any]] = None,
+) -> Iterator[T]:
+    """Lazily yields items of all pages
+
+    Args:
+        send: sends request for page with given query parameters
+        decode: extracts items from page response
+        paginator: selects pages
+        params: query parameters common for all pages
+    """
+    page_params: Optional[Dict[str, Any]] = paginator.first(params or {})
+    previous: Optional[T] = None
+    if not paginator.read_ahead:
+        while page_params is not None:
+            response = send(page_params)
+            items = decode(response)
+            if _repeats(previous, items):
+                return
+            page_params = paginator.next(page_params, response, len(items))
+            previous = items[0] if items else None
+            yield from items
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="catalystwan-read-ahead")
+    future: Future[R] = executor.submit(send, page_params)  # type: ignore[arg-type]
+    try:
+        while page_params is not None:
+            response = future.result()
+            items = decode(response)
+            if _repeats(previous, items):
+                return
+            page_params = paginator.next(page_params, response, len(items))
+            previous = items[0] if items else None
+            if page_params is not None:
+                future = executor.submit(send, page_params)  # next page is fetched while items are consumed
+            yield from items
+    finally:
+        future.cancel()  # iteration was abandoned before next page was requested
+        executor.shutdown(wait=False)
+
+
+async def aiterate_pages(
+    send: Callable[[Dict[str, Any]], Awaitable[R]],
+    decode: Callable[[R], Sequence[T]],
+    paginator: Paginator,
+    params: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[T]:
+    """Awaitable variant of iterate_pages, page read ahead is awaited concurrently with consuming current page"""
+    page_params: Optional[Dict[str, Any]] = paginator.first(params or {})
+    pending: Optional[asyncio.Future[R]] = None
+    previous: Optional[T] = None
+    try:
+        while page_params is not None:
+            response = await pending if pending is not None else await send(page_params)
+            pending = None
+            items = decode(response)
+            if _repeats(previous, items):
+                return
+            page_params = paginator.next(page_params, response, len(items))
+            previous = items[0] if items else None
+            if paginator.read_ahead and page_params is not None:
+                pending = asyncio.ensure_future(send(page_params))
+            for item in items:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
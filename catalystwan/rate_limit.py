@@ -0,0 +1,142 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Client-side request limiters for ManagerSession.
+
+vManage answers with 429 (Too Many Requests) or 503 (Service Unavailable) when API rate limits are exceeded.
+Limiter given to session is shared by all threads sending requests with it, so fan-out jobs can be kept
+below server limits:
+>>> limiter = LimiterChain(TokenBucket(rate=20, capacity=20), AdaptiveConcurrency(initial_limit=8, max_limit=32))
+>>> session = create_manager_session(url, username, password, limiter=limiter)
+"""
+from __future__ import annotations
+
+from threading import Condition, Lock
+from time import monotonic, sleep
+from typing import FrozenSet, Optional, Protocol, runtime_checkable
+
+CONGESTION_STATUS_CODES: FrozenSet[int] = frozenset({429, 503})
+
+
+@runtime_checkable
+class RequestLimiter(Protocol):
+    def acquire(self) -> None:
+        """Called before request is sent, blocks until request is allowed to be sent"""
+        ...
+
+    def release(self, status: Optional[int], elapsed: Optional[float]) -> None:
+        """Called after response headers are received (status and elapsed are None when request failed)"""
+        ...
+
+
+class TokenBucket:
+    """Limits request rate to given number of requests per second, allowing bursts up to capacity
+
+    Args:
+        rate: number of tokens added to bucket per second
+        capacity: maximum number of tokens in bucket (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1  # token is reserved, negative balance makes later callers wait longer
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            sleep(wait)
+
+    def release(self, status: Optional[int], elapsed: Optional[float]) -> None:
+        pass
+
+
+class AdaptiveConcurrency:
+    """Limits number of requests in flight with window adjusted by AIMD (additive increase, multiplicative decrease).
+
+    Window grows by one request per window of successful responses and is multiplied by backoff_factor
+    on 429/503 response or response slower than latency_threshold. Responses to requests sent before last
+    decrease do not decrease it again, so burst of throttled responses shrinks window only once.
+
+    Args:
+        initial_limit: initial number of concurrent requests
+        min_limit: window never shrinks below this value
+        max_limit: window never grows above this value
+        backoff_factor: multiplier applied to window on congestion signal
+        latency_threshold: seconds, slower responses are treated as congestion signal (disabled when None)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_factor: float = 0.5,
+        latency_threshold: Optional[float] = None,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit or not 0 < backoff_factor < 1:
+            raise ValueError(
+                "AdaptiveConcurrency requires 1 <= min_limit <= initial_limit <= max_limit and 0 < backoff_factor < 1"
+            )
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        self.latency_threshold = latency_threshold
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._decreased_at = float("-inf")
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < int(self._limit))
+            self._in_flight += 1
+
+    def release(self, status: Optional[int], elapsed: Optional[float]) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if status is not None:
+                if self._is_congested(status, elapsed):
+                    sent_at = monotonic() - (elapsed or 0.0)
+                    if sent_at >= self._decreased_at:
+                        self._limit = max(self.min_limit, self._limit * self.backoff_factor)
+                        self._decreased_at = monotonic()
+                elif status < 400:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def _is_congested(self, status: int, elapsed: Optional[float]) -> bool:
+        if status in CONGESTION_STATUS_CODES:
+            return True
+        return self.latency_threshold is not None and elapsed is not None and elapsed > self.latency_threshold
+
+
+class LimiterChain:
+    """Combines limiters, request is sent after all limiters allowed it"""
+
+    def __init__(self, *limiters: RequestLimiter):
+        self.limiters = limiters
+
+    def acquire(self) -> None:
+        for limiter in self.limiters:
+            limiter.acquire()
+
+    def release(self, status: Optional[int], elapsed: Optional[float]) -> None:
+        for limiter in reversed(self.limiters):
+            limiter.release(status, elapsed)
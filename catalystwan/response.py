@@ -1,14 +1,16 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
 import re
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from pprint import pformat
-from typing import Any, Callable, Dict, Optional, Sequence, Type, TypeVar, Union, cast
+from typing import Any, Callable, Dict, Final, List, Optional, Sequence, Type, TypeVar, Union, cast
 from urllib.parse import urlparse
 
 from pydantic import BaseModel as BaseModelV2
+from pydantic import Field, TypeAdapter, ValidationError, create_model
 from pydantic.v1 import BaseModel as BaseModelV1
 from requests import PreparedRequest, Request, Response
 from requests.cookies import RequestsCookieJar
@@ -17,11 +19,13 @@ from requests.exceptions import JSONDecodeError
 from catalystwan import with_proc_info_header
 from catalystwan.abstractions import APIEndpointClientResponse
 from catalystwan.exceptions import ManagerErrorInfo
-from catalystwan.typed_list import DataSequence
+from catalystwan.json_codec import JsonCodec
+from catalystwan.typed_list import DataSequence, LazyDataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 
 T = TypeVar("T")
 PRINTABLE_CONTENT = re.compile(r"(text\/.+)|(application\/(json|html|xhtml|xml|x-www-form-urlencoded))", re.IGNORECASE)
+JSON_CONTENT = re.compile(r"(json)|(text\/.+)", re.IGNORECASE)
 SENSITIVE_URL_PATHS = ["/dataservice/settings/configuration/smartaccountcredentials"]
 
 
@@ -66,25 +70,84 @@ def response_debug(response: Optional[Response], request: Union[Request, Prepare
             "elapsed-seconds": round(float(response.elapsed.microseconds) / 1000000, 3),
             "headers": dict(response.headers.items()),
         }
-        try:
-            json = response.json()
-
-            if isinstance(json, dict):
-                json.pop("header", None)
-
-            response_debug.update({"json": json})
-        except JSONDecodeError:
-            if response.encoding is not None:
-                if len(response.text) <= 1024:
-                    response_debug.update({"text": response.text})
+        if getattr(response, "_content", None) is False:
+            # streamed body (eg. file download) is not read yet, reading it here would load it into memory
+            response_debug.update({"content(streamed)": response.headers.get("content-length")})
+        else:
+            try:
+                json = response.json()
+
+                if isinstance(json, dict):
+                    json = {k: v for k, v in json.items() if k != "header"}  # json can be memoized, do not modify
+
+                response_debug.update({"json": json})
+            except JSONDecodeError:
+                if response.encoding is not None:
+                    if len(response.text) <= 1024:
+                        response_debug.update({"text": response.text})
+                    else:
+                        response_debug.update({"text(trimmed)": response.text[:1024]})
                 else:
-                    response_debug.update({"text(trimmed)": response.text[:1024]})
-            else:
-                response_debug.update({"text(cannot convert to string: unknown encoding)": None})
+                    response_debug.update({"text(cannot convert to string: unknown encoding)": None})
         debug_dict["response"] = response_debug
     return pformat(debug_dict, width=80, sort_dicts=False)
 
 
+@dataclass(frozen=True)
+class RequestTrace:
+    """Structured record of single request, cheap enough to be emitted for every request in production.
+    Unlike response_debug it never formats headers, reads body nor inspects call stack.
+
+    Attributes:
+        method (Optional[str]): HTTP method
+        path (str): url path (without query)
+        status (Optional[int]): response status code, None when no response was received
+        elapsed (Optional[float]): seconds between sending request and receiving response headers
+        request_bytes (Optional[int]): request body length
+        response_bytes (Optional[int]): response body length (Content-Length for not consumed streamed body)
+    """
+
+    method: Optional[str]
+    path: str
+    status: Optional[int]
+    elapsed: Optional[float]
+    request_bytes: Optional[int]
+    response_bytes: Optional[int]
+
+    @classmethod
+    def create(
+        cls, response: Optional[Response], request: Union[Request, PreparedRequest, None]
+    ) -> Optional["RequestTrace"]:
+        """Creates trace record from response (or request when there was no response)"""
+        _request = response.request if response is not None and request is None else request
+        if _request is None:
+            return None
+        status = elapsed = response_bytes = None
+        if response is not None:
+            status = response.status_code
+            elapsed = response.elapsed.total_seconds()
+            content = getattr(response, "_content", None)
+            response_bytes = len(content) if isinstance(content, bytes) else _content_length(response.headers)
+        return cls(
+            method=_request.method,
+            path=urlparse(_request.url or "").path,
+            status=status,
+            elapsed=elapsed,
+            request_bytes=_content_length(_request.headers),
+            response_bytes=response_bytes,
+        )
+
+    def __str__(self) -> str:
+        elapsed = "-" if self.elapsed is None else f"{self.elapsed:.3f}s"
+        sizes = f"sent={self.request_bytes} received={self.response_bytes}"
+        return f"{self.method} {self.path} <{self.status}> {elapsed} {sizes}"
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    length = headers.get("Content-Length") if headers else None
+    return int(length) if length is not None and str(length).isdigit() else None
+
+
 @with_proc_info_header
 def response_history_debug(response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> str:
     """Returns human readable string containing Request-Response history contents for given response.
@@ -120,6 +183,30 @@ def parse_cookies_to_dict(cookies: str) -> Dict[str, str]:
     return result
 
 
+_NOT_DECODED: Final[Any] = object()
+
+
+@lru_cache(maxsize=None)
+def _dataseq_adapter(cls: Type[BaseModelV2], sourcekey: Optional[str]) -> TypeAdapter:
+    """Validator of whole response body (or its sourcekey item) as a list or a single object of given model"""
+    items = Union[List[cls], cls]  # type: ignore[valid-type]
+    if sourcekey is None:
+        return TypeAdapter(items)
+    envelope = create_model(  # type: ignore[call-overload]
+        f"{cls.__name__}Envelope", sequence=(Optional[items], Field(default=None, alias=sourcekey))
+    )
+    return TypeAdapter(envelope)
+
+
+def _element_factory(cls: Type[T]) -> Callable[[Any], T]:
+    """Function creating Dataclass/BaseModel instance from decoded JSON object"""
+    if issubclass(cls, BaseModelV1):
+        return cls.parse_obj  # type: ignore
+    if issubclass(cls, BaseModelV2):
+        return cls.model_validate  # type: ignore
+    return partial(create_dataclass, cls)
+
+
 class JsonPayload:
     def __init__(self, json: Any = None):
         self.json = json
@@ -134,15 +221,53 @@ class JsonPayload:
 
 class ManagerResponse(Response, APIEndpointClientResponse):
     """Extends Response object with methods specific to vManage.
-    Object is meant to be created from aready received requests.Response"""
+    Object is meant to be created from aready received requests.Response
 
-    def __init__(self, response: Response):
+    JSON body is decoded lazily on first access and memoized, so it is decoded at most once
+    for all consumers (json(), payload, dataseq(), dataobj()). Given JSON codec is used for decoding
+    (defaults to standard library json used by requests). Body with non-JSON content type
+    (eg. file downloads) is never decoded into payload.
+    """
+
+    def __init__(self, response: Response, json_codec: Optional[JsonCodec] = None):
         self.__dict__.update(response.__dict__)
         self.jsessionid_expired = self._detect_expired_jsessionid()
-        try:
-            self.payload = JsonPayload(response.json())
-        except JSONDecodeError:
-            self.payload = JsonPayload()
+        self._decode_json = response.json  # decoding is delegated to wrapped response
+        self._json_codec = json_codec
+        self._json: Any = _NOT_DECODED
+        self._payload: Optional[JsonPayload] = None
+
+    @property
+    def payload(self) -> JsonPayload:
+        """JSON payload, decoded on first access"""
+        if self._payload is None:
+            json = None
+            if self.has_json_content():
+                try:
+                    json = self.json()
+                except JSONDecodeError:
+                    pass
+            self._payload = JsonPayload(json)
+        return self._payload
+
+    def json(self, **kwargs) -> Any:
+        """Returns decoded JSON body. Result is memoized unless custom decoding keyword arguments are given.
+
+        Raises:
+            JSONDecodeError: when body is not valid JSON
+        """
+        if kwargs:
+            return self._decode_json(**kwargs)
+        if self._json is _NOT_DECODED:
+            self._json = self._decode_json() if self._json_codec is None else self._json_codec.loads(self.content)
+        return self._json
+
+    def has_json_content(self) -> bool:
+        """Checks if response body can contain JSON based on content type header, missing header is permissive"""
+        content_type = self.headers.get("content-type")
+        if content_type is None:
+            return True
+        return JSON_CONTENT.search(content_type) is not None
 
     def _detect_expired_jsessionid(self) -> bool:
         """Determines if server sent expired JSESSIONID"""
@@ -151,7 +276,9 @@ class ManagerResponse(Response, APIEndpointClientResponse):
             # get current server time, when not present use local time
             # local time might be innacurate but "Expires" is usually set to year 1970
             response_date = self.headers.get("date")
-            compare_date = parsedate_to_datetime(response_date) if response_date is not None else datetime.now()
+            compare_date = (
+                parsedate_to_datetime(response_date) if response_date is not None else datetime.now(timezone.utc)
+            )
             if parsedate_to_datetime(expires) <= compare_date:
                 return True
         return False
@@ -175,16 +302,26 @@ class ManagerResponse(Response, APIEndpointClientResponse):
             return response_history_debug(self, None)
         return response_debug(self, None)
 
-    def dataseq(self, cls: Type[T], sourcekey: Optional[str] = "data") -> DataSequence[T]:
+    def dataseq(self, cls: Type[T], sourcekey: Optional[str] = "data", lazy: bool = False) -> DataSequence[T]:
         """Returns data contents from JSON payload parsed as DataSequence of Dataclass/BaseModel instances
         Args:
-            cls: Dataclass/BaseModelV1 subtype (eg. Devices)
+            cls: Dataclass/BaseModelV1/BaseModelV2 subtype (eg. Devices)
             sourcekey: name of the JSON key from response payload to be parsed. If None whole JSON payload will be used
+            lazy: when True, LazyDataSequence is returned and elements are parsed only when accessed
+
+        Pydantic v2 models are validated in one pass with cached TypeAdapter (directly from raw body when possible).
 
         Returns:
             DataSequence[T] of given type T which is subclassing from Dataclass/BaseModel,
             in case JSON payload was containing a single Object - sequence with one element is returned
         """
+        if (
+            not lazy
+            and issubclass(cls, BaseModelV2)
+            and (models := self._validate_sequence(cls, sourcekey)) is not None
+        ):
+            return DataSequence(cls, models)  # type: ignore
+
         if sourcekey is None:
             data = self.payload.json
         else:
@@ -195,11 +332,32 @@ class ManagerResponse(Response, APIEndpointClientResponse):
         else:
             sequence = [cast(dict, data)]
 
-        if issubclass(cls, BaseModelV1):
-            return DataSequence(cls, [cls.parse_obj(item) for item in sequence])  # type: ignore
-        if issubclass(cls, BaseModelV2):
-            return DataSequence(cls, [cls.model_validate(item) for item in sequence])  # type: ignore
-        return DataSequence(cls, [create_dataclass(cls, item) for item in sequence])
+        factory = _element_factory(cls)
+        if lazy:
+            return LazyDataSequence(cls, sequence, factory)
+        return DataSequence(cls, [factory(item) for item in sequence])
+
+    def _validate_sequence(self, cls: Type[BaseModelV2], sourcekey: Optional[str]) -> Optional[List[Any]]:
+        """Validates pydantic v2 models in one pass. When body was not decoded yet it is validated directly
+        from raw JSON without building intermediate dicts.
+
+        Returns:
+            list of models or None when validation failed (errors are then reported by per-item validation)
+        """
+        adapter = _dataseq_adapter(cls, sourcekey)
+        try:
+            content = getattr(self, "_content", None)  # False when body was not read
+            if self._json is _NOT_DECODED and isinstance(content, bytes) and self.has_json_content():
+                result = adapter.validate_json(content)
+            else:
+                result = adapter.validate_python(self.payload.json)
+        except ValidationError:
+            return None
+        if sourcekey is not None:
+            result = result.sequence
+        if result is None:
+            return None
+        return result if isinstance(result, list) else [result]
 
     def dataobj(self, cls: Type[T], sourcekey: Optional[str] = "data") -> T:
         """Returns data contents from JSON payload parsed as Dataclass/BaseModel instance
@@ -0,0 +1,336 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Opt-in cache of responses for slowly changing GET endpoints.
+
+Caching is enabled per endpoint with CachePolicy given to decorator and per session by assigning ResponseCache:
+>>> class MiscellaneousEndpoints(APIEndpoints):
+>>>     @get("/app/json/application_protocol.json", "data", cache=CachePolicy(ttl=3600))
+>>>     def get_application_protocols(self) -> DataSequence[ApplicationProtocolMap]:
+>>>         ...
+>>>
+>>> session.response_cache = ResponseCache(MemoryBackend(maxsize=512))
+
+Expired entries are revalidated with conditional request (If-None-Match / If-Modified-Since) when server supplied
+ETag or Last-Modified header, so unchanged content is not transferred again (server answers 304 Not Modified).
+Write endpoints can drop entries by tags given in CachePolicy: @delete(url, invalidates={"tiers"})
+
+Entries are keyed by server, user and tenant of session, so backend (eg. DiskBackend) can be shared between sessions
+without serving responses to other principals. Cookies set by server are not stored.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Mapping, Optional, Protocol, Tuple, Union
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from catalystwan.response import ManagerResponse
+from catalystwan.session_cache import session_cache_key
+
+logger = logging.getLogger(__name__)
+
+# response headers carrying session credentials (JSESSIONID cookie), never stored in cache
+UNCACHED_HEADERS = frozenset({"set-cookie", "set-cookie2"})
+
+
+def storable_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    return {name: value for name, value in headers.items() if name.lower() not in UNCACHED_HEADERS}
+
+
+def principal_of(client: Any) -> str:
+    """Identifies server, user and tenant of session (empty for clients without username)"""
+    username = getattr(client, "username", None)
+    if username is None:
+        return ""
+    return session_cache_key(getattr(client, "base_url", ""), username, getattr(client, "subdomain", None))
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Caching rules for endpoint
+
+    Attributes:
+        ttl (float): seconds for which response is served from cache without contacting server
+        revalidate (bool): after ttl, sends conditional request when response had ETag or Last-Modified header
+        tags (FrozenSet[str]): names used to invalidate entries (eg. by write endpoints)
+    """
+
+    ttl: float = 300.0
+    revalidate: bool = True
+    tags: FrozenSet[str] = frozenset()
+
+
+@dataclass
+class CachedResponse:
+    """Copy of response kept in cache"""
+
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    url: Optional[str]
+    encoding: Optional[str]
+    expires: float
+    tags: FrozenSet[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def create(cls, response: Response, policy: CachePolicy) -> CachedResponse:
+        return cls(
+            status_code=response.status_code,
+            headers=storable_headers(response.headers),
+            content=response.content,
+            url=response.url,
+            encoding=response.encoding,
+            expires=time() + policy.ttl,
+            tags=policy.tags,
+        )
+
+    def is_fresh(self) -> bool:
+        return time() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers"""
+        headers = {}
+        if etag := self.headers.get("ETag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_response(self) -> ManagerResponse:
+        response = Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url or ""
+        response.encoding = self.encoding
+        return ManagerResponse(response)
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def items(self) -> Iterator[Tuple[str, CachedResponse]]:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class MemoryBackend:
+    """In-memory LRU storage keeping at most maxsize entries"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            if (entry := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self) -> Iterator[Tuple[str, CachedResponse]]:
+        with self._lock:
+            return iter(list(self._entries.items()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """Storage keeping each entry in separate JSON file of given directory, entries survive process restart.
+
+    Directory is created with owner-only permissions and files are written readable by owner only.
+    Files owned or accessible by other users are not read.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{sha256(key.encode()).hexdigest()}.cache"
+
+    @staticmethod
+    def _encode(key: str, value: CachedResponse) -> bytes:
+        record = {
+            "key": key,
+            "status_code": value.status_code,
+            "headers": storable_headers(value.headers),
+            "content": b64encode(value.content).decode(),
+            "url": value.url,
+            "encoding": value.encoding,
+            "expires": value.expires,
+            "tags": sorted(value.tags),
+        }
+        return json.dumps(record).encode()
+
+    @staticmethod
+    def _read(path: Path) -> Optional[Tuple[str, CachedResponse]]:
+        try:
+            if os.name == "posix":
+                stat = path.stat()
+                if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+                    logger.warning(f"Cached response {path} is accessible by other users and will not be used")
+                    return None
+            record = json.loads(path.read_bytes())
+            entry = CachedResponse(
+                status_code=int(record["status_code"]),
+                headers=dict(record["headers"]),
+                content=b64decode(record["content"]),
+                url=record["url"],
+                encoding=record["encoding"],
+                expires=float(record["expires"]),
+                tags=frozenset(record["tags"]),
+            )
+            return str(record["key"]), entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        if (stored := self._read(self._path(key))) is None:
+            return None
+        stored_key, entry = stored
+        return entry if stored_key == key else None
+
+    def set(self, key: str, value: CachedResponse) -> None:
+        """Writes entry atomically, file is created with owner read/write permission only"""
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")  # created as 0o600
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self._encode(key, value))
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def items(self) -> Iterator[Tuple[str, CachedResponse]]:
+        for path in self.directory.glob("*.cache"):
+            if (stored := self._read(path)) is not None:
+                yield stored
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.cache"):
+            path.unlink(missing_ok=True)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+
+
+class ResponseCache:
+    """Per-session cache of responses of endpoints decorated with CachePolicy"""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend: CacheBackend = backend if backend is not None else MemoryBackend()
+        self.stats = CacheStats()
+        self._lock = Lock()
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None, principal: str = "") -> str:
+        """Entry key, principal (see principal_of) separates entries of sessions sharing backend"""
+        key = f"{principal} {method} {url}" if principal else f"{method} {url}"
+        if params:
+            return f"{key}?{urlencode(sorted(params.items()), doseq=True)}"
+        return key
+
+    def lookup(self, key: str) -> Tuple[Optional[CachedResponse], Optional[ManagerResponse]]:
+        """Returns cached entry and response when entry is fresh (no request needs to be sent)"""
+        entry = self.backend.get(key)
+        if entry is not None and entry.is_fresh():
+            self._count("hits")
+            return entry, entry.to_response()
+        return entry, None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse], policy: CachePolicy) -> Dict[str, str]:
+        """Headers of request revalidating expired entry"""
+        return entry.validators() if entry is not None and policy.revalidate else {}
+
+    def update(
+        self, key: str, policy: CachePolicy, entry: Optional[CachedResponse], response: ManagerResponse
+    ) -> ManagerResponse:
+        """Stores received response, or refreshes entry when server confirmed it is not modified"""
+        if entry is not None and response.status_code == 304:
+            entry.expires = time() + policy.ttl
+            self.backend.set(key, entry)
+            self._count("revalidations")
+            return entry.to_response()
+        self._count("misses")
+        if response.status_code == 200:
+            self.backend.set(key, CachedResponse.create(response, policy))
+        return response
+
+    def fetch(
+        self, key: str, policy: CachePolicy, send: Callable[[Dict[str, str]], ManagerResponse]
+    ) -> ManagerResponse:
+        """Returns cached response or sends request (with given conditional headers) and caches its response"""
+        entry, response = self.lookup(key)
+        if response is not None:
+            return response
+        return self.update(key, policy, entry, send(self.conditional_headers(entry, policy)))
+
+    def invalidate(self, *tags: str) -> None:
+        """Removes entries cached with any of given tags"""
+        if not tags:
+            return
+        for key, entry in self.backend.items():
+            if entry.tags.intersection(tags):
+                self.backend.delete(key)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+
+def cached_get(session: Any, url: str, policy: CachePolicy, params: Optional[Dict[str, Any]] = None) -> ManagerResponse:
+    """GET request (sent with ManagerSession) served from session.response_cache when it is enabled"""
+    cache = getattr(session, "response_cache", None)
+    if not isinstance(cache, ResponseCache):
+        return session.get(url, params=params)
+    return cache.fetch(
+        ResponseCache.key("GET", url, params, principal_of(session)),
+        policy,
+        lambda headers: session.get(url, params=params, headers=headers),
+    )
@@ -0,0 +1,109 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Declarative retry policies for requests sent by ManagerSession.
+
+Policy can be attached (from highest to lowest precedence) to single endpoint decorator,
+to APIEndpoints class or to session:
+>>> class ExampleAPI(APIEndpoints):
+>>>     retry_policy = RetryPolicy(max_attempts=3)  # all endpoints of the class
+>>>
+>>>     @post("/statistics/interface", retry=RetryPolicy(methods=IDEMPOTENT_METHODS | {"POST"}))
+>>>     def get_statistics(self, payload: Query) -> DataSequence[InterfaceStatistics]:
+>>>         ...
+>>>
+>>> session.retry_policy = RetryPolicy(max_elapsed_time=60)  # all other requests
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from random import random
+from time import time
+from typing import FrozenSet, Optional, Tuple, Type
+
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError, ConnectTimeout, Timeout
+
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (ConnectionError, Timeout, ChunkedEncodingError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter for transient request failures
+
+    Attributes:
+        max_attempts (int): maximum number of attempts (including first one)
+        initial_delay (float): seconds to wait before second attempt
+        multiplier (float): delay is multiplied by this value after each attempt
+        max_delay (float): maximum seconds to wait between attempts
+        jitter (float): fraction of delay which is randomized (0 disables jitter, 1 gives delay between 0 and backoff)
+        max_elapsed_time (Optional[float]): no new attempt is made when it would start later than given seconds
+            after first attempt
+        status_codes (FrozenSet[int]): HTTP error statuses which are retried
+        exceptions (Tuple[Type[BaseException], ...]): connection errors (raised by requests) which are retried
+        methods (FrozenSet[str]): HTTP methods which are safe to be sent again. Other methods are retried only
+            when request was rejected before processing (429 status or connection not established)
+        respect_retry_after (bool): waits for time given in Retry-After response header (capped by max_delay)
+    """
+
+    max_attempts: int = 3
+    initial_delay: float = 0.5
+    multiplier: float = 2.0
+    max_delay: float = 10.0
+    jitter: float = 0.5
+    max_elapsed_time: Optional[float] = 60.0
+    status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+
+    def is_retryable(self, method: str, error: ManagerRequestException) -> bool:
+        """Checks if request which failed with given error can be sent again"""
+        idempotent = method.upper() in self.methods
+        if isinstance(error, ManagerHTTPError):
+            status = getattr(error.response, "status_code", None)
+            return status in self.status_codes and (idempotent or status == 429)
+        cause = error.__cause__
+        if isinstance(cause, ConnectTimeout):
+            return True  # connection was not established so request did not reach server
+        return idempotent and isinstance(cause, self.exceptions)
+
+    def backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Seconds to wait after given failed attempt (counting from 1)"""
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        delay -= delay * self.jitter * random()
+        if self.respect_retry_after and (retry_after := _retry_after(response)) is not None:
+            delay = max(delay, min(self.max_delay, retry_after))
+        return delay
+
+    def next_delay(self, method: str, attempt: int, elapsed: float, error: ManagerRequestException) -> Optional[float]:
+        """Returns seconds to wait before next attempt or None when request should not be retried
+
+        Args:
+            method: HTTP method of failed request
+            attempt: number of failed attempt (counting from 1)
+            elapsed: seconds since first attempt was started
+            error: exception raised by failed attempt
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(method, error):
+            return None
+        delay = self.backoff(attempt, error.response)
+        if self.max_elapsed_time is not None and elapsed + delay > self.max_elapsed_time:
+            return None
+        return delay
+
+
+def _retry_after(response: Optional[Response]) -> Optional[float]:
+    """Parses Retry-After header given as seconds or HTTP date"""
+    if response is None or not (value := response.headers.get("Retry-After")):
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+    except (TypeError, ValueError):
+        return None
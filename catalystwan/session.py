@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from enum import Enum
 from pathlib import Path
+from threading import Lock, local
 from time import monotonic, sleep
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, Final, List, Optional, Union
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from packaging.version import Version  # type: ignore
@@ -16,10 +18,12 @@ from requests.exceptions import ConnectionError, HTTPError, RequestException
 
 from catalystwan import USER_AGENT
 from catalystwan.api.api_container import APIContainer
-from catalystwan.endpoints import APIEndpointClient
+from catalystwan.connection_pool import ManagerHTTPAdapter, PoolConfig, PoolStats
+from catalystwan.endpoints import APIEndpointClient, current_retry_policy
 from catalystwan.endpoints.client import AboutInfo, ServerInfo
 from catalystwan.endpoints.endpoints_container import APIEndpointContainter
 from catalystwan.exceptions import (
+    CatalystwanException,
     DefaultPasswordError,
     ManagerHTTPError,
     ManagerReadyTimeout,
@@ -27,13 +31,21 @@ from catalystwan.exceptions import (
     SessionNotCreatedError,
     TenantSubdomainNotFound,
 )
+from catalystwan.json_codec import JsonCodec, encode_json_kwarg
+from catalystwan.metrics import MetricsRegistry
 from catalystwan.models.tenant import Tenant
-from catalystwan.response import ManagerResponse, response_history_debug
+from catalystwan.rate_limit import RequestLimiter
+from catalystwan.response import ManagerResponse, RequestTrace, response_history_debug
+from catalystwan.response_cache import ResponseCache
+from catalystwan.retry import RetryPolicy
+from catalystwan.session_cache import CachedSession, SessionCache, session_cache_key
 from catalystwan.utils.session_type import SessionType
 from catalystwan.version import NullVersion, parse_api_version
 from catalystwan.vmanage_auth import vManageAuth
+from catalystwan.waiter import Backoff, Waiter
 
 JSON = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
+DOWNLOAD_CHUNK_SIZE: Final[int] = 1024 * 1024
 
 
 class UserMode(str, Enum):
@@ -77,6 +89,25 @@ def determine_session_type(
         return SessionType.NOT_DEFINED
 
 
+def create_base_url(url: str, port: Optional[int] = None) -> str:
+    """Creates base url based on ip address or domain and port if provided.
+
+    Args:
+        url (str): IP address or domain name
+        port (int): port
+
+    Returns:
+        str: Base url shared for every request.
+    """
+    parsed_url = urlparse(url)
+    netloc: str = parsed_url.netloc or parsed_url.path
+    scheme: str = parsed_url.scheme or "https"
+    base_url = urlunparse((scheme, netloc, "", None, None, None))
+    if port:
+        return f"{base_url}:{port}"
+    return base_url
+
+
 def create_manager_session(
     url: str,
     username: str,
@@ -84,6 +115,11 @@ def create_manager_session(
     port: Optional[int] = None,
     subdomain: Optional[str] = None,
     logger: Optional[logging.Logger] = None,
+    pool_config: Optional[PoolConfig] = None,
+    limiter: Optional[RequestLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    json_codec: Optional[JsonCodec] = None,
+    session_cache: Optional[SessionCache] = None,
 ) -> ManagerSession:
     """Factory method that creates session object and performs login according to parameters
 
@@ -95,11 +131,27 @@ def create_manager_session(
         subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
             works only on provider user mode
         logger: override default module logger
+        pool_config: connection pool options (eg. pool size matching number of threads sharing the session)
+        limiter: client-side request limiter shared by all threads (eg. TokenBucket, AdaptiveConcurrency)
+        retry_policy: retry policy for requests without policy defined by endpoint decorator or APIEndpoints class
+        json_codec: JSON codec for request payloads and responses (eg. OrjsonCodec), defaults to standard library json
+        session_cache: persistent cache of authenticated sessions (eg. FileSessionCache) reused by next processes
 
     Returns:
         ManagerSession: logged-in and operative session to perform tasks on SDWAN Manager.
     """
-    session = ManagerSession(url=url, username=username, password=password, port=port, subdomain=subdomain)
+    session = ManagerSession(
+        url=url,
+        username=username,
+        password=password,
+        port=port,
+        subdomain=subdomain,
+        pool_config=pool_config,
+        limiter=limiter,
+        retry_policy=retry_policy,
+        json_codec=json_codec,
+        session_cache=session_cache,
+    )
 
     if logger:
         session.logger = logger
@@ -110,8 +162,10 @@ def create_manager_session(
 
 
 class ManagerResponseAdapter(Session):
+    json_codec: Optional[JsonCodec] = None  # decodes JSON body of responses (requests stdlib decoding when None)
+
     def request(self, method, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().request(method, url, *args, **kwargs))
+        return ManagerResponse(super().request(method, url, *args, **kwargs), self.json_codec)
 
     def get(self, url, *args, **kwargs) -> ManagerResponse:
         return ManagerResponse(super().get(url, *args, **kwargs))
@@ -136,10 +190,23 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         port: port
         username: username
         password: password
+        pool_config: connection pool options, defaults to requests library pool settings
+        limiter: client-side request limiter shared by all threads (eg. TokenBucket, AdaptiveConcurrency)
+        retry_policy: retry policy for requests without policy defined by endpoint decorator or APIEndpoints class
+        json_codec: JSON codec for request payloads and responses (eg. OrjsonCodec), defaults to standard library json
+        session_cache: persistent cache of authenticated sessions, login reuses cached session accepted by server
+            and session is not logged out on close
+        adapter: connection pool adapter shared with other session (pool_config is ignored when given)
 
     Attributes:
         enable_relogin (bool): defaults to True, in case that session is not properly logged-in, session will try to
             relogin and try the same request again
+        pool_stats (PoolStats): counters of created, reused, discarded and expired connections
+        request_tracer (Optional[Callable[[RequestTrace], Any]]): called with RequestTrace record of each request,
+            eg. session.request_tracer = logging.getLogger("trace").info
+        metrics (Optional[MetricsRegistry]): when set, requests are aggregated into per-endpoint metrics
+        response_cache (Optional[ResponseCache]): when set, responses of endpoints with CachePolicy are cached
+        response_trace (Callable): formats request-response history logged when DEBUG level is enabled
     """
 
     on_session_create_hook: ClassVar[Callable[[ManagerSession], Any]] = lambda *args: None
@@ -153,6 +220,12 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         port: Optional[int] = None,
         subdomain: Optional[str] = None,
         auth: Optional[AuthBase] = None,
+        pool_config: Optional[PoolConfig] = None,
+        limiter: Optional[RequestLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
+        session_cache: Optional[SessionCache] = None,
+        adapter: Optional[ManagerHTTPAdapter] = None,
     ):
         self.url = url
         self.port = port
@@ -167,14 +240,28 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         self.response_trace: Callable[
             [Optional[Response], Union[Request, PreparedRequest, None]], str
         ] = response_history_debug
+        self.request_tracer: Optional[Callable[[RequestTrace], Any]] = None
+        self.metrics: Optional[MetricsRegistry] = None
+        self.response_cache: Optional[ResponseCache] = None
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.json_codec = json_codec
+        self.session_cache = session_cache
+        self._cached_session: Optional[CachedSession] = None
         super(ManagerSession, self).__init__()
         self.headers.update({"User-Agent": USER_AGENT})
+        self._adapter = adapter or ManagerHTTPAdapter(pool_config or PoolConfig(), PoolStats())
+        self.pool_config = self._adapter.pool_config
+        self.pool_stats = self._adapter.pool_stats
         self.__prepare_session(verify, auth)
         self.api = APIContainer(self)
         self.endpoints = APIEndpointContainter(self)
         self._platform_version: str = ""
         self._api_version: Version
         self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
+        self._login_lock = Lock()
+        self._login_generation: int = 0
+        self._login_context = local()
         self.restart_timeout: int = 1200
         self.polling_requests_timeout: int = 10
 
@@ -226,19 +313,38 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         """
 
         self.cookies.clear_session_cookies()
-        self.auth = vManageAuth(self.base_url, self.username, self.password, verify=False)
+        if self.session_cache is not None and self.__restore_cached_session(self.session_cache):
+            return self
+        self.auth = vManageAuth(self.base_url, self.username, self.password, verify=False, session=self._auth_session)
         self.auth.logger = self.logger
 
-        if self.subdomain:
-            tenant_id = self.get_tenant_id()
-            vsession_id = self.get_virtual_session_id(tenant_id)
-            self.headers.update({"VSessionId": vsession_id})
+        self._login_context.in_progress = True
         try:
-            server_info = self.server()
-        except DefaultPasswordError:
-            server_info = ServerInfo.parse_obj({})
+            if self.subdomain:
+                tenant_id = self.get_tenant_id()
+                vsession_id = self.get_virtual_session_id(tenant_id)
+                self.headers.update({"VSessionId": vsession_id})
+            try:
+                server_info = self.server()
+            except DefaultPasswordError:
+                server_info = ServerInfo.parse_obj({})
+        finally:
+            self._login_context.in_progress = False
+
+        self.__apply_server_info(server_info)
+        self.logger.info(
+            f"Logged to vManage({self.platform_version}) as {self.username}. The session type is {self.session_type}"
+        )
+        self.cookies.set("JSESSIONID", self.auth.set_cookie.get("JSESSIONID"))
+        if self.session_cache is not None:
+            self.__store_cached_session(self.session_cache, server_info)
+        self._login_generation += 1
+        return self
 
+    def __apply_server_info(self, server_info: ServerInfo) -> None:
+        """Determines session type from server info"""
         self.server_name = server_info.server
+        self.platform_version = server_info.platform_version
 
         tenancy_mode = server_info.tenancy_mode
         user_mode = server_info.user_mode
@@ -256,24 +362,87 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                 f"tenancy-mode: {tenancy_mode}, user-mode: {user_mode}, view-mode: {view_mode}"
             )
 
-        self.logger.info(
-            f"Logged to vManage({self.platform_version}) as {self.username}. The session type is {self.session_type}"
+    @property
+    def session_cache_key(self) -> str:
+        return session_cache_key(self.base_url, self.username, self.subdomain)
+
+    def __restore_cached_session(self, cache: SessionCache) -> bool:
+        """Reuses cached session when server still accepts it (session which has just expired is not reused)
+
+        Returns:
+            bool: True when cached session was restored
+        """
+        cached = cache.load(self.session_cache_key)
+        if cached is None or (
+            self._cached_session is not None and cached.jsessionid == self._cached_session.jsessionid
+        ):
+            return False
+        self.auth = vManageAuth(self.base_url, self.username, self.password, verify=False, session=self._auth_session)
+        self.auth.logger = self.logger
+        self.auth.set_cookie.set("JSESSIONID", cached.jsessionid)
+        self.auth.token = cached.token
+        self.cookies.set("JSESSIONID", cached.jsessionid)
+        if cached.vsession_id:
+            self.headers.update({"VSessionId": cached.vsession_id})
+
+        self._login_context.in_progress = True
+        try:
+            valid = self.__probe_session()
+        finally:
+            self._login_context.in_progress = False
+        if not valid:
+            self.logger.debug("Cached session is not accepted by server, logging in")
+            cache.delete(self.session_cache_key)
+            self.cookies.clear_session_cookies()
+            self.headers.pop("VSessionId", None)
+            return False
+
+        self._cached_session = cached
+        self.__apply_server_info(ServerInfo.parse_obj(cached.server_info))
+        self.logger.info(f"Reused cached session to vManage({self.platform_version}) as {self.username}.")
+        self._login_generation += 1
+        return True
+
+    def __probe_session(self) -> bool:
+        """Sends cheap authenticated request to check whether session is still valid"""
+        try:
+            response = self.get("/dataservice/client/about")
+        except CatalystwanException:
+            return False
+        return not response.jsessionid_expired and "json" in response.headers.get("Content-Type", "")
+
+    def __store_cached_session(self, cache: SessionCache, server_info: ServerInfo) -> None:
+        if not isinstance(self.auth, vManageAuth) or not (jsessionid := self.auth.set_cookie.get("JSESSIONID")):
+            return
+        vsession_id = self.headers.get("VSessionId")
+        self._cached_session = CachedSession(
+            jsessionid=jsessionid,
+            token=self.auth.token,
+            server_info=server_info.dict(by_alias=True),
+            vsession_id=str(vsession_id) if vsession_id else None,
         )
-        self.cookies.set("JSESSIONID", self.auth.set_cookie.get("JSESSIONID"))
-        return self
+        try:
+            cache.store(self.session_cache_key, self._cached_session)
+        except OSError as error:
+            self.logger.warning(f"Cannot store session in cache: {error!r}")
+
+    def _relogin(self, generation: int) -> None:
+        """Performs single login for all threads which detected expired session with the same login generation,
+        threads waiting for the lock will just retry their requests with new session when login is completed"""
+        with self._login_lock:
+            if generation == self._login_generation:
+                self.state = ManagerSessionState.LOGIN
 
     def wait_server_ready(self, timeout: int, poll_period: int = 10) -> None:
-        """Waits until server is ready for API requests with given timeout in seconds"""
+        """Waits until server is ready for API requests with given timeout in seconds.
+        Server is polled with delays growing up to twice the poll_period, so restarts shorter than
+        poll_period are detected quickly and long restarts are not flooded with requests."""
 
-        begin = monotonic()
         self.logger.info(f"Waiting for server ready with timeout {timeout} seconds.")
-
-        def elapsed() -> float:
-            return monotonic() - begin
+        waiter = Waiter(timeout, Backoff.from_interval(poll_period))
 
         # wait for http available
-        while elapsed() < timeout:
-            available = False
+        def http_available() -> bool:
             try:
                 resp = head(
                     self.base_url,
@@ -281,19 +450,18 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=False,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
-                if resp.status_code != 503:
-                    available = True
             except ConnectionError as error:
-                self.logger.debug(self.response_trace(error.response, error.request))
-            if not available:
-                sleep(poll_period)
-                continue
-            break
+                self._trace(error.response, error.request)
+                return False
+            self._trace(resp, None)
+            return resp.status_code != 503
+
+        available = waiter.wait(http_available, until=bool)
 
         # wait server ready flag
         server_ready_url = self.get_full_url("/dataservice/client/server/ready")
-        while elapsed() < timeout:
+
+        def server_ready() -> bool:
             try:
                 resp = get(
                     server_ready_url,
@@ -301,38 +469,97 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=False,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
-                if resp.status_code == 200:
-                    if resp.json().get("isServerReady") is True:
-                        self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
-                        return
-                sleep(poll_period)
-                continue
             except RequestException as exception:
-                self.logger.debug(self.response_trace(exception.response, exception.request))
+                self._trace(exception.response, exception.request)
                 raise ManagerRequestException(request=exception.request, response=exception.response)
+            self._trace(resp, None)
+            return resp.status_code == 200 and resp.json().get("isServerReady") is True
+
+        if available.satisfied:
+            ready = waiter.wait(server_ready, until=bool)
+            if ready.satisfied:
+                self.logger.debug(f"Waiting for server ready took: {available.elapsed + ready.elapsed} seconds.")
+                return
 
         raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
 
+    def _trace(self, response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> None:
+        """Passes RequestTrace record to request_tracer and metrics and logs request-response history.
+        History is formatted only when logger is enabled for DEBUG level, as it is expensive.
+        """
+        if self.request_tracer is not None or self.metrics is not None:
+            if (record := RequestTrace.create(response, request)) is not None:
+                if self.metrics is not None:
+                    self.metrics.observe(record)
+                if self.request_tracer is not None:
+                    self.request_tracer(record)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self.response_trace(response, request))
+
+    def __send(self, method, url, *args, **kwargs) -> ManagerResponse:
+        """Sends request, waiting for limiter when configured"""
+        if self.limiter is None:
+            return super(ManagerSession, self).request(method, url, *args, **kwargs)
+        self.limiter.acquire()
+        status: Optional[int] = None
+        elapsed: Optional[float] = None
+        try:
+            response = super(ManagerSession, self).request(method, url, *args, **kwargs)
+            status, elapsed = response.status_code, response.elapsed.total_seconds()
+            return response
+        finally:
+            self.limiter.release(status, elapsed)
+
     def request(self, method, url, *args, **kwargs) -> ManagerResponse:
+        if self.json_codec is not None:
+            kwargs = encode_json_kwarg(kwargs, self.json_codec)
+        policy = current_retry_policy.get() or self.retry_policy
+        if policy is None:
+            return self.__request(method, url, *args, **kwargs)
+        begin = monotonic()
+        attempt = 1
+        while True:
+            try:
+                return self.__request(method, url, *args, **kwargs)
+            except ManagerRequestException as error:
+                if (delay := policy.next_delay(method, attempt, monotonic() - begin, error)) is None:
+                    raise
+                self.logger.warning(f"Request {method} {url} failed ({error}), retrying in {delay:.2f} seconds")
+                if self.metrics is not None:
+                    self.metrics.increment(method, urlparse(self.get_full_url(url)).path, "retries")
+                sleep(delay)
+                attempt += 1
+
+    def __request(self, method, url, *args, **kwargs) -> ManagerResponse:
+        """Sends single request handling server restart and relogin"""
         full_url = self.get_full_url(url)
+        generation = self._login_generation
         try:
-            response = super(ManagerSession, self).request(method, full_url, *args, **kwargs)
-            self.logger.debug(self.response_trace(response, None))
+            response = self.__send(method, full_url, *args, **kwargs)
+            self._trace(response, None)
             if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
                 self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
         except RequestException as exception:
-            self.logger.debug(self.response_trace(exception.response, exception.request))
+            self._trace(exception.response, exception.request)
             if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(exception, ConnectionError):
                 self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
-                return self.request(method, url, *args, **kwargs)
+                if self.metrics is not None:
+                    self.metrics.increment(method, urlparse(full_url).path, "retries")
+                return self.__request(method, url, *args, **kwargs)
             self.logger.debug(exception)
-            raise ManagerRequestException(request=exception.request, response=exception.response)
-
-        if self.enable_relogin and response.jsessionid_expired and self.state == ManagerSessionState.OPERATIVE:
+            raise ManagerRequestException(request=exception.request, response=exception.response) from exception
+
+        if (
+            self.enable_relogin
+            and response.jsessionid_expired
+            and self.state in (ManagerSessionState.OPERATIVE, ManagerSessionState.LOGIN)
+            and not getattr(self._login_context, "in_progress", False)
+        ):
             self.logger.warning("Logging to session. Reason: expired JSESSIONID detected in response headers")
-            self.state = ManagerSessionState.LOGIN
-            return self.request(method, url, *args, **kwargs)
+            if self.metrics is not None:
+                self.metrics.increment(method, urlparse(full_url).path, "relogins")
+            self._relogin(generation)
+            return self.__request(method, url, *args, **kwargs)
 
         if response.request.url and "passwordReset.html" in response.request.url:
             raise DefaultPasswordError("Password must be changed to use this session.")
@@ -355,13 +582,7 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         Returns:
             str: Base url shared for every request.
         """
-        url = urlparse(self.url)
-        netloc: str = url.netloc or url.path
-        scheme: str = url.scheme or "https"
-        base_url = urlunparse((scheme, netloc, "", None, None, None))
-        if self.port:
-            return f"{base_url}:{self.port}"
-        return base_url
+        return create_base_url(self.url, self.port)
 
     def about(self) -> AboutInfo:
         return self.endpoints.client.about()
@@ -378,24 +599,100 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         response = self.get(url)
         return response.json()
 
-    def get_file(self, url: str, filename: Path) -> Response:
+    def get_file(
+        self,
+        url: str,
+        filename: Path,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        resume: bool = False,
+        retries: int = 0,
+        checksum: Optional[str] = None,
+        progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Response:
         """Get a file using session get.
 
+        Content is streamed to the file in chunks, so memory usage does not depend on the file size.
+        Interrupted transfer can be continued with HTTP Range request (when server supports it).
+
         Args:
             url: dataservice api.
             filename: Filename to write download file to.
+            chunk_size: Number of bytes read from connection and written to file at once.
+            resume: Continue download of partially downloaded file instead of overwriting it.
+            retries: Number of attempts to continue transfer interrupted by connection error.
+            checksum: Name of hashlib algorithm (eg. "sha256") used to compute checksum of downloaded file.
+            progress: Callback called after each written chunk with number of bytes already in file
+                and total file size (None when server does not report it).
 
         Returns:
-            http response.
+            http response, with hexdigest of downloaded file stored in `checksum` attribute when requested.
+            Response status is 416 when resumed file was already complete.
 
         Example usage:
             response = self.session.get_file(url, filename)
 
         """
-        with self.get(url) as response:
-            with open(filename, "wb") as file:
-                file.write(response.content)
-        return response
+        filename = Path(filename)
+        response: Response
+        attempt = 0
+        while True:
+            offset = filename.stat().st_size if (resume or attempt) and filename.exists() else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else None
+            try:
+                with self.get(url, stream=True, headers=headers) as response:
+                    if response.status_code != 206:
+                        offset = 0  # server sent whole file
+                    hasher = self.__file_hasher(checksum, filename, offset)
+                    total = self.__content_total(response, offset)
+                    with open(filename, "ab" if offset else "wb") as file:
+                        written = offset
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            file.write(chunk)
+                            written += len(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            if progress is not None:
+                                progress(written, total)
+            except ManagerHTTPError as error:
+                if offset and error.response is not None and error.response.status_code == 416:
+                    response = error.response  # requested range starts at the end of already complete file
+                    hasher = self.__file_hasher(checksum, filename, offset)
+                else:
+                    raise
+            except (ManagerRequestException, RequestException) as error:
+                if attempt >= retries:
+                    raise
+                attempt += 1
+                self.logger.warning(f"Download of {url} interrupted ({error}), resuming (attempt {attempt}/{retries})")
+                if self.metrics is not None:
+                    self.metrics.increment("GET", urlparse(self.get_full_url(url)).path, "retries")
+                continue
+            if hasher is not None:
+                response.checksum = hasher.hexdigest()  # type: ignore[attr-defined]
+            return response
+
+    @staticmethod
+    def __file_hasher(algorithm: Optional[str], filename: Path, offset: int) -> Optional[Any]:
+        """Creates hashlib object updated with first offset bytes of already downloaded file"""
+        if algorithm is None:
+            return None
+        hasher = hashlib.new(algorithm)
+        if offset:
+            with open(filename, "rb") as file:
+                while offset > 0 and (chunk := file.read(min(offset, DOWNLOAD_CHUNK_SIZE))):
+                    hasher.update(chunk)
+                    offset -= len(chunk)
+        return hasher
+
+    @staticmethod
+    def __content_total(response: Response, offset: int) -> Optional[int]:
+        """Total size of downloaded file taken from Content-Range or Content-Length header"""
+        if content_range := response.headers.get("content-range"):
+            total = content_range.rpartition("/")[2]
+            return int(total) if total.isdigit() else None
+        if (length := response.headers.get("content-length", "")).isdigit():
+            return offset + int(length)
+        return None
 
     def get_tenant_id(self) -> str:
         """Gets tenant UUID for its subdomain.
@@ -427,6 +724,8 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
 
     def logout(self) -> Optional[ManagerResponse]:
         response = None
+        if self.session_cache is not None:
+            self.session_cache.delete(self.session_cache_key)
         if isinstance((version := self.api_version), NullVersion):
             self.logger.warning("Cannot perform logout operation without known api_version.")
             return response
@@ -454,13 +753,22 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         Note: It is generally recommended to use the session as a context manager
         using the `with` statement, which ensures that the session is properly
         closed and resources are cleaned up even in case of exceptions.
+        Session using session cache is not logged out, so server-side session can be reused by next process.
         """
-        self.logout()
+        if self.session_cache is None:
+            self.logout()
         super().close()
 
     def __prepare_session(self, verify: bool, auth: Optional[AuthBase]) -> None:
         self.auth = auth
         self.verify = verify
+        self.mount("https://", self._adapter)
+        self.mount("http://", self._adapter)
+        # authentication requests are sent without session auth and cookies but reuse pooled connections
+        self._auth_session = Session()
+        self._auth_session.headers.update({"User-Agent": USER_AGENT})
+        self._auth_session.mount("https://", self._adapter)
+        self._auth_session.mount("http://", self._adapter)
 
     @property
     def session_type(self) -> SessionType:
@@ -0,0 +1,151 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Persistent cache of authenticated sessions shared by processes (eg. scripts started by cron).
+
+Each login performs authentication handshake (/j_security_check, /dataservice/client/token) and fetches server info,
+and each logged-in session counts against server limit of concurrent sessions. When ManagerSession is created
+with session cache, JSESSIONID, XSRF token, VSessionId and server info of the last login are stored on disk
+and next session with the same url, username and subdomain reuses them after cheap probe request.
+Expired sessions are transparently replaced with new login (and stored again):
+>>> cache = FileSessionCache(encryption_key=key)  # key created with FileSessionCache.generate_key()
+>>> with create_manager_session(url, username, password, session_cache=cache) as session:
+>>>     session.api.devices.get()
+
+Sessions using cache are not logged out on close (server-side session is kept for next process),
+session.logout() logs out and removes cached entry.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "catalystwan" / "sessions"
+
+
+def session_cache_key(base_url: str, username: str, subdomain: Optional[str] = None) -> str:
+    """Cache key identifying session by server url, username and tenant subdomain (credentials are not part of key)"""
+    return hashlib.sha256(f"{base_url}\n{username}\n{subdomain or ''}".encode()).hexdigest()
+
+
+@dataclass
+class CachedSession:
+    """Authentication state of logged-in session
+
+    Attributes:
+        jsessionid (str): session cookie
+        token (str): XSRF token
+        server_info (Dict[str, Any]): /client/server response data (includes platform version)
+        vsession_id (Optional[str]): VSessionId of provider-as-tenant session
+        created (float): unix time when session was logged in
+    """
+
+    jsessionid: str
+    token: str
+    server_info: Dict[str, Any] = field(default_factory=dict)
+    vsession_id: Optional[str] = None
+    created: float = field(default_factory=time)
+
+
+class SessionCache(ABC):
+    """Base class for session caches (eg. to store sessions in keyring or shared database)"""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[CachedSession]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def store(self, key: str, session: CachedSession) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class FileSessionCache(SessionCache):
+    """Stores each session in separate file readable only by its owner, optionally encrypted.
+
+    Args:
+        directory: cache directory (created with owner-only permissions when missing)
+        encryption_key: Fernet key used to encrypt cached sessions (requires cryptography package,
+            pip install catalystwan[crypto])
+        max_age: seconds after which cached session is not reused, by default sessions are reused
+            as long as server accepts them
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        encryption_key: Optional[bytes] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.directory = Path(directory) if directory is not None else DEFAULT_CACHE_DIR
+        self.max_age = max_age
+        self._fernet: Any = None
+        if encryption_key is not None:
+            from cryptography.fernet import Fernet  # type: ignore
+
+            self._fernet = Fernet(encryption_key)
+
+    @staticmethod
+    def generate_key() -> bytes:
+        """Generates new encryption key (requires cryptography package)"""
+        from cryptography.fernet import Fernet  # type: ignore
+
+        return Fernet.generate_key()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.session"
+
+    def load(self, key: str) -> Optional[CachedSession]:
+        path = self.path(key)
+        try:
+            if os.name == "posix" and path.stat().st_mode & 0o077:
+                logger.warning(f"Cached session {path} is accessible by other users and will not be used")
+                return None
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            if self._fernet is not None:
+                content = self._fernet.decrypt(content)
+            session = CachedSession(**json.loads(content))
+        except Exception as error:
+            logger.warning(f"Cannot read cached session {path}: {error!r}")
+            self.delete(key)
+            return None
+        if self.max_age is not None and time() - session.created > self.max_age:
+            self.delete(key)
+            return None
+        return session
+
+    def store(self, key: str, session: CachedSession) -> None:
+        """Writes session atomically, file is created with owner read/write permission only"""
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        content = json.dumps(asdict(session)).encode()
+        if self._fernet is not None:
+            content = self._fernet.encrypt(content)
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")  # created as 0o600
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,377 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Provider-as-tenant sessions for many tenants sharing single provider login.
+
+Session created with create_manager_session(..., subdomain=...) performs its own login, fetches whole tenant list
+to find tenant ID and opens its own connection pool. TenantSessionPool logs in once as provider, caches tenant list
+and VSessionIds, and creates lightweight per-tenant views. Views send requests over provider connections
+and cookies, only VSessionId header differs:
+>>> with create_tenant_session_pool(url, username, password) as pool:
+>>>     devices = pool.map(lambda tenant: tenant.api.devices.get())  # {subdomain: DataSequence[Device]}
+>>>     templates = pool.session("tenant1").api.templates.get(DeviceTemplate)
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from requests import PreparedRequest
+from requests.auth import AuthBase
+
+from catalystwan.connection_pool import PoolConfig
+from catalystwan.exceptions import ManagerHTTPError, SessionNotCreatedError, TenantSubdomainNotFound
+from catalystwan.fan_out import DEFAULT_MAX_WORKERS
+from catalystwan.json_codec import JsonCodec
+from catalystwan.models.tenant import Tenant
+from catalystwan.rate_limit import RequestLimiter
+from catalystwan.response import ManagerResponse
+from catalystwan.retry import RetryPolicy
+from catalystwan.session import ManagerSession, create_manager_session
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.session_type import SessionType
+
+T = TypeVar("T")
+
+# status codes returned for requests with expired or invalidated VSessionId
+VSESSION_EXPIRED_STATUS: Final[Tuple[int, ...]] = (401, 403)
+
+
+class VirtualSession(NamedTuple):
+    """VSessionId obtained by provider session for given tenant
+
+    Attributes:
+        vsession_id (str): value of VSessionId header
+        provider_generation (int): provider login generation in which VSessionId was obtained
+        created (float): monotonic time when VSessionId was obtained
+    """
+
+    vsession_id: str
+    provider_generation: int
+    created: float
+
+
+class _ProviderAuth(AuthBase):
+    """Authenticates requests with current auth of provider session (which is replaced on each provider login)"""
+
+    def __init__(self, provider: ManagerSession):
+        self.provider = provider
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        if callable(auth := self.provider.auth):
+            return auth(request)
+        return request
+
+
+class TenantSession(ManagerSession):
+    """Provider-as-tenant view of TenantSessionPool, created with TenantSessionPool.session(subdomain).
+
+    View shares connection pool, cookies and authentication of provider session and sends VSessionId
+    of its tenant with each request. VSessionId is obtained on first request and obtained again when it expires
+    (server responds with 401/403 or VSessionId is older than pool vsession_ttl). When provider session expires,
+    provider logs in once for all views. Logout and close of the view do not affect provider session.
+    """
+
+    def __init__(self, pool: TenantSessionPool, subdomain: str):
+        provider = pool.provider
+        super().__init__(
+            url=provider.url,
+            username=provider.username,
+            password=provider.password,
+            port=provider.port,
+            subdomain=subdomain,
+            auth=_ProviderAuth(provider),
+            limiter=provider.limiter,
+            retry_policy=provider.retry_policy,
+            json_codec=provider.json_codec,
+            adapter=provider._adapter,
+        )
+        self._pool = pool
+        self._virtual_session: Optional[VirtualSession] = None
+        self._switch_lock = Lock()
+        self.logger = provider.logger
+        self.metrics = provider.metrics
+        self.request_tracer = provider.request_tracer
+        self.cookies = provider.cookies
+        self._session_type = SessionType.PROVIDER_AS_TENANT
+        self.server_name = provider.server_name
+        self.platform_version = provider.platform_version
+
+    @property
+    def virtual_session(self) -> Optional[VirtualSession]:
+        return self._virtual_session
+
+    def _switch_view(self, stale: Optional[VirtualSession]) -> VirtualSession:
+        """Sets VSessionId of tenant, obtaining new one when given VSessionId is the one currently cached by pool"""
+        with self._switch_lock:
+            current = self._virtual_session
+            if current is None or current is stale:
+                current = self._virtual_session = self._pool.virtual_session(self.subdomain or "", stale)
+                self.headers["VSessionId"] = current.vsession_id
+            return current
+
+    def login(self) -> TenantSession:
+        """Performs provider login (once for all views with expired provider session) and obtains new VSessionId
+
+        Returns:
+            TenantSession: (self)
+        """
+        stale = self._virtual_session
+        if stale is not None:
+            self._pool.provider._relogin(stale.provider_generation)
+        self._switch_view(stale)
+        self.server_name = self._pool.provider.server_name
+        self.platform_version = self._pool.provider.platform_version
+        self._login_generation += 1
+        return self
+
+    def request(self, method, url, *args, **kwargs) -> ManagerResponse:
+        virtual_session = self._virtual_session
+        if virtual_session is None or self._pool.is_expired(virtual_session):
+            virtual_session = self._switch_view(virtual_session)
+        try:
+            return super().request(method, url, *args, **kwargs)
+        except ManagerHTTPError as error:
+            if error.response is None or error.response.status_code not in VSESSION_EXPIRED_STATUS:
+                raise
+            self.logger.warning(f"Request {method} {url} rejected for VSessionId of {self.subdomain}, switching again")
+            self._switch_view(virtual_session)
+            return super().request(method, url, *args, **kwargs)
+
+    def logout(self) -> Optional[ManagerResponse]:
+        """Views do not log out, provider session is closed with TenantSessionPool.close()"""
+        return None
+
+    def close(self) -> None:
+        """Views do not own connections, provider session is closed with TenantSessionPool.close()"""
+        pass
+
+
+class TenantSessionPool:
+    """Per-tenant views of single provider session.
+
+    Tenant list and VSessionIds are fetched once and cached (VSessionIds are obtained again when they expire
+    or provider logs in again). Views are created on first use and can be used concurrently from many threads.
+
+    Args:
+        provider: logged-in provider session
+        vsession_ttl: seconds after which VSessionId is obtained again before sending request,
+            by default VSessionId is obtained again only when server rejects it
+        max_workers: default maximum number of tenants processed at the same time by map
+
+    Raises:
+        SessionNotCreatedError: given session is not provider session
+    """
+
+    def __init__(
+        self, provider: ManagerSession, vsession_ttl: Optional[float] = None, max_workers: int = DEFAULT_MAX_WORKERS
+    ):
+        if provider.session_type is not SessionType.PROVIDER:
+            raise SessionNotCreatedError(
+                f"Tenant session pool requires provider session, {provider} session type is {provider.session_type}"
+            )
+        self.provider = provider
+        self.vsession_ttl = vsession_ttl
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(__name__)
+        self._tenants: Optional[DataSequence[Tenant]] = None
+        self._tenants_lock = Lock()
+        self._virtual_sessions: Dict[str, VirtualSession] = {}
+        self._virtual_session_locks: Dict[str, Lock] = {}
+        self._sessions: Dict[str, TenantSession] = {}
+        self._sessions_lock = Lock()
+
+    @property
+    def tenants(self) -> DataSequence[Tenant]:
+        """Tenants of provider, fetched on first access"""
+        if (tenants := self._tenants) is None:
+            with self._tenants_lock:
+                if (tenants := self._tenants) is None:
+                    tenants = self._tenants = self._fetch_tenants()
+        return tenants
+
+    def refresh_tenants(self) -> DataSequence[Tenant]:
+        """Fetches tenant list again (eg. after tenants were created or deleted)"""
+        with self._tenants_lock:
+            tenants = self._tenants = self._fetch_tenants()
+        return tenants
+
+    def _fetch_tenants(self) -> DataSequence[Tenant]:
+        return self.provider.get("dataservice/tenant").dataseq(Tenant).index_by("subdomain")
+
+    def tenant(self, subdomain: str) -> Tenant:
+        """Gets tenant by subdomain, tenant list is fetched again once when subdomain is not found
+
+        Raises:
+            TenantSubdomainNotFound: tenant with given subdomain does not exist
+        """
+        tenant = self.tenants.get_by(subdomain=subdomain)
+        if tenant is None:
+            tenant = self.refresh_tenants().get_by(subdomain=subdomain)
+        if tenant is None or not tenant.tenant_id:
+            raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {subdomain} not found")
+        return tenant
+
+    def is_expired(self, virtual_session: VirtualSession) -> bool:
+        """Checks whether VSessionId was obtained before last provider login or is older than vsession_ttl"""
+        if virtual_session.provider_generation != self.provider._login_generation:
+            return True
+        return self.vsession_ttl is not None and monotonic() - virtual_session.created > self.vsession_ttl
+
+    def virtual_session(self, subdomain: str, stale: Optional[VirtualSession] = None) -> VirtualSession:
+        """Gets cached VSessionId of tenant, new VSessionId is obtained when there is none,
+        cached one is expired or it is the same as given stale VSessionId (rejected by server).
+        Concurrent calls for the same tenant obtain single VSessionId.
+        """
+        with self._virtual_session_locks.setdefault(subdomain, Lock()):
+            current = self._virtual_sessions.get(subdomain)
+            if current is None or current is stale or self.is_expired(current):
+                tenant_id = self.tenant(subdomain).tenant_id or ""
+                generation = self.provider._login_generation
+                current = VirtualSession(self.provider.get_virtual_session_id(tenant_id), generation, monotonic())
+                self._virtual_sessions[subdomain] = current
+                self.logger.debug(f"Obtained VSessionId for {subdomain}")
+            return current
+
+    def session(self, subdomain: str) -> TenantSession:
+        """Gets view of tenant with given subdomain (no request is sent until view is used)"""
+        if (session := self._sessions.get(subdomain)) is None:
+            with self._sessions_lock:
+                if (session := self._sessions.get(subdomain)) is None:
+                    session = self._sessions[subdomain] = TenantSession(self, subdomain)
+        return session
+
+    def sessions(self, subdomains: Optional[Iterable[str]] = None) -> List[TenantSession]:
+        """Gets views of given tenants (all tenants by default)"""
+        if subdomains is None:
+            subdomains = [tenant.subdomain for tenant in self.tenants]
+        return [self.session(subdomain) for subdomain in subdomains]
+
+    @overload
+    def map(
+        self,
+        func: Callable[[TenantSession], T],
+        subdomains: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        return_exceptions: Literal[False] = False,
+    ) -> Dict[str, T]:
+        ...
+
+    @overload
+    def map(
+        self,
+        func: Callable[[TenantSession], T],
+        subdomains: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+        return_exceptions: Literal[True] = True,
+    ) -> Dict[str, Union[T, Exception]]:
+        ...
+
+    def map(self, func, subdomains=None, max_workers=None, return_exceptions=False):
+        """Calls func with view of each tenant concurrently
+
+        Args:
+            func: operation performed for single tenant
+            subdomains: tenants to be processed, all tenants by default
+            max_workers: maximum number of tenants processed at the same time, defaults to pool max_workers
+            return_exceptions: store exceptions raised by func as results instead of raising first of them
+
+        Returns:
+            results of func by tenant subdomain (in order of given subdomains)
+
+        Raises:
+            Exception: first exception raised by func (in order of subdomains) when return_exceptions is not set,
+                tenants not yet started are cancelled
+        """
+        sessions = self.sessions(subdomains)
+        if not sessions:
+            return {}
+        workers = min(max_workers or self.max_workers, len(sessions))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="catalystwan-tenant")
+        futures = {session.subdomain: executor.submit(copy_context().run, func, session) for session in sessions}
+        results: Dict[str, Any] = {}
+        try:
+            for subdomain, future in futures.items():
+                try:
+                    results[subdomain] = future.result()
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    results[subdomain] = error
+            return results
+        finally:
+            for future in futures.values():
+                future.cancel()  # only tenants not yet started are cancelled
+            executor.shutdown(wait=True)
+
+    def close(self) -> None:
+        """Logs out and closes provider session"""
+        self.provider.close()
+
+    def __enter__(self) -> TenantSessionPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def create_tenant_session_pool(
+    url: str,
+    username: str,
+    password: str,
+    port: Optional[int] = None,
+    logger: Optional[logging.Logger] = None,
+    pool_config: Optional[PoolConfig] = None,
+    limiter: Optional[RequestLimiter] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    json_codec: Optional[JsonCodec] = None,
+    vsession_ttl: Optional[float] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> TenantSessionPool:
+    """Factory method that logs in as provider and creates pool of provider-as-tenant views
+
+    Args:
+        url (str): IP address or domain name
+        username (str): provider username
+        password (str): password
+        port (int): port
+        logger: override default module logger
+        pool_config: connection pool options shared by all tenants, pool_maxsize should be at least max_workers
+        limiter: client-side request limiter shared by all tenants
+        retry_policy: retry policy for requests without policy defined by endpoint decorator or APIEndpoints class
+        json_codec: JSON codec for request payloads and responses (eg. OrjsonCodec), defaults to standard library json
+        vsession_ttl: seconds after which VSessionId is obtained again before sending request
+        max_workers: default maximum number of tenants processed at the same time by map
+
+    Returns:
+        TenantSessionPool: pool with logged-in provider session
+    """
+    provider = create_manager_session(
+        url=url,
+        username=username,
+        password=password,
+        port=port,
+        logger=logger,
+        pool_config=pool_config,
+        limiter=limiter,
+        retry_policy=retry_policy,
+        json_codec=json_codec,
+    )
+    return TenantSessionPool(provider, vsession_ttl=vsession_ttl, max_workers=max_workers)
@@ -0,0 +1,9 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import os
+import unittest
+
+# timing comparisons depend on machine load, so they run only on request
+benchmark = unittest.skipUnless(
+    os.environ.get("CATALYSTWAN_BENCHMARKS"), "timing benchmark, set CATALYSTWAN_BENCHMARKS=1 to run"
+)
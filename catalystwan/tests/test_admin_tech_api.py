@@ -121,7 +121,7 @@ class TestAdminTechAPI(unittest.TestCase):
                 polling_timeout=interval * count,
                 polling_interval=interval,
             )
-        self.assertEqual(mock_session.post.call_count, count)
+        self.assertEqual(mock_session.post.call_count, count + 1)  # last request is sent at deadline
 
     @patch("catalystwan.session.ManagerSession")
     @patch("requests.Response")
@@ -2,7 +2,7 @@
 
 import logging
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from catalystwan.api.alarms_api import AlarmsAPI, AlarmVerification
 from catalystwan.dataclasses import AlarmData
@@ -142,6 +142,22 @@ class TestAlarmsAPI(TestCase):
         # Assert
         self.assertEqual(answer, self.alarms_dataseq)
 
+    @patch("catalystwan.session.ManagerSession")
+    def test_iterate_alarms_pages(self, mock_session):
+        # Arrange
+        first_page, second_page = MagicMock(), MagicMock()
+        first_page.json.return_value = {"data": self.alarms[:2], "pageInfo": {"scrollId": "s1", "hasMoreData": True}}
+        second_page.json.return_value = {"data": self.alarms[2:], "pageInfo": {"scrollId": "s2", "hasMoreData": False}}
+        mock_session.post.side_effect = [first_page, second_page]
+        # Act
+        answer = list(AlarmsAPI(mock_session).iterate(page_size=2, read_ahead=False))
+        # Assert
+        self.assertEqual(answer, list(self.alarms_dataseq))
+        self.assertEqual(
+            [call.kwargs["params"] for call in mock_session.post.call_args_list],
+            [{"count": 2}, {"count": 2, "scrollId": "s1"}],
+        )
+
     @patch("catalystwan.response.ManagerResponse")
     @patch("catalystwan.session.ManagerSession")
     def test_get_critical_alarms(self, mock_session, mock_response):
@@ -0,0 +1,277 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import asyncio
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel, Field
+
+from catalystwan.async_session import AsyncManagerSession
+from catalystwan.endpoints import AsyncAPIEndpoints, async_get, async_post
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.metrics import MetricsRegistry
+from catalystwan.retry import RetryPolicy
+from catalystwan.session import ManagerSessionState
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.session_type import SessionType
+
+EXPIRED_COOKIE = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+class Peer(BaseModel):
+    peer: str
+
+
+class PeerParams(BaseModel):
+    device_id: str = Field(serialization_alias="deviceId")
+
+
+class ExampleAsyncAPI(AsyncAPIEndpoints):
+    @async_get("/device/omp/peers", "data")
+    async def get_peers(self, params: PeerParams) -> DataSequence[Peer]:
+        ...
+
+    @async_post("/device/{device_id}/action")
+    async def action(self, device_id: str, payload: Peer) -> None:
+        ...
+
+    @async_get("/device/flaky", "data", retry=RetryPolicy(initial_delay=0, jitter=0))
+    async def get_flaky(self) -> DataSequence[Peer]:
+        ...
+
+
+class RecordingLimiter:
+    def __init__(self):
+        self.acquired = 0
+        self.released: List[Tuple[Optional[int], Optional[float]]] = []
+
+    def acquire(self) -> None:
+        self.acquired += 1
+
+    def release(self, status: Optional[int], elapsed: Optional[float]) -> None:
+        self.released.append((status, elapsed))
+
+
+class MockManager:
+    """Minimal vManage behaviour served over httpx.MockTransport"""
+
+    def __init__(self, tenants: List[dict] = []):
+        self.calls: Counter = Counter()
+        self.session_counter = 0
+        self.expire_next = 0
+        self.tenants = tenants
+        self.requests: List[httpx.Request] = []
+        self.failures = 0
+        self.disconnects = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[path] += 1
+        self.requests.append(request)
+        if path == "/j_security_check":
+            self.session_counter += 1
+            return httpx.Response(200, text="", headers={"set-cookie": f"JSESSIONID=s{self.session_counter}"})
+        if path == "/dataservice/client/token":
+            return httpx.Response(200, text=f"token-{self.session_counter}")
+        if self.expire_next and request.headers.get("cookie") != f"JSESSIONID=s{self.session_counter}":
+            self.expire_next -= 1
+            return httpx.Response(200, json={}, headers={"set-cookie": EXPIRED_COOKIE})
+        if path == "/dataservice/client/server":
+            view_mode = "tenant" if "VSessionId" in request.headers else "provider"
+            data = {
+                "platformVersion": "20.12.1",
+                "tenancyMode": "MultiTenant",
+                "userMode": "provider",
+                "viewMode": view_mode,
+            }
+            return httpx.Response(200, json={"data": data})
+        if path == "/dataservice/tenant":
+            return httpx.Response(200, json={"data": self.tenants})
+        if path.endswith("/vsessionid"):
+            return httpx.Response(200, json={"VSessionId": "vsession-1"})
+        if path == "/dataservice/device/omp/peers":
+            return httpx.Response(200, json={"data": [{"peer": request.url.params["deviceId"]}]})
+        if path.startswith("/dataservice/device/") and path.endswith("/action"):
+            return httpx.Response(200, json={})
+        if path == "/dataservice/device/flaky":
+            if self.disconnects:
+                self.disconnects -= 1
+                raise httpx.ConnectError("connection refused", request=request)
+            if self.failures:
+                self.failures -= 1
+                return httpx.Response(503, json={"error": {"message": "busy", "details": path, "code": "503"}})
+            return httpx.Response(200, json={"data": [{"peer": "ok"}]})
+        if path == "/dataservice/download/file.tar.gz":
+            return httpx.Response(200, content=b"archive")
+        return httpx.Response(404, json={"error": {"message": "not found", "details": path, "code": "404"}})
+
+
+class TestAsyncManagerSession(unittest.TestCase):
+    def setUp(self):
+        self.manager = MockManager()
+
+    def create_session(self, **kwargs) -> AsyncManagerSession:
+        return AsyncManagerSession(
+            "example.com", "admin", "password", transport=httpx.MockTransport(self.manager), **kwargs
+        )
+
+    def test_login(self):
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            return session
+
+        session = asyncio.run(run())
+
+        self.assertEqual(session.state, ManagerSessionState.OPERATIVE)
+        self.assertEqual(session.session_type, SessionType.PROVIDER)
+        self.assertEqual(str(session.api_version), "20.12")
+        self.assertEqual(self.manager.requests[-1].headers["x-xsrf-token"], "token-1")
+        self.assertEqual(self.manager.requests[-1].headers["cookie"], "JSESSIONID=s1")
+
+    def test_login_provider_as_tenant(self):
+        self.manager.tenants = [
+            {"name": "t1", "desc": "", "orgName": "org", "subDomain": "t1.example.com", "tenantId": "TNT0001"}
+        ]
+
+        async def run():
+            session = self.create_session(subdomain="t1.example.com")
+            await session.change_state(ManagerSessionState.LOGIN)
+            return session
+
+        session = asyncio.run(run())
+
+        self.assertEqual(session.session_type, SessionType.PROVIDER_AS_TENANT)
+        self.assertEqual(session.http_client.headers["VSessionId"], "vsession-1")
+        self.assertEqual(self.manager.calls["/dataservice/tenant/TNT0001/vsessionid"], 1)
+
+    def test_concurrent_requests_with_endpoints_decorators(self):
+        device_ids = [f"10.0.0.{i}" for i in range(50)]
+
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            api = ExampleAsyncAPI(session)
+            results = await asyncio.gather(*[api.get_peers(params=PeerParams(device_id=id)) for id in device_ids])
+            await api.action(device_id="10.0.0.1", payload=Peer(peer="x"))
+            return results
+
+        results = asyncio.run(run())
+
+        self.assertEqual([r.first().peer for r in results], device_ids)
+        self.assertEqual(self.manager.calls["/dataservice/device/omp/peers"], 50)
+        self.assertEqual(self.manager.requests[-1].content, b'{"peer":"x"}')
+
+    def test_metrics_of_concurrent_endpoint_requests(self):
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            session.metrics = MetricsRegistry()
+            api = ExampleAsyncAPI(session)
+            await asyncio.gather(*[api.get_peers(params=PeerParams(device_id=str(i))) for i in range(10)])
+            await session.get_data("/dataservice/device/omp/peers?deviceId=1")
+            return session.metrics.asdict()
+
+        metrics = asyncio.run(run())
+
+        self.assertEqual(metrics["GET /device/omp/peers"]["calls"], 10)
+        self.assertEqual(metrics["GET /dataservice/device/omp/peers"]["calls"], 1)
+
+    def test_expired_session_relogin_is_performed_once(self):
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            self.manager.session_counter += 1  # server side session invalidated
+            self.manager.expire_next = 20
+            return await asyncio.gather(
+                *[session.get_data(f"/dataservice/device/omp/peers?deviceId={i}") for i in range(20)]
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(self.manager.calls["/j_security_check"], 2)
+
+    def test_http_error(self):
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            await session.get("/dataservice/unknown")
+
+        with self.assertRaises(ManagerHTTPError) as context:
+            asyncio.run(run())
+        self.assertEqual(context.exception.info.code, "404")
+
+    def test_retry_policy_of_endpoint(self):
+        self.manager.failures = 2
+
+        async def run():
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            return await ExampleAsyncAPI(session).get_flaky()
+
+        self.assertEqual(asyncio.run(run()).first().peer, "ok")
+        self.assertEqual(self.manager.calls["/dataservice/device/flaky"], 3)
+
+    def test_retry_policy_of_session_retries_connection_error(self):
+        self.manager.disconnects = 1
+
+        async def run():
+            session = self.create_session(retry_policy=RetryPolicy(initial_delay=0, jitter=0))
+            await session.change_state(ManagerSessionState.LOGIN)
+            return await session.get_data("/dataservice/device/flaky")
+
+        self.assertEqual(asyncio.run(run()), [{"peer": "ok"}])
+        self.assertEqual(self.manager.calls["/dataservice/device/flaky"], 2)
+
+    def test_limiter(self):
+        limiter = RecordingLimiter()
+
+        async def run():
+            session = self.create_session(limiter=limiter)
+            await session.change_state(ManagerSessionState.LOGIN)
+            await asyncio.gather(*[session.get(f"/dataservice/device/omp/peers?deviceId={i}") for i in range(5)])
+
+        asyncio.run(run())
+
+        self.assertEqual(limiter.acquired, len(limiter.released))
+        self.assertEqual([status for status, _ in limiter.released[-5:]], [200] * 5)
+
+    def test_get_file_relogin(self):
+        async def run(filename: Path):
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            self.manager.session_counter += 1  # server side session invalidated
+            self.manager.expire_next = 1
+            await session.get_file("/dataservice/download/file.tar.gz", filename)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "file.tar.gz"
+            asyncio.run(run(filename))
+
+            self.assertEqual(filename.read_bytes(), b"archive")
+        self.assertEqual(self.manager.calls["/j_security_check"], 2)
+
+    def test_get_file_http_error(self):
+        async def run(filename: Path):
+            session = self.create_session()
+            await session.change_state(ManagerSessionState.LOGIN)
+            await session.get_file("/dataservice/download/unknown", filename)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = Path(tmpdir) / "file.tar.gz"
+            with self.assertRaises(ManagerHTTPError) as context:
+                asyncio.run(run(filename))
+
+            self.assertFalse(filename.exists())
+        self.assertEqual(context.exception.info.code, "404")
+
+
+if __name__ == "__main__":
+    unittest.main()
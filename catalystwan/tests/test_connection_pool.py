@@ -0,0 +1,91 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+from catalystwan.connection_pool import ManagerHTTPAdapter, PoolConfig, PoolStats
+from catalystwan.session import ManagerSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        sleep(0.02)
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConnectionPool(unittest.TestCase):
+    url: str
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        cls.server.daemon_threads = True
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def create_session(self, pool_config: PoolConfig) -> ManagerSession:
+        return ManagerSession(url=self.url, username="admin", password="admin", pool_config=pool_config)
+
+    def test_sequential_requests_reuse_connection(self):
+        session = self.create_session(PoolConfig())
+        for _ in range(5):
+            session.get("/dataservice/device")
+        self.assertEqual(session.pool_stats.asdict(), {"created": 1, "reused": 4, "discarded": 0, "expired": 0})
+
+    def test_pool_smaller_than_workers_discards_connections(self):
+        session = self.create_session(PoolConfig(pool_maxsize=1))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get("/dataservice/device"), range(32)))
+        self.assertGreater(session.pool_stats.created, 1)
+        self.assertGreater(session.pool_stats.discarded, 0)
+
+    def test_pool_sized_for_workers_keeps_connections(self):
+        session = self.create_session(PoolConfig(pool_maxsize=8))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get("/dataservice/device"), range(32)))
+        self.assertLessEqual(session.pool_stats.created, 8)
+        self.assertEqual(session.pool_stats.discarded, 0)
+        self.assertEqual(session.pool_stats.created + session.pool_stats.reused, 32)
+
+    def test_blocking_pool_never_exceeds_maxsize(self):
+        session = self.create_session(PoolConfig(pool_maxsize=2, pool_block=True))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get("/dataservice/device"), range(16)))
+        self.assertLessEqual(session.pool_stats.created, 2)
+        self.assertEqual(session.pool_stats.discarded, 0)
+
+    def test_idle_connections_expire(self):
+        session = self.create_session(PoolConfig(max_idle_time=0.0, tcp_keepalive=True))
+        session.get("/dataservice/device")
+        sleep(0.01)
+        session.get("/dataservice/device")
+        self.assertEqual(session.pool_stats.expired, 1)
+        self.assertEqual(session.pool_stats.reused, 0)
+
+    def test_adapter_defaults(self):
+        adapter = ManagerHTTPAdapter()
+        self.assertEqual(adapter.pool_config, PoolConfig())
+        self.assertEqual(adapter.pool_stats, PoolStats())
+        self.assertIsNone(PoolConfig().socket_options())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 from catalystwan.api.device_action_api import DecommissionAction, RebootAction, ValidateAction
 from catalystwan.dataclasses import Device
+from catalystwan.exceptions import WaitTimeoutError
 
 
 class TestRebootActionAPI(TestCase):
@@ -42,6 +43,29 @@ class TestRebootActionAPI(TestCase):
         # Act&Assert
         self.assertRaises(Exception, reboot_action.execute)
 
+    @patch("catalystwan.api.device_action_api.DeviceStateAPI")
+    @patch("catalystwan.session.ManagerSession")
+    def test_wait_for_completed(self, mock_session, mock_state_api):
+        # Arrange
+        reboot_action = RebootAction(mock_session, self.device)
+        mock_session.get_data.side_effect = [[], [{"status": "In progress"}], [{"status": "Success"}]]
+        mock_state_api.return_value.get_system_status.return_value = self.device
+        # Act
+        reboot_action.wait_for_completed(sleep_seconds=0.01, timeout_seconds=5)
+        # Assert
+        self.assertEqual(mock_session.get_data.call_count, 3)
+
+    @patch("catalystwan.api.device_action_api.DeviceStateAPI")
+    @patch("catalystwan.session.ManagerSession")
+    def test_wait_for_completed_timeout(self, mock_session, mock_state_api):
+        # Arrange
+        reboot_action = RebootAction(mock_session, self.device)
+        mock_session.get_data.return_value = [{"status": "In progress"}]
+        mock_state_api.return_value.get_system_status.return_value = self.device
+        # Act&Assert
+        with self.assertRaises(WaitTimeoutError):
+            reboot_action.wait_for_completed(sleep_seconds=0.01, timeout_seconds=0.05)
+
 
 class TestValidateActionAPI(TestCase):
     def setUp(self) -> None:
@@ -4,19 +4,18 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from parameterized import parameterized  # type: ignore
-from pytest import mark  # type: ignore
-from tenacity import RetryError  # type: ignore
 
 from catalystwan.api.basic_api import DevicesAPI, DeviceStateAPI
 from catalystwan.dataclasses import BfdSessionData, Connection, Device, WanInterface
 from catalystwan.endpoints.endpoints_container import APIEndpointContainter
 from catalystwan.endpoints.monitoring_device_details import DeviceData
 from catalystwan.endpoints.real_time_monitoring.reboot_history import RebootEntry
-from catalystwan.exceptions import CatalystwanException
+from catalystwan.exceptions import CatalystwanException, WaitTimeoutError
 from catalystwan.response import ManagerResponse
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 from catalystwan.utils.personality import Personality
+from catalystwan.utils.reachability import Reachability
 
 
 class ResponseMock:
@@ -680,9 +679,8 @@ class TestDevicesStateAPI(TestCase):
             )
 
         # Assert
-        self.assertRaises(RetryError, answer)
+        self.assertRaises(WaitTimeoutError, answer)
 
-    @mark.skip(reason="10 minutes length")
     @patch("catalystwan.session.ManagerSession")
     def test_wait_for_device_state(self, mock_session):
         # Arrange
@@ -691,7 +689,16 @@ class TestDevicesStateAPI(TestCase):
         answer = DeviceStateAPI(mock_session).wait_for_device_state(device_id="1.1.1.1")
         # Assert
         self.assertTrue(answer)
+        mock_session.get_data.assert_called_once()
 
     @patch("catalystwan.session.ManagerSession")
     def test_wait_for_device_state_unreachable(self, mock_session):
-        pass  # TODO fix method before test
+        # Arrange
+        mock_session.get_data.return_value = self.device
+        # Act
+        answer = DeviceStateAPI(mock_session).wait_for_device_state(
+            device_id="1.1.1.1", sleep_seconds=0.01, timeout_seconds=0.05, exp_state=Reachability.UNREACHABLE
+        )
+        # Assert
+        self.assertFalse(answer)
+        self.assertGreater(mock_session.get_data.call_count, 1)
@@ -6,11 +6,13 @@ import tempfile
 import unittest
 from enum import Enum
 from pathlib import Path
+from timeit import timeit
 from typing import Dict, List, Literal, Optional, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import UUID, uuid4
 
 import pytest  # type: ignore
+from packaging.specifiers import SpecifierSet  # type: ignore
 from packaging.version import Version  # type: ignore
 from parameterized import parameterized  # type: ignore
 from pydantic import BaseModel as BaseModelV2
@@ -26,13 +28,15 @@ from catalystwan.endpoints import (
     PreparedPayload,
     TypeSpecifier,
     delete,
+    dict_values_to_str,
     get,
 )
 from catalystwan.endpoints import logger as endpoints_logger
 from catalystwan.endpoints import post, put, request, versions, view
 from catalystwan.exceptions import APIEndpointError, APIRequestPayloadTypeError, APIVersionError, APIViewError
+from catalystwan.tests.benchmark import benchmark
 from catalystwan.typed_list import DataSequence
-from catalystwan.utils.session_type import ProviderAsTenantView, ProviderView, TenantView
+from catalystwan.utils.session_type import ProviderAsTenantView, ProviderView, SessionType, TenantView
 
 
 class BaseModelV1Example(BaseModelV1):
@@ -906,3 +910,61 @@ class TestAPIEndpoints(unittest.TestCase):
             @request("POST", "/v1/data")
             def create(self, payload: AnyBaseModel) -> None:  # type: ignore [empty-body]
                 ...
+
+
+class TestAPIEndpointsCallPlan(unittest.TestCase):
+    class Response:
+        def dataseq(self, cls, key):
+            return []
+
+    def setUp(self):
+        class TestAPI(APIEndpoints):
+            @versions(">=20.9")
+            @view({SessionType.PROVIDER})
+            @get("/device/{device_id}/data", "data")
+            def get_data(self, device_id: str) -> DataSequence[BaseModelV2Example]:  # type: ignore [empty-body]
+                ...
+
+        self.client = MagicMock(spec=["request", "api_version", "session_type"])
+        self.client.request = lambda method, url, **kwargs: self.Response()
+        self.client.api_version = Version("20.12")
+        self.client.session_type = SessionType.PROVIDER
+        self.api = TestAPI(self.client)
+        self.legacy = request("GET", "/device/{device_id}/data", "data")
+        self.legacy.prepare(TestAPI.get_data)
+        self.legacy_versions = SpecifierSet(">=20.9")
+
+    def legacy_call(self, *args):
+        """Per call steps of endpoint before compilation: signature merge, url formatting,
+        version check and return type dispatch (without view check and decorators wrappers)"""
+        names = [key for key in self.legacy.sig.parameters.keys()]
+        kwargs = dict(self.legacy.defaults)
+        kwargs.update(dict(zip(names, args)))
+        kwargs.pop("self", None)
+        url = self.legacy.url.format_map(dict_values_to_str(self.legacy.url_field_names, kwargs))
+        if self.api._api_version not in self.legacy_versions:
+            return None
+        response = self.client.request("GET", url, payload=None, params=None, force_json_payload=False)
+        spec = self.legacy.return_spec
+        if spec.payload_type and issubclass(spec.payload_type, (BaseModelV1, BaseModelV2)):
+            if spec.sequence_type == DataSequence:
+                return response.dataseq(spec.payload_type, "data")
+        return None
+
+    def test_version_compatibility_is_checked_once_per_version(self):
+        with patch.object(SpecifierSet, "__contains__", return_value=True) as contains:
+            for _ in range(10):
+                self.api.get_data("1")
+            self.client.api_version = Version("20.13")
+            self.api.get_data("1")
+
+        self.assertEqual(contains.call_count, 2)
+
+    @benchmark
+    def test_benchmark_compiled_call_overhead(self):
+        number = 2000
+        legacy = timeit(lambda: self.legacy_call(self.api, "1"), number=number) / number
+        compiled = timeit(lambda: self.api.get_data("1"), number=number) / number
+
+        # whole decorated call (including view check) is cheaper than uncompiled steps alone
+        self.assertLess(compiled * 2, legacy)
@@ -0,0 +1,38 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import sys
+import unittest
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).parents[2]
+SCRIPT = ROOT / "endpoints-md.py"
+
+
+@unittest.skipUnless(SCRIPT.exists(), "endpoints-md.py is not distributed with package")
+class TestEndpointsMarkdown(unittest.TestCase):
+    def setUp(self):
+        spec = spec_from_file_location("endpoints_md", SCRIPT)
+        assert spec is not None and spec.loader is not None
+        self.endpoints_md = module_from_spec(spec)
+        sys.modules[spec.name] = self.endpoints_md  # dataclasses look up defining module
+        self.addCleanup(sys.modules.pop, spec.name)
+        spec.loader.exec_module(self.endpoints_md)
+
+    def test_lazy_container_members_are_documented(self):
+        # Act
+        with patch.object(Path, "cwd", return_value=ROOT):
+            markdown = self.endpoints_md.create_endpoint_registry().md()
+
+        # Assert
+        rows = markdown.splitlines()[3:]
+        self.assertGreater(len(rows), 500)
+        self.assertTrue(any("MonitoringDeviceDetails.delete_tier" in row for row in rows))
+        self.assertTrue(any("AsyncClient.server" in row for row in rows))
+        methods = [row.split("|")[2] for row in rows]
+        self.assertEqual(methods, sorted(methods))  # rows order does not depend on import order of endpoint modules
+
+
+if __name__ == "__main__":
+    unittest.main()
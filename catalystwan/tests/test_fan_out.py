@@ -0,0 +1,104 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from random import random
+from threading import Barrier, Lock
+from time import sleep
+from typing import List
+from unittest.mock import MagicMock
+
+from parameterized import parameterized  # type: ignore
+
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.dataclasses import Device
+from catalystwan.fan_out import chunks, fan_out
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.creation_tools import create_dataclass
+
+
+class TestFanOut(unittest.TestCase):
+    @parameterized.expand([(10, 3, [3, 3, 3, 1]), (6, 3, [3, 3]), (2, 5, [2]), (0, 5, [])])
+    def test_chunks(self, count: int, size: int, expected: List[int]):
+        self.assertEqual([len(chunk) for chunk in chunks(range(count), size)], expected)
+
+    def test_results_merged_in_order_of_chunks(self):
+        def fetch(chunk: List[int]) -> List[int]:
+            sleep(random() / 100)
+            return [item * 2 for item in chunk]
+
+        self.assertEqual(fan_out(fetch, list(range(1000)), chunk_size=7), [item * 2 for item in range(1000)])
+
+    def test_concurrency_is_bounded(self):
+        lock = Lock()
+        in_flight = []
+        current = 0
+
+        def fetch(chunk: List[int]) -> List[int]:
+            nonlocal current
+            with lock:
+                current += 1
+                in_flight.append(current)
+            sleep(0.01)
+            with lock:
+                current -= 1
+            return chunk
+
+        fan_out(fetch, list(range(40)), chunk_size=2, max_workers=3)
+
+        self.assertEqual(max(in_flight), 3)
+
+    def test_chunks_requested_concurrently(self):
+        requests = Barrier(8, timeout=10)  # broken (fetch raises) unless all chunks are requested at once
+
+        def fetch(chunk: List[int]) -> List[int]:
+            requests.wait()
+            return chunk
+
+        self.assertEqual(fan_out(fetch, list(range(8)), chunk_size=1, max_workers=8), list(range(8)))
+
+    def test_first_error_is_raised(self):
+        def fetch(chunk: List[int]) -> List[int]:
+            if chunk[0] == 4:
+                raise ValueError(chunk)
+            return chunk
+
+        with self.assertRaises(ValueError):
+            fan_out(fetch, list(range(10)), chunk_size=2)
+
+
+class TestDevicesAPIFanOut(unittest.TestCase):
+    def test_get_requests_system_info_in_chunks(self):
+        devices = [
+            create_dataclass(
+                Device,
+                {
+                    "deviceId": f"10.0.0.{index}",
+                    "uuid": f"uuid-{index}",
+                    "personality": "vedge",
+                    "host-name": f"edge-{index}",
+                    "reachability": "reachable",
+                    "local-system-ip": f"10.0.0.{index}",
+                },
+            )
+            for index in range(5)
+        ]
+        session = MagicMock()
+        session.endpoints.monitoring_device_details.list_all_devices.return_value = [
+            MagicMock(device_id=device.id) for device in devices
+        ]
+
+        def get(url, params):
+            response = MagicMock()
+            response.dataseq.return_value = DataSequence(Device, [d for d in devices if d.id in params["deviceId"]])
+            return response
+
+        session.get.side_effect = get
+        api = DevicesAPI(session)
+        api.max_params = 2
+
+        self.assertEqual(api.get(), DataSequence(Device, devices))
+        self.assertEqual(session.get.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
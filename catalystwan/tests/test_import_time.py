@@ -0,0 +1,62 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import re
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+from parameterized import parameterized  # type: ignore
+
+from catalystwan.tests.benchmark import benchmark
+
+# self time of catalystwan modules imported with session (it was above 1s when all API modules were loaded eagerly)
+SESSION_IMPORT_BUDGET_US = 400_000
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Runs given import statement in fresh interpreter and returns self import time (us) of each loaded module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if match := IMPORT_TIME_LINE.match(line):
+            times[match.group(4)] = int(match.group(1))
+    return times
+
+
+class TestImportTime(unittest.TestCase):
+    def test_package_import_is_cheap(self):
+        modules = import_times("import catalystwan")
+
+        for module in ["importlib.metadata", "urllib3", "multiprocessing", "catalystwan.session"]:
+            self.assertNotIn(module, modules)
+
+    @parameterized.expand(
+        [
+            ("catalystwan.api.template_api",),
+            ("catalystwan.api.policy_api",),
+            ("catalystwan.models.policy",),
+            ("catalystwan.models.configuration.feature_profile.sdwan.service",),
+            ("catalystwan.endpoints.configuration_group",),
+        ]
+    )
+    def test_session_import_does_not_load_api_modules(self, module: str):
+        self.assertNotIn(module, import_times("import catalystwan.session"))
+
+    def session_own_modules(self) -> Dict[str, int]:
+        modules = import_times("import catalystwan.session")
+        return {name: time for name, time in modules.items() if name.split(".")[0] == "catalystwan"}
+
+    def test_session_import_module_count(self):
+        self.assertLess(len(self.session_own_modules()), 60)
+
+    @benchmark
+    def test_session_import_time_budget(self):
+        self.assertLess(sum(self.session_own_modules().values()), SESSION_IMPORT_BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
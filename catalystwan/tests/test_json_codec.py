@@ -0,0 +1,197 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import json
+import unittest
+from pathlib import Path
+from timeit import timeit
+from typing import Any, Dict, List, Optional
+
+from parameterized import parameterized  # type: ignore
+from pydantic import BaseModel, ConfigDict, Field
+from requests import Response
+from requests.exceptions import JSONDecodeError
+
+from catalystwan.endpoints import JSON, APIEndpoints, post
+from catalystwan.json_codec import (
+    STDLIB_JSON_CODEC,
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    available_json_codecs,
+    encode_json_kwarg,
+    fastest_json_codec,
+)
+from catalystwan.response import ManagerResponse
+from catalystwan.tests.benchmark import benchmark
+
+try:
+    ORJSON_CODEC: Optional[JsonCodec] = OrjsonCodec()
+except ImportError:
+    ORJSON_CODEC = None
+
+try:
+    MSGSPEC_CODEC: Optional[JsonCodec] = MsgspecCodec()
+except ImportError:
+    MSGSPEC_CODEC = None
+
+CODECS = [(codec,) for codec in (STDLIB_JSON_CODEC, ORJSON_CODEC, MSGSPEC_CODEC) if codec is not None]
+
+
+class PolicyEntry(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    entry_type: str = Field(serialization_alias="type", validation_alias="type")
+    ref: Optional[str] = None
+    values: List[str] = []
+
+
+class PolicyList(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    name: str
+    list_type: str = Field(serialization_alias="type", validation_alias="type")
+    description: Optional[str] = None
+    entries: List[PolicyEntry]
+
+
+def policy_lists(count: int) -> List[PolicyList]:
+    return [
+        PolicyList(
+            name=f"prefix-list-{index}",
+            list_type="dataPrefix",
+            entries=[PolicyEntry(entry_type="ipPrefix", values=[f"10.{index % 256}.{i}.0/24"]) for i in range(20)],
+        )
+        for index in range(count)
+    ]
+
+
+def device_inventory(count: int) -> Dict[str, Any]:
+    return {
+        "header": {"generatedOn": 1700000000000},
+        "data": [
+            {
+                "deviceId": f"10.0.{index // 256}.{index % 256}",
+                "uuid": f"C8K-{index:08d}",
+                "host-name": f"edge-{index}",
+                "reachability": "reachable",
+                "personality": "vedge",
+                "version": "17.12.1",
+                "uptime-date": 1700000000000 + index,
+                "site-id": str(index),
+                "latitude": "37.666684",
+                "longitude": "-122.777023",
+            }
+            for index in range(count)
+        ],
+    }
+
+
+class PolicyListAPI(APIEndpoints):
+    @post("/template/policy/list/dataprefix")
+    def create_list(self, payload: JSON) -> None:
+        ...
+
+
+class Client:
+    api_version = None
+    session_type = None
+
+    def __init__(self, json_codec: Optional[JsonCodec] = None):
+        self.json_codec = json_codec
+        self.data: Any = None
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.data = kwargs.get("data")
+        response = Response()
+        response.status_code = 200
+        return ManagerResponse(response)
+
+    def get_file(self, url: str, filename: Path) -> None:
+        pass
+
+
+class TestJsonCodec(unittest.TestCase):
+    @parameterized.expand(CODECS)
+    def test_round_trip(self, codec: JsonCodec):
+        data = device_inventory(3)
+
+        self.assertEqual(codec.loads(codec.dumps(data)), data)
+        self.assertEqual(json.loads(codec.dumps(data)), data)
+
+    @parameterized.expand(CODECS)
+    def test_decode_error_is_requests_json_decode_error(self, codec: JsonCodec):
+        with self.assertRaises(JSONDecodeError):
+            codec.loads(b"<html>not json</html>")
+
+    def test_codec_without_loads_cannot_be_created(self):
+        class IncompleteCodec(JsonCodec):
+            name = "incomplete"
+
+            def dumps(self, obj: Any) -> str:
+                return ""
+
+        with self.assertRaises(TypeError):
+            IncompleteCodec()  # type: ignore[abstract]
+
+    def test_fastest_codec_is_first_available(self):
+        self.assertEqual(type(fastest_json_codec()), type(available_json_codecs()[0]))
+        self.assertIs(available_json_codecs()[-1], STDLIB_JSON_CODEC)
+
+    @parameterized.expand(CODECS)
+    def test_response_decoded_with_codec(self, codec: JsonCodec):
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(device_inventory(2)).encode()
+
+        self.assertEqual(ManagerResponse(response, codec).json(), device_inventory(2))
+
+    def test_json_kwarg_encoded_with_codec(self):
+        kwargs = encode_json_kwarg({"json": {"a": 1}, "headers": {"x-custom": "1"}}, STDLIB_JSON_CODEC)
+
+        self.assertEqual(kwargs, {"data": '{"a": 1}', "headers": {"content-type": "application/json", "x-custom": "1"}})
+        self.assertEqual(encode_json_kwarg({"data": "x"}, STDLIB_JSON_CODEC), {"data": "x"})
+
+
+class TestSequencePayload(unittest.TestCase):
+    def test_homogeneous_models_serialized_same_as_dicts(self):
+        lists = policy_lists(3)
+        expected = [item.model_dump(exclude_none=True, by_alias=True) for item in lists]
+
+        prepared = APIEndpoints._prepare_sequence_payload(lists)
+
+        self.assertEqual(json.loads(prepared.data), expected)  # type: ignore[arg-type]
+        self.assertEqual(prepared.headers, {"content-type": "application/json"})
+
+    @parameterized.expand(CODECS)
+    def test_endpoint_uses_client_codec(self, codec: JsonCodec):
+        client = Client(codec)
+
+        PolicyListAPI(client).create_list([{"name": "list", "values": [1]}])
+
+        self.assertEqual(json.loads(client.data), [{"name": "list", "values": [1]}])
+        self.assertEqual(type(client.data), type(codec.dumps({})))
+
+    @benchmark
+    @unittest.skipIf(ORJSON_CODEC is None, "orjson not installed")
+    def test_benchmark_codecs(self):
+        number = 5
+        payload = [item.model_dump(exclude_none=True, by_alias=True) for item in policy_lists(2000)]
+        body = json.dumps(device_inventory(5000)).encode()
+        results = {}
+        for (codec,) in CODECS:
+            dumps = timeit(lambda: codec.dumps(payload), number=number) / number
+            loads = timeit(lambda: codec.loads(body), number=number) / number
+            results[codec.name] = (dumps, loads)
+        models = policy_lists(2000)
+        one_pass = timeit(lambda: APIEndpoints._prepare_sequence_payload(models), number=number) / number
+        per_item = timeit(lambda: json.dumps([m.model_dump(by_alias=True) for m in models]), number=number) / number
+
+        # orjson encodes large policy lists and decodes device inventory several times faster than stdlib json,
+        # pydantic-core serializes whole list of models without building intermediate dicts
+        self.assertLess(results["orjson"][0], results["stdlib"][0])
+        self.assertLess(results["orjson"][1], results["stdlib"][1])
+        self.assertLess(one_pass, per_item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import gc
+import tracemalloc
+import unittest
+from timeit import timeit
+from typing import Any, List, Tuple
+
+from catalystwan.api.api_container import APIContainer
+from catalystwan.api.basic_api import DevicesAPI
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+from catalystwan.session import ManagerSession
+from catalystwan.tests.benchmark import benchmark
+from catalystwan.utils.lazy_member import lazy_members
+
+
+def create_session() -> ManagerSession:
+    return ManagerSession(url="example.com", username="admin", password="admin")
+
+
+def create_all_members(container: Any) -> List[Tuple[str, Any]]:
+    """Accesses all lazy members (including nested containers), as eager container did in constructor"""
+    members = []
+    for name in lazy_members(type(container)):
+        member = getattr(container, name)
+        members.append((name, member))
+        if lazy_members(type(member)):
+            members.extend(create_all_members(member))
+    return members
+
+
+def create_eager_session() -> ManagerSession:
+    session = create_session()
+    create_all_members(session.api)
+    create_all_members(session.endpoints)
+    return session
+
+
+def allocated(create) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [create() for _ in range(20)]
+        return (tracemalloc.get_traced_memory()[0] - before) // len(objects)
+    finally:
+        tracemalloc.stop()
+
+
+class TestLazyMember(unittest.TestCase):
+    def setUp(self):
+        self.session = create_session()
+
+    def test_members_created_on_first_access(self):
+        self.assertNotIn("devices", vars(self.session.api))
+
+        devices = self.session.api.devices
+
+        self.assertIsInstance(devices, DevicesAPI)
+        self.assertIs(self.session.api.devices, devices)
+        self.assertIs(devices.session, self.session)
+
+    def test_member_can_be_replaced(self):
+        replacement = DevicesAPI(self.session)
+
+        self.session.api.devices = replacement
+
+        self.assertIs(self.session.api.devices, replacement)
+
+    def test_all_members_can_be_created(self):
+        api = create_all_members(self.session.api)
+        endpoints = create_all_members(self.session.endpoints)
+
+        self.assertGreater(len(api), 20)
+        self.assertGreater(len(endpoints), 75)
+        self.assertIs(self.session.endpoints.configuration.policy.list.app._client, self.session)
+
+    def test_session_construction_memory(self):
+        lazy_memory = allocated(create_session)
+        eager_memory = allocated(create_eager_session)
+
+        # containers hold only session reference until members are used
+        self.assertLess(lazy_memory * 1.5, eager_memory)
+        self.assertEqual(
+            (type(APIContainer.devices).__name__, type(APIEndpointContainter.misc).__name__), ("LazyMember",) * 2
+        )
+
+    @benchmark
+    def test_benchmark_session_construction(self):
+        number = 20
+        lazy = timeit(create_session, number=number) / number
+        eager = timeit(create_eager_session, number=number) / number
+
+        self.assertLess(lazy * 5, eager)
+
+
+if __name__ == "__main__":
+    unittest.main()
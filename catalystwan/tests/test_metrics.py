@@ -0,0 +1,121 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import unittest
+from datetime import timedelta
+from unittest.mock import patch
+
+from requests import Request, Response
+
+from catalystwan.endpoints import APIEndpoints, current_endpoint, get
+from catalystwan.metrics import LatencyHistogram, MetricsRegistry
+from catalystwan.response import RequestTrace
+from catalystwan.session import ManagerSession
+
+
+class ExampleAPI(APIEndpoints):
+    @get("/device/{device_id}/status")
+    def get_status(self, device_id: str) -> dict:
+        ...
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_quantiles(self):
+        histogram = LatencyHistogram(buckets=(0.1, 0.2, 0.5, 1.0))
+        for value in [0.05] * 50 + [0.15] * 45 + [0.8] * 5:
+            histogram.observe(value)
+
+        self.assertEqual(histogram.counts, [50, 45, 0, 5, 0])
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.1)
+        self.assertAlmostEqual(histogram.quantile(0.95), 0.2)
+        self.assertAlmostEqual(histogram.quantile(0.99), 0.8)  # interpolated value is capped by max observed
+        self.assertAlmostEqual(histogram.sum, 0.05 * 50 + 0.15 * 45 + 0.8 * 5)
+
+    def test_quantile_of_values_above_all_buckets(self):
+        histogram = LatencyHistogram(buckets=(0.1,))
+        histogram.observe(3.0)
+
+        self.assertEqual(histogram.quantile(0.5), 3.0)
+        self.assertIsNone(LatencyHistogram().quantile(0.5))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry(buckets=(0.1, 1.0))
+
+    def test_observe_groups_requests_by_endpoint_template(self):
+        token = current_endpoint.set("GET /device/{device_id}/status")
+        try:
+            self.metrics.observe(RequestTrace("GET", "/dataservice/device/1/status", 200, 0.05, None, 100))
+            self.metrics.observe(RequestTrace("GET", "/dataservice/device/2/status", 500, 0.5, None, 20))
+        finally:
+            current_endpoint.reset(token)
+        self.metrics.observe(RequestTrace("POST", "/dataservice/template", 200, 2.0, 30, 10))
+        self.metrics.increment("POST", "/dataservice/template", "relogins")
+
+        metrics = self.metrics.asdict()
+
+        self.assertEqual(list(metrics), ["POST /dataservice/template", "GET /device/{device_id}/status"])
+        status = metrics["GET /device/{device_id}/status"]
+        self.assertEqual((status["calls"], status["errors"], status["response_bytes"]), (2, 1, 120))
+        self.assertEqual(status["latency"]["count"], 2)
+        self.assertEqual(metrics["POST /dataservice/template"]["relogins"], 1)
+        self.assertEqual(metrics["POST /dataservice/template"]["request_bytes"], 30)
+
+    def test_to_prometheus(self):
+        self.metrics.observe(RequestTrace("GET", '/dataservice/"quoted"', 200, 0.05, None, 100))
+        self.metrics.observe(RequestTrace("GET", '/dataservice/"quoted"', None, None, None, None))
+
+        text = self.metrics.to_prometheus()
+
+        label = 'endpoint="GET /dataservice/\\"quoted\\""'
+        self.assertIn("# TYPE catalystwan_requests_total counter", text)
+        self.assertIn(f"catalystwan_requests_total{{{label}}} 2", text)
+        self.assertIn(f"catalystwan_request_errors_total{{{label}}} 1", text)
+        self.assertIn("# TYPE catalystwan_request_duration_seconds histogram", text)
+        self.assertIn(f'catalystwan_request_duration_seconds_bucket{{{label},le="0.1"}} 1', text)
+        self.assertIn(f'catalystwan_request_duration_seconds_bucket{{{label},le="+Inf"}} 1', text)
+        self.assertIn(f"catalystwan_request_duration_seconds_count{{{label}}} 1", text)
+
+
+class TestSessionMetrics(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="example.com", username="admin", password="admin")
+        self.session.metrics = MetricsRegistry()
+        self.expire_first = False
+
+    def mocked_request(self, method, url, *args, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response.request = Request(method=method, url=url).prepare()
+        response.elapsed = timedelta(milliseconds=20)
+        response._content = b'{"status": "up"}'
+        if self.expire_first:
+            self.expire_first = False
+            response.headers["set-cookie"] = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+        return response
+
+    @patch("catalystwan.session.ManagerSession._relogin")
+    @patch("requests.sessions.Session.request")
+    def test_endpoint_requests_recorded_under_template(self, mock_request, mock_relogin):
+        mock_request.side_effect = self.mocked_request
+        self.expire_first = True
+        api = ExampleAPI(self.session)
+
+        for device_id in ["1", "2", "3"]:
+            api.get_status(device_id)
+        self.session.get("/dataservice/client/server")
+
+        metrics = self.session.metrics.asdict()
+        status = metrics["GET /device/{device_id}/status"]
+        self.assertEqual(status["calls"], 4)  # 3 calls and request repeated after relogin
+        self.assertEqual(status["relogins"], 1)
+        self.assertEqual(status["response_bytes"], 4 * 16)
+        self.assertAlmostEqual(status["latency"]["sum"], 0.08)
+        self.assertEqual(metrics["GET /dataservice/client/server"]["calls"], 1)
+        self.assertIsNone(current_endpoint.get())
+
+
+if __name__ == "__main__":
+    unittest.main()
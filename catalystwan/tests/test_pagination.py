@@ -0,0 +1,222 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import json
+import unittest
+from threading import Event
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+from parameterized import parameterized  # type: ignore
+from pydantic import BaseModel
+from requests import Response
+
+from catalystwan.endpoints import APIEndpoints, AsyncAPIEndpoints, async_get, get, post
+from catalystwan.exceptions import APIEndpointError
+from catalystwan.pagination import (
+    OffsetPagination,
+    PageNumberPagination,
+    ScrollPagination,
+    aiterate_pages,
+    iterate_pages,
+)
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+
+ITEMS = [{"name": f"item-{index}"} for index in range(7)]
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Query(BaseModel):
+    severity: str
+
+
+class ExampleAPI(APIEndpoints):
+    @get("/items", "data", paginate=OffsetPagination(limit=3))
+    def get_items(self, params: Query) -> Iterator[Item]:
+        ...
+
+    @get("/items/numbered", "data", paginate=PageNumberPagination(page_size=3, first_page=0))
+    def get_numbered_items(self) -> Iterator[Item]:
+        ...
+
+    @post("/items/page", "data", paginate=ScrollPagination(count=3, read_ahead=True))
+    def get_scrolled_items(self, payload: Query) -> Iterator[Item]:
+        ...
+
+
+class ExampleAsyncAPI(AsyncAPIEndpoints):
+    @async_get("/items", "data", paginate=OffsetPagination(limit=3, read_ahead=True))
+    def get_items(self) -> AsyncIterator[Item]:
+        ...
+
+
+def page(params: Dict[str, Any]) -> List[dict]:
+    if "offset" in params:
+        return ITEMS[params["offset"] : params["offset"] + params["limit"]]
+    if "page" in params:
+        return ITEMS[params["page"] * params["pageSize"] : (params["page"] + 1) * params["pageSize"]]
+    begin = int(params.get("scrollId", 0))
+    return ITEMS[begin : begin + params["count"]]
+
+
+def page_response(params: Dict[str, Any]) -> ManagerResponse:
+    begin = int(params.get("scrollId", 0))
+    page_info = {"scrollId": str(begin + params.get("count", 0)), "hasMoreData": begin + 3 < len(ITEMS)}
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps({"data": page(params), "pageInfo": page_info}).encode()
+    return ManagerResponse(response)
+
+
+class Client:
+    api_version = None
+    session_type = None
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.requests.append(dict(kwargs.get("params") or {}, json=kwargs.get("data")))
+        return page_response(kwargs.get("params") or {})
+
+
+class AsyncClient(Client):
+    async def request(self, method: str, url: str, **kwargs) -> ManagerResponse:  # type: ignore[override]
+        return super().request(method, url, **kwargs)
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.api = ExampleAPI(self.client)
+
+    def test_offset_pages_requested_lazily(self):
+        items = self.api.get_items(Query(severity="critical"))
+
+        self.assertEqual(self.client.requests, [])
+        self.assertEqual(next(items).name, "item-0")
+        self.assertEqual(self.client.requests, [{"offset": 0, "limit": 3, "severity": "critical", "json": None}])
+        self.assertEqual([item.name for item in items], [f"item-{index}" for index in range(1, 7)])
+        self.assertEqual([request["offset"] for request in self.client.requests], [0, 3, 6])
+
+    def test_page_number_pages(self):
+        names = [item.name for item in self.api.get_numbered_items()]
+
+        self.assertEqual(names, [item["name"] for item in ITEMS])
+        self.assertEqual([request["page"] for request in self.client.requests], [0, 1, 2])
+
+    def test_scroll_pages_read_ahead(self):
+        items = self.api.get_scrolled_items(Query(severity="major"))
+
+        self.assertEqual(next(items).name, "item-0")
+        names = ["item-0"] + [item.name for item in items]
+
+        self.assertEqual(names, [item["name"] for item in ITEMS])
+        self.assertEqual([request.get("scrollId") for request in self.client.requests], [None, "3", "6"])
+        self.assertTrue(all(json.loads(request["json"]) == {"severity": "major"} for request in self.client.requests))
+
+    def test_read_ahead_fetches_next_page_while_current_is_consumed(self):
+        fetched = Event()
+
+        def send(params: Dict[str, Any]) -> ManagerResponse:
+            if params["offset"] > 0:
+                fetched.set()
+            return page_response(params)
+
+        items = iterate_pages(send, lambda response: response.dataseq(Item), OffsetPagination(limit=3, read_ahead=True))
+
+        self.assertEqual(next(items).name, "item-0")
+        self.assertTrue(fetched.wait(timeout=5))
+        self.assertEqual(len(list(items)), 6)
+
+    @parameterized.expand([(OffsetPagination(limit=3),), (OffsetPagination(limit=3, read_ahead=True),)])
+    def test_abandoned_iteration_stops_requests(self, paginator):
+        client = Client()
+        items = iterate_pages(
+            lambda params: client.request("GET", "/items", params=params),
+            lambda response: response.dataseq(Item),
+            paginator,
+        )
+
+        next(items)
+        items.close()  # type: ignore[attr-defined]
+
+        self.assertLessEqual(len(client.requests), 2)
+
+    @parameterized.expand(
+        [
+            (OffsetPagination(limit=3),),
+            (PageNumberPagination(page_size=3),),
+            (OffsetPagination(limit=3, read_ahead=True),),
+        ]
+    )
+    def test_pagination_ignored_by_server(self, paginator):
+        sent = []
+
+        def send(params: Dict[str, Any]) -> ManagerResponse:
+            sent.append(params)
+            return page_response({"count": len(ITEMS)})  # whole collection regardless of page parameters
+
+        items = list(iterate_pages(send, lambda response: response.dataseq(Item), paginator))
+
+        self.assertEqual([item.name for item in items], [item["name"] for item in ITEMS])
+        self.assertEqual(len(sent), 1)
+
+    @parameterized.expand(
+        [
+            (OffsetPagination(limit=3),),
+            (PageNumberPagination(page_size=3),),
+            (OffsetPagination(limit=3, read_ahead=True),),
+        ]
+    )
+    def test_pagination_ignored_by_server_for_collection_of_page_size(self, paginator):
+        sent = []
+
+        def send(params: Dict[str, Any]) -> ManagerResponse:
+            sent.append(params)
+            return page_response({"count": 3})  # first 3 items (whole collection) regardless of page parameters
+
+        items = list(iterate_pages(send, lambda response: response.dataseq(Item), paginator))
+
+        self.assertEqual([item.name for item in items], ["item-0", "item-1", "item-2"])
+        self.assertEqual(len(sent), 2)  # second page repeats first one
+
+    def test_paginated_endpoint_must_return_iterator(self):
+        with self.assertRaises(APIEndpointError):
+
+            class InvalidAPI(APIEndpoints):
+                @get("/items", "data", paginate=OffsetPagination())
+                def get_items(self) -> DataSequence[Item]:
+                    ...
+
+
+class TestAsyncPagination(unittest.IsolatedAsyncioTestCase):
+    async def test_offset_pages_with_read_ahead(self):
+        client = AsyncClient()
+
+        names = [item.name async for item in ExampleAsyncAPI(client).get_items()]  # type: ignore[arg-type]
+
+        self.assertEqual(names, [item["name"] for item in ITEMS])
+        self.assertEqual([request["offset"] for request in client.requests], [0, 3, 6])
+
+    async def test_pagination_ignored_by_server_for_collection_of_page_size(self):
+        sent = []
+
+        async def send(params: Dict[str, Any]) -> ManagerResponse:
+            sent.append(params)
+            return page_response({"count": 3})
+
+        items = aiterate_pages(
+            send, lambda response: response.dataseq(Item), OffsetPagination(limit=3, read_ahead=True)
+        )
+
+        self.assertEqual([item.name async for item in items], ["item-0", "item-1", "item-2"])
+        self.assertEqual(len(sent), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
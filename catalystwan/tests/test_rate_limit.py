@@ -0,0 +1,175 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock
+from time import sleep
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from requests import Request, Response
+
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.rate_limit import AdaptiveConcurrency, LimiterChain, RequestLimiter, TokenBucket
+from catalystwan.session import ManagerSession
+
+
+class FakeClock:
+    """Replaces monotonic and sleep of rate_limit module, sleep advances time only when advance is set"""
+
+    def __init__(self, advance: bool):
+        self.now = 0.0
+        self.advance = advance
+        self.sleeps: List[float] = []
+        self._lock = Lock()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        with self._lock:
+            self.sleeps.append(round(delay, 6))
+            if self.advance:
+                self.now += delay
+
+
+class TestTokenBucket(unittest.TestCase):
+    def fake_clock(self, advance: bool) -> FakeClock:
+        clock = FakeClock(advance)
+        for name in ("monotonic", "sleep"):
+            patcher = patch(f"catalystwan.rate_limit.{name}", getattr(clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return clock
+
+    def test_burst_then_rate(self):
+        clock = self.fake_clock(advance=True)
+        bucket = TokenBucket(rate=50, capacity=5)
+
+        for _ in range(5):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+        for _ in range(10):
+            bucket.acquire()
+
+        self.assertEqual(clock.sleeps, [1 / 50] * 10)
+        self.assertAlmostEqual(clock.now, 10 / 50)
+
+    def test_shared_by_threads(self):
+        clock = self.fake_clock(advance=False)
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: bucket.acquire(), range(21)))
+
+        # each thread reserves its own token, so concurrent callers wait for consecutive tokens
+        self.assertEqual(sorted(clock.sleeps), [round(tokens / 100, 6) for tokens in range(1, 21)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def test_window_shrinks_on_throttling_and_grows_back(self):
+        limiter = AdaptiveConcurrency(initial_limit=8, min_limit=2, max_limit=10)
+
+        for _ in range(4):
+            limiter.acquire()
+        for _ in range(4):
+            limiter.release(429, 0.1)  # burst of throttled responses sent before decrease
+        self.assertEqual(limiter.limit, 4)
+
+        limiter.acquire()
+        limiter.release(503, 0.0)
+        self.assertEqual(limiter.limit, 2)
+
+        for _ in range(50):
+            limiter.acquire()
+            limiter.release(200, 0.01)
+        self.assertEqual(limiter.limit, 10)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_latency_spike_shrinks_window(self):
+        limiter = AdaptiveConcurrency(initial_limit=8, latency_threshold=1.0)
+
+        limiter.acquire()
+        limiter.release(200, 2.5)
+
+        self.assertEqual(limiter.limit, 4)
+
+    def test_connection_error_does_not_change_window(self):
+        limiter = AdaptiveConcurrency(initial_limit=8)
+
+        limiter.acquire()
+        limiter.release(None, None)
+
+        self.assertEqual(limiter.limit, 8)
+
+    def test_in_flight_requests_never_exceed_window(self):
+        limiter = AdaptiveConcurrency(initial_limit=3, max_limit=3)
+        lock = Lock()
+        in_flight = []
+        current = 0
+
+        def send(_):
+            nonlocal current
+            limiter.acquire()
+            with lock:
+                current += 1
+                in_flight.append(current)
+            sleep(0.005)
+            with lock:
+                current -= 1
+            limiter.release(200, 0.005)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(send, range(40)))
+
+        self.assertEqual(max(in_flight), 3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(initial_limit=8, max_limit=4)
+
+
+class TestSessionLimiter(unittest.TestCase):
+    def mocked_request(self, method, url, *args, **kwargs):
+        response = Response()
+        response.status_code = self.status_code
+        response.request = Request(method=method, url=url).prepare()
+        response.elapsed = timedelta(milliseconds=50)
+        response._content = b"{}"
+        return response
+
+    @patch("requests.sessions.Session.request")
+    def test_limiter_receives_response_status(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.status_code = 429
+        limiter = MagicMock(spec=RequestLimiter)
+        session = ManagerSession(url="example.com", username="admin", password="admin", limiter=limiter)
+
+        with self.assertRaises(ManagerHTTPError):
+            session.get("/dataservice/device")
+
+        limiter.acquire.assert_called_once_with()
+        limiter.release.assert_called_once_with(429, 0.05)
+
+    @patch("requests.sessions.Session.request")
+    def test_chain_shared_by_threads(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.status_code = 200
+        concurrency = AdaptiveConcurrency(initial_limit=2, max_limit=4)
+        limiter = LimiterChain(TokenBucket(rate=1000, capacity=10), concurrency)
+        session = ManagerSession(url="example.com", username="admin", password="admin", limiter=limiter)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get("/dataservice/device"), range(32)))
+
+        self.assertEqual(concurrency.in_flight, 0)
+        self.assertEqual(concurrency.limit, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
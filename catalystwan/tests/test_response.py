@@ -1,6 +1,8 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import json
 import unittest
+from timeit import timeit
 from typing import Any, List, Optional
 from unittest.mock import patch
 
@@ -10,10 +12,12 @@ from pydantic import BaseModel as BaseModelV2
 from pydantic import Field as FieldV2
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import Field as FieldV1
+from requests import Response
 
 from catalystwan.dataclasses import DataclassBase
 from catalystwan.response import ManagerErrorInfo, ManagerResponse
-from catalystwan.typed_list import DataSequence
+from catalystwan.tests.benchmark import benchmark
+from catalystwan.typed_list import DataSequence, LazyDataSequence
 
 
 @define
@@ -168,3 +172,102 @@ class TestResponse(unittest.TestCase):
             assert error_info.message is None
             assert error_info.details is None
             assert error_info.code is None
+
+    def test_json_decoded_lazily_once(self):
+        self.response_mock.json.return_value = {"data": [{"key1": "string", "key2": 66}]}
+        vmng_response = ManagerResponse(self.response_mock)
+        self.response_mock.json.assert_not_called()
+
+        vmng_response.json()
+        vmng_response.payload.data
+        vmng_response.dataseq(ParsedDataTypePydanticV2)
+
+        self.response_mock.json.assert_called_once()
+
+    @parameterized.expand(
+        [
+            ("application/octet-stream", False),
+            ("application/x-gzip", False),
+            ("application/json;charset=UTF-8", True),
+            ("application/problem+json", True),
+            ("text/plain", True),
+        ]
+    )
+    def test_payload_decoded_only_for_json_content(self, content_type: str, decoded: bool):
+        self.response_mock.headers = {"set-cookie": "", "content-type": content_type}
+        self.response_mock.json.return_value = {"data": "something"}
+        vmng_response = ManagerResponse(self.response_mock)
+
+        payload = vmng_response.payload
+
+        assert self.response_mock.json.called is decoded
+        assert payload.data == ("something" if decoded else None)
+
+
+def create_response(payload: Any) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["content-type"] = "application/json"
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+class TestDataseqBulkValidation(unittest.TestCase):
+    @parameterized.expand(PARSE_DATASEQ_TEST_DATA)
+    def test_same_result_as_per_item_validation(self, raises: bool, json: Any, expected_len: int, sourcekey: str):
+        vmng_response = ManagerResponse(create_response(json))
+        if not raises:
+            data_sequence = vmng_response.dataseq(ParsedDataTypePydanticV2, sourcekey)
+            data = json[sourcekey]
+            expected = [
+                ParsedDataTypePydanticV2.model_validate(item) for item in (data if isinstance(data, list) else [data])
+            ]
+            assert data_sequence == DataSequence(ParsedDataTypePydanticV2, expected)
+        else:
+            with self.assertRaises(Exception):
+                vmng_response.dataseq(ParsedDataTypePydanticV2, sourcekey)
+
+    def test_validated_from_raw_body_without_decoding(self):
+        vmng_response = ManagerResponse(create_response({"data": [{"key1": "string", "key2": 66}]}))
+
+        with patch.object(vmng_response, "_decode_json") as decode_json:
+            data_sequence = vmng_response.dataseq(ParsedDataTypePydanticV2)
+
+        decode_json.assert_not_called()
+        assert data_sequence[0] == ParsedDataTypePydanticV2(key1="string", key2=66)
+
+    def test_whole_payload_as_sequence(self):
+        vmng_response = ManagerResponse(create_response([{"key1": "a", "key2": 1}, {"key1": "b", "key2": 2}]))
+
+        assert [item.key1 for item in vmng_response.dataseq(ParsedDataTypePydanticV2, None)] == ["a", "b"]
+
+    @parameterized.expand([(ParsedDataTypeAttrs,), (ParsedDataTypePydanticV1,), (ParsedDataTypePydanticV2,)])
+    def test_lazy_dataseq(self, cls: Any):
+        items = [{"key1": f"item-{index}", "key2": index} for index in range(3)]
+        vmng_response = ManagerResponse(create_response({"data": items}))
+
+        data_sequence = vmng_response.dataseq(cls, lazy=True)
+
+        assert isinstance(data_sequence, LazyDataSequence)
+        assert data_sequence.created == 0
+        assert data_sequence[1].key1 == "item-1"
+        assert data_sequence.created == 1
+        assert data_sequence == vmng_response.dataseq(cls)
+
+    @benchmark
+    def test_benchmark_bulk_validation(self):
+        number = 5
+        items = [{"key1": f"item-{index}", "key2": index, "key3": index / 2} for index in range(10000)]
+        response = create_response({"header": {"generatedOn": 0}, "data": items})
+
+        bulk = timeit(lambda: ManagerResponse(response).dataseq(ParsedDataTypePydanticV2), number=number) / number
+        per_item = (
+            timeit(
+                lambda: [ParsedDataTypePydanticV2.model_validate(item) for item in response.json()["data"]],
+                number=number,
+            )
+            / number
+        )
+
+        # one validate_json call skips intermediate dicts and Python-level loop over items
+        self.assertLess(bulk, per_item)
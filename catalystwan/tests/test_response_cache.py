@@ -0,0 +1,287 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+from pydantic import BaseModel
+from requests import Request, Response
+
+from catalystwan.endpoints import APIEndpoints, AsyncAPIEndpoints, async_get, delete, get
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.response import ManagerResponse
+from catalystwan.response_cache import CachedResponse, CachePolicy, DiskBackend, MemoryBackend, ResponseCache
+from catalystwan.session import ManagerSession
+from catalystwan.typed_list import DataSequence
+
+
+class Tier(BaseModel):
+    name: str
+
+
+class TierParams(BaseModel):
+    vpn: int = 0
+
+
+class ExampleAPI(APIEndpoints):
+    @get("/device/tier", "data", cache=CachePolicy(ttl=60, tags=frozenset({"tiers"})))
+    def get_tiers(self) -> DataSequence[Tier]:
+        ...
+
+    @get("/device/tier/{name}", cache=CachePolicy(ttl=60, revalidate=False))
+    def get_tier(self, name: str, params: TierParams) -> dict:
+        ...
+
+    @delete("/device/tier/{name}", invalidates={"tiers"})
+    def delete_tier(self, name: str) -> None:
+        ...
+
+
+def cached(content: bytes, expires: float = 100.0, tags: frozenset = frozenset()) -> CachedResponse:
+    return CachedResponse(200, {}, content, "https://example.com", "utf-8", expires, tags)
+
+
+class TestBackends(unittest.TestCase):
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryBackend(maxsize=2)
+        backend.set("a", cached(b"a"))
+        backend.set("b", cached(b"b"))
+        backend.get("a")
+        backend.set("c", cached(b"c"))
+
+        self.assertEqual([key for key, _ in backend.items()], ["a", "c"])
+
+    def test_disk_backend_survives_new_instance(self):
+        with tempfile.TemporaryDirectory() as directory:
+            DiskBackend(directory).set("GET /dataservice/device/tier", cached(b"[]", tags=frozenset({"tiers"})))
+            cache = ResponseCache(DiskBackend(directory))
+
+            entry = cache.backend.get("GET /dataservice/device/tier")
+            cache.invalidate("tiers")
+
+            self.assertEqual(entry, cached(b"[]", tags=frozenset({"tiers"})))
+            self.assertIsNone(cache.backend.get("GET /dataservice/device/tier"))
+
+    @unittest.skipIf(os.name != "posix", "file permissions")
+    def test_disk_backend_entries_readable_only_by_owner(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir) / "responses"
+            backend = DiskBackend(directory)
+            backend.set("GET /dataservice/device", cached(b"\x00binary"))
+            (path,) = directory.glob("*.cache")
+
+            self.assertEqual(directory.stat().st_mode & 0o777, 0o700)
+            self.assertEqual(path.stat().st_mode & 0o777, 0o600)
+            self.assertEqual(backend.get("GET /dataservice/device"), cached(b"\x00binary"))
+
+            path.chmod(0o664)
+            self.assertIsNone(backend.get("GET /dataservice/device"))
+            self.assertEqual(list(backend.items()), [])
+
+    def test_disk_backend_does_not_store_cookies(self):
+        with tempfile.TemporaryDirectory() as directory:
+            entry = cached(b"[]")
+            entry.headers = {"Set-Cookie": "JSESSIONID=secret; Path=/", "ETag": '"v1"'}
+            DiskBackend(directory).set("GET /dataservice/device", entry)
+            (path,) = Path(directory).glob("*.cache")
+
+            self.assertNotIn(b"JSESSIONID", path.read_bytes())
+            self.assertEqual(DiskBackend(directory).get("GET /dataservice/device").headers, {"ETag": '"v1"'})
+
+    def test_disk_backend_ignores_invalid_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = DiskBackend(directory)
+            backend.set("GET /dataservice/device", cached(b"[]"))
+            (path,) = Path(directory).glob("*.cache")
+            path.write_bytes(b"\x80\x04pickle")
+
+            self.assertIsNone(backend.get("GET /dataservice/device"))
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="example.com", username="admin", password="admin")
+        self.session.response_cache = ResponseCache()
+        self.statuses: List[int] = []
+        self.requests: List[Request] = []
+
+    def mocked_request(self, method, url, *args, headers=None, **kwargs):
+        self.requests.append(Request(method=method, url=url, headers=headers, params=kwargs.get("params")))
+        response = Response()
+        response.status_code = self.statuses.pop(0) if self.statuses else 200
+        response.request = Request(method=method, url=url).prepare()
+        response.headers.update(
+            {"ETag": '"v1"', "Content-Type": "application/json", "Set-Cookie": "JSESSIONID=secret; Path=/"}
+        )
+        response._content = b'{"data": [{"name": "tier-%d"}]}' % len(self.requests)
+        return response
+
+    @patch("catalystwan.response_cache.time")
+    @patch("requests.sessions.Session.request")
+    def test_fresh_response_served_from_cache(self, mock_request, mock_time):
+        mock_request.side_effect = self.mocked_request
+        mock_time.return_value = 1000.0
+        api = ExampleAPI(self.session)
+
+        first = api.get_tiers()
+        second = api.get_tiers()
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual((self.session.response_cache.stats.hits, self.session.response_cache.stats.misses), (1, 1))
+
+    @patch("catalystwan.response_cache.time")
+    @patch("requests.sessions.Session.request")
+    def test_expired_response_revalidated_with_etag(self, mock_request, mock_time):
+        mock_request.side_effect = self.mocked_request
+        mock_time.return_value = 1000.0
+        api = ExampleAPI(self.session)
+        api.get_tiers()
+
+        mock_time.return_value = 1061.0
+        self.statuses = [304]
+        tiers = api.get_tiers()
+        mock_time.return_value = 1100.0
+        api.get_tiers()
+
+        self.assertEqual(tiers[0].name, "tier-1")
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.session.response_cache.stats.revalidations, 1)
+
+    @patch("catalystwan.response_cache.time")
+    @patch("requests.sessions.Session.request")
+    def test_expired_response_fetched_again_without_revalidation(self, mock_request, mock_time):
+        mock_request.side_effect = self.mocked_request
+        mock_time.return_value = 1000.0
+        api = ExampleAPI(self.session)
+        api.get_tier("gold", TierParams())
+
+        mock_time.return_value = 1061.0
+        api.get_tier("gold", TierParams())
+
+        self.assertNotIn("If-None-Match", self.requests[1].headers or {})
+        self.assertEqual(len(self.requests), 2)
+
+    @patch("requests.sessions.Session.request")
+    def test_responses_cached_per_url_and_params(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        api = ExampleAPI(self.session)
+
+        api.get_tier("gold", TierParams(vpn=1))
+        api.get_tier("gold", TierParams(vpn=2))
+        api.get_tier("silver", TierParams(vpn=1))
+        api.get_tier("gold", TierParams(vpn=1))
+
+        self.assertEqual(len(self.requests), 3)
+
+    @parameterized.expand(
+        [
+            ("other user", dict(username="operator")),
+            ("other tenant", dict(subdomain="tenant1.example.com")),
+            ("other server", dict(url="example.org")),
+        ]
+    )
+    @patch("requests.sessions.Session.request")
+    def test_backend_shared_by_sessions_serves_only_own_responses(self, _, other, mock_request):
+        mock_request.side_effect = self.mocked_request
+        parameters = dict(dict(url="example.com", username="admin", password="admin"), **other)
+        other_session = ManagerSession(**parameters)  # type: ignore[arg-type]
+        other_session.response_cache = ResponseCache(self.session.response_cache.backend)
+
+        ExampleAPI(self.session).get_tiers()
+        tiers = ExampleAPI(other_session).get_tiers()
+        ExampleAPI(self.session).get_tiers()
+
+        self.assertEqual(tiers[0].name, "tier-2")
+        self.assertEqual(len(self.requests), 2)
+
+    @patch("requests.sessions.Session.request")
+    def test_cookies_of_session_are_not_cached(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        ExampleAPI(self.session).get_tiers()
+
+        ((_, entry),) = self.session.response_cache.backend.items()
+
+        self.assertNotIn("Set-Cookie", entry.headers)
+        self.assertEqual(entry.headers["ETag"], '"v1"')
+
+    @patch("requests.sessions.Session.request")
+    def test_write_invalidates_tagged_responses(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        api = ExampleAPI(self.session)
+        api.get_tiers()
+        api.get_tier("gold", TierParams())
+
+        api.delete_tier("gold")
+        api.get_tiers()
+        api.get_tier("gold", TierParams())
+
+        self.assertEqual([request.method for request in self.requests], ["GET", "GET", "DELETE", "GET"])
+
+    @patch("requests.sessions.Session.request")
+    def test_error_responses_are_not_cached(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.statuses = [503]
+        api = ExampleAPI(self.session)
+
+        with self.assertRaises(ManagerHTTPError):
+            api.get_tiers()
+        api.get_tiers()
+
+        self.assertEqual(len(self.requests), 2)
+
+    @patch("requests.sessions.Session.request")
+    def test_session_without_cache_sends_each_request(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.session.response_cache = None
+        api = ExampleAPI(self.session)
+
+        api.get_tiers()
+        api.get_tiers()
+
+        self.assertEqual(len(self.requests), 2)
+
+
+class ExampleAsyncAPI(AsyncAPIEndpoints):
+    @async_get("/device/tier", "data", cache=CachePolicy(ttl=60))
+    async def get_tiers(self) -> DataSequence[Tier]:
+        ...
+
+
+class AsyncClient:
+    api_version = None
+    session_type = None
+
+    def __init__(self):
+        self.response_cache = ResponseCache()
+        self.sent = 0
+
+    async def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.sent += 1
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"data": [{"name": "gold"}]}'
+        return ManagerResponse(response)
+
+
+class TestAsyncResponseCache(unittest.IsolatedAsyncioTestCase):
+    async def test_fresh_response_served_from_cache(self):
+        client = AsyncClient()
+        api = ExampleAsyncAPI(client)  # type: ignore[arg-type]
+
+        await api.get_tiers()
+        tiers = await api.get_tiers()
+
+        self.assertEqual(tiers[0].name, "gold")
+        self.assertEqual(client.sent, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
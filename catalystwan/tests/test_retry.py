@@ -0,0 +1,162 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+
+import unittest
+from typing import List, Union
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+from requests import ConnectionError, ConnectTimeout, Request, Response
+
+from catalystwan.endpoints import APIEndpoints, get, post
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+from catalystwan.retry import RetryPolicy
+from catalystwan.session import ManagerSession
+
+NO_WAIT = RetryPolicy(initial_delay=0, jitter=0, respect_retry_after=False)
+
+
+def http_error(status_code: int, headers: dict = {}) -> ManagerHTTPError:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return ManagerHTTPError(error_info=None, request=None, response=response)
+
+
+def connection_error(cause: Exception) -> ManagerRequestException:
+    try:
+        raise ManagerRequestException() from cause
+    except ManagerRequestException as error:
+        return error
+
+
+class ExampleAPI(APIEndpoints):
+    @get("/device", retry=NO_WAIT)
+    def get_devices(self) -> dict:
+        ...
+
+    @post("/device/action")
+    def action(self) -> None:
+        ...
+
+    @get("/device/once", retry=RetryPolicy(max_attempts=1))
+    def get_once(self) -> dict:
+        ...
+
+
+class ExampleRetriedAPI(APIEndpoints):
+    retry_policy = RetryPolicy(max_attempts=2, initial_delay=0, jitter=0)
+
+    @post("/statistics")
+    def get_statistics(self) -> dict:
+        ...
+
+
+class TestRetryPolicy(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("GET", http_error(503), True),
+            ("GET", http_error(500), False),
+            ("POST", http_error(503), False),
+            ("POST", http_error(429), True),
+            ("GET", connection_error(ConnectionError()), True),
+            ("POST", connection_error(ConnectionError()), False),
+            ("POST", connection_error(ConnectTimeout()), True),
+            ("GET", connection_error(ValueError()), False),
+        ]
+    )
+    def test_is_retryable(self, method: str, error: ManagerRequestException, expected: bool):
+        self.assertEqual(RetryPolicy().is_retryable(method, error), expected)
+
+    def test_backoff_is_exponential_with_jitter(self):
+        policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5, jitter=0.5)
+
+        for attempt, expected in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+            delay = policy.backoff(attempt)
+            self.assertLessEqual(delay, expected)
+            self.assertGreaterEqual(delay, expected / 2)
+
+    def test_backoff_respects_retry_after(self):
+        policy = RetryPolicy(initial_delay=0.1, max_delay=5, jitter=0)
+
+        self.assertEqual(policy.backoff(1, http_error(429, {"Retry-After": "3"}).response), 3)
+        self.assertEqual(policy.backoff(1, http_error(429, {"Retry-After": "300"}).response), 5)
+
+    def test_next_delay_stops_after_max_attempts_or_elapsed_time(self):
+        policy = RetryPolicy(max_attempts=3, initial_delay=1, jitter=0, max_elapsed_time=10)
+
+        self.assertEqual(policy.next_delay("GET", 1, 0.0, http_error(503)), 1)
+        self.assertIsNone(policy.next_delay("GET", 3, 0.0, http_error(503)))
+        self.assertIsNone(policy.next_delay("GET", 1, 9.5, http_error(503)))
+        self.assertIsNone(policy.next_delay("GET", 1, 0.0, http_error(404)))
+
+
+class TestSessionRetry(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="example.com", username="admin", password="admin")
+        self.outcomes: List[Union[int, Exception]] = []
+        self.calls = 0
+
+    def mocked_request(self, method, url, *args, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = Response()
+        response.status_code = outcome
+        response.request = Request(method=method, url=url).prepare()
+        response._content = b"{}"
+        return response
+
+    @patch("requests.sessions.Session.request")
+    def test_decorator_policy_retries_transient_failures(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.outcomes = [ConnectionError("Connection reset by peer"), 503]
+
+        self.assertEqual(ExampleAPI(self.session).get_devices(), {})
+        self.assertEqual(self.calls, 3)
+
+    @patch("requests.sessions.Session.request")
+    def test_no_policy_no_retry(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.outcomes = [503]
+
+        with self.assertRaises(ManagerHTTPError):
+            ExampleAPI(self.session).action()
+        self.assertEqual(self.calls, 1)
+
+    @patch("requests.sessions.Session.request")
+    def test_session_policy_does_not_retry_non_idempotent_request(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.session.retry_policy = NO_WAIT
+        self.outcomes = [503, 503]
+
+        with self.assertRaises(ManagerHTTPError):
+            ExampleAPI(self.session).action()
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.session.get("/dataservice/device").status_code, 200)
+        self.assertEqual(self.calls, 3)
+
+    @patch("requests.sessions.Session.request")
+    def test_class_policy_applies_to_all_endpoints(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.outcomes = [429, 429]
+
+        with self.assertRaises(ManagerHTTPError):
+            ExampleRetriedAPI(self.session).get_statistics()
+        self.assertEqual(self.calls, 2)
+
+    @patch("requests.sessions.Session.request")
+    def test_decorator_policy_overrides_session_policy(self, mock_request):
+        mock_request.side_effect = self.mocked_request
+        self.session.retry_policy = NO_WAIT
+        self.outcomes = [503]
+
+        with self.assertRaises(ManagerHTTPError):
+            ExampleAPI(self.session).get_once()
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
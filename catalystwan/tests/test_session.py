@@ -1,7 +1,14 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
+import hashlib
+import os
+import tempfile
 import unittest
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Barrier, Thread, local
+from typing import List, Optional
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -9,6 +16,7 @@ import pytest  # type: ignore
 from parameterized import parameterized  # type: ignore
 from requests import HTTPError, Request, RequestException, Response
 
+from catalystwan.endpoints.client import ServerInfo
 from catalystwan.exceptions import CatalystwanException, ManagerHTTPError, ManagerRequestException
 from catalystwan.session import ManagerSession
 
@@ -159,5 +167,155 @@ class TestSessionExceptions(unittest.TestCase):
                 self.session.request(self.response.request.method, self.response.request.url)
 
 
+class TestSessionRelogin(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="domain.com", username="user", password="<>")
+        self.threads = 8
+        self.barrier = Barrier(self.threads)
+        self.thread_context = local()
+
+    def mocked_request(self, method, url, *args, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response.request = Request(method=method, url=url).prepare()
+        response._content = b"{}"
+        if not getattr(self.thread_context, "sent", False):
+            # first request in each thread is answered after all threads sent it, with expired session cookie
+            self.thread_context.sent = True
+            self.barrier.wait()
+            response.headers["set-cookie"] = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+        return response
+
+    @patch("catalystwan.session.ManagerSession.server")
+    @patch("catalystwan.session.vManageAuth")
+    @patch("requests.sessions.Session.request")
+    def test_concurrent_expired_session_triggers_single_login(self, mock_request, mock_auth, mock_server):
+        # Arrange
+        mock_request.side_effect = self.mocked_request
+        mock_auth.return_value.set_cookie.get.return_value = "valid"
+        mock_server.return_value = ServerInfo.parse_obj({})
+
+        # Act
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            responses = list(executor.map(lambda _: self.session.get("/dataservice/device"), range(self.threads)))
+
+        # Assert
+        mock_auth.assert_called_once()
+        self.assertEqual(mock_request.call_count, 2 * self.threads)
+        self.assertFalse(any(response.jsessionid_expired for response in responses))
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    content = os.urandom(300_000)
+    ranges: List[Optional[str]] = []
+    truncate_next = 0
+
+    def do_GET(self):
+        self.ranges.append(range_header := self.headers.get("Range"))
+        start = int(range_header[len("bytes=") : -1]) if range_header else 0
+        if start >= len(self.content):
+            self.send_response(416)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = self.content[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(self.content) - 1}/{len(self.content)}")
+        self.end_headers()
+        if FileHandler.truncate_next:
+            FileHandler.truncate_next -= 1
+            self.wfile.write(body[:100_000])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSessionGetFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+        cls.server.daemon_threads = True
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FileHandler.ranges = []
+        FileHandler.truncate_next = 0
+        self.session = ManagerSession(
+            url=f"http://127.0.0.1:{self.server.server_address[1]}", username="user", password="<>"
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.tmpdir.name) / "admintech.tar.gz"
+        self.progress: List[tuple] = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_get_file_streams_chunks(self):
+        response = self.session.get_file(
+            "/dataservice/file", self.filename, chunk_size=65536, checksum="sha256", progress=self.on_progress
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.filename.read_bytes(), FileHandler.content)
+        self.assertEqual(response.checksum, hashlib.sha256(FileHandler.content).hexdigest())
+        self.assertEqual(len(self.progress), 5)
+        self.assertEqual(self.progress[-1], (300_000, 300_000))
+        self.assertEqual(FileHandler.ranges, [None])
+
+    def test_get_file_resumes_partial_download(self):
+        self.filename.write_bytes(FileHandler.content[:120_000])
+
+        response = self.session.get_file(
+            "/dataservice/file", self.filename, resume=True, checksum="md5", progress=self.on_progress
+        )
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(self.filename.read_bytes(), FileHandler.content)
+        self.assertEqual(response.checksum, hashlib.md5(FileHandler.content).hexdigest())
+        self.assertEqual(self.progress[-1], (300_000, 300_000))
+        self.assertEqual(FileHandler.ranges, ["bytes=120000-"])
+
+    def test_get_file_resume_of_complete_file(self):
+        self.filename.write_bytes(FileHandler.content)
+
+        response = self.session.get_file("/dataservice/file", self.filename, resume=True, checksum="sha256")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(self.filename.read_bytes(), FileHandler.content)
+        self.assertEqual(response.checksum, hashlib.sha256(FileHandler.content).hexdigest())
+
+    def test_get_file_retries_interrupted_transfer(self):
+        FileHandler.truncate_next = 2
+
+        response = self.session.get_file(
+            "/dataservice/file", self.filename, chunk_size=10_000, retries=2, checksum="sha256"
+        )
+
+        self.assertEqual(self.filename.read_bytes(), FileHandler.content)
+        self.assertEqual(response.checksum, hashlib.sha256(FileHandler.content).hexdigest())
+        self.assertEqual(FileHandler.ranges, [None, "bytes=100000-", "bytes=200000-"])
+
+    def test_get_file_raises_when_retries_exhausted(self):
+        FileHandler.truncate_next = 2
+
+        with self.assertRaises(RequestException):
+            self.session.get_file("/dataservice/file", self.filename, chunk_size=10_000, retries=1)
+
+    def on_progress(self, downloaded: int, total: Optional[int]) -> None:
+        self.progress.append((downloaded, total))
+
+
 if __name__ == "__main__":
     unittest.main()
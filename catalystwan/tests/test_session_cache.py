@@ -0,0 +1,218 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Dict, Optional
+from unittest.mock import patch
+
+from catalystwan.session import create_manager_session
+from catalystwan.session_cache import CachedSession, FileSessionCache, SessionCache, session_cache_key
+from catalystwan.utils.session_type import SessionType
+
+try:
+    import cryptography  # type: ignore
+except ImportError:
+    cryptography = None
+
+
+class ManagerHandler(BaseHTTPRequestHandler):
+    """vManage answering with login page to requests with unknown JSESSIONID"""
+
+    protocol_version = "HTTP/1.1"
+    lock = Lock()
+    requests: Counter = Counter()
+    sessions: set = set()
+    expire_next = False
+
+    def do_POST(self):
+        self.route()
+
+    def do_GET(self):
+        self.route()
+
+    def route(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        path = self.path.split("?")[0]
+        with self.lock:
+            self.requests[path] += 1
+            if path == "/j_security_check":
+                jsessionid = f"session-{self.requests[path]}"
+                self.sessions.add(jsessionid)
+                return self.reply(b"", {"Set-Cookie": f"JSESSIONID={jsessionid}; Path=/"})
+            if path == "/dataservice/client/token":
+                return self.reply(b"token", content_type="text/plain")
+            cookie = self.headers.get("Cookie", "")
+            if not any(f"JSESSIONID={jsessionid}" in cookie for jsessionid in self.sessions):
+                return self.reply(b"<html>login</html>", content_type="text/html")
+            if ManagerHandler.expire_next:
+                ManagerHandler.expire_next = False
+                self.sessions.clear()
+                expired = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/"
+                return self.reply(b"{}", {"Set-Cookie": expired})
+            if path == "/dataservice/client/server":
+                modes = {"tenancyMode": "SingleTenant", "userMode": "tenant", "viewMode": "tenant"}
+                return self.reply({"data": {**modes, "server": "vmanage", "platformVersion": "20.12.1"}})
+            if path == "/dataservice/client/about":
+                return self.reply({"data": {"version": "20.12.1"}})
+            if path == "/dataservice/device":
+                return self.reply({"data": []})
+            if path == "/logout":
+                return self.reply(b"")
+        self.reply(b"", status=404)
+
+    def reply(self, body, headers: Dict[str, str] = {}, status: int = 200, content_type: str = "application/json"):
+        content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestFileSessionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmpdir.name) / "sessions"
+        self.cache = FileSessionCache(self.directory)
+        self.key = session_cache_key("https://vmanage:8443", "admin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_store_and_load(self):
+        session = CachedSession("jsessionid", "token", {"platformVersion": "20.12.1"})
+
+        self.cache.store(self.key, session)
+
+        self.assertEqual(self.cache.load(self.key), session)
+        self.assertIsNone(self.cache.load(session_cache_key("https://vmanage:8443", "admin", "tenant.example.com")))
+
+    @unittest.skipIf(os.name != "posix", "file permissions")
+    def test_files_readable_only_by_owner(self):
+        self.cache.store(self.key, CachedSession("jsessionid", "token"))
+
+        self.assertEqual(self.directory.stat().st_mode & 0o777, 0o700)
+        self.assertEqual(self.cache.path(self.key).stat().st_mode & 0o777, 0o600)
+
+        self.cache.path(self.key).chmod(0o644)
+        self.assertIsNone(self.cache.load(self.key))
+
+    def test_max_age(self):
+        self.cache.max_age = 60
+        self.cache.store(self.key, CachedSession("jsessionid", "token", created=0))
+
+        self.assertIsNone(self.cache.load(self.key))
+        self.assertFalse(self.cache.path(self.key).exists())
+
+    def test_corrupted_entry_is_removed(self):
+        self.cache.store(self.key, CachedSession("jsessionid", "token"))
+        self.cache.path(self.key).write_bytes(b"{")
+
+        self.assertIsNone(self.cache.load(self.key))
+        self.assertFalse(self.cache.path(self.key).exists())
+
+    def test_cache_without_delete_cannot_be_created(self):
+        class IncompleteCache(SessionCache):
+            def load(self, key: str) -> Optional[CachedSession]:
+                return None
+
+            def store(self, key: str, session: CachedSession) -> None:
+                pass
+
+        with self.assertRaises(TypeError):
+            IncompleteCache()  # type: ignore[abstract]
+
+    @unittest.skipIf(cryptography is None, "cryptography not installed")
+    def test_encrypted(self):
+        cache = FileSessionCache(self.directory, encryption_key=FileSessionCache.generate_key())
+        cache.store(self.key, CachedSession("jsessionid", "token"))
+
+        self.assertNotIn(b"jsessionid", cache.path(self.key).read_bytes())
+        self.assertEqual(cache.load(self.key).jsessionid, "jsessionid")
+        self.assertIsNone(FileSessionCache(self.directory, FileSessionCache.generate_key()).load(self.key))
+
+
+class TestSessionCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ManagerHandler)
+        cls.server.daemon_threads = True
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ManagerHandler.requests = Counter()
+        ManagerHandler.sessions = set()
+        ManagerHandler.expire_next = False
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = FileSessionCache(Path(self.tmpdir.name))
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def create_session(self):
+        return create_manager_session(self.url, "admin", "<>", session_cache=self.cache)
+
+    def test_cached_session_is_reused(self):
+        with self.create_session() as session:
+            session.get("/dataservice/device")
+
+        with self.create_session() as session:
+            session.get("/dataservice/device")
+
+        self.assertEqual(session.session_type, SessionType.SINGLE_TENANT)
+        self.assertEqual(str(session.api_version), "20.12")
+        self.assertEqual(session.server_name, "vmanage")
+        self.assertEqual(ManagerHandler.requests["/j_security_check"], 1)
+        self.assertEqual(ManagerHandler.requests["/dataservice/client/server"], 1)
+        self.assertEqual(ManagerHandler.requests["/dataservice/client/about"], 1)
+        self.assertEqual(ManagerHandler.requests["/logout"], 0)
+
+    def test_session_not_accepted_by_server_is_replaced(self):
+        self.create_session().close()
+        ManagerHandler.sessions.clear()
+
+        session = self.create_session()
+
+        self.assertEqual(session.get("/dataservice/device").json(), {"data": []})
+        self.assertEqual(ManagerHandler.requests["/j_security_check"], 2)
+        self.assertEqual(self.cache.load(session.session_cache_key).jsessionid, "session-2")
+
+    def test_session_expired_during_use_is_replaced(self):
+        session = self.create_session()
+        ManagerHandler.expire_next = True
+
+        with patch.object(self.cache, "load", wraps=self.cache.load) as load:
+            self.assertEqual(session.get("/dataservice/device").json(), {"data": []})
+
+        load.assert_called_once()
+        self.assertEqual(ManagerHandler.requests["/dataservice/client/about"], 0)  # expired session is not probed
+        self.assertEqual(self.cache.load(session.session_cache_key).jsessionid, "session-2")
+
+    def test_logout_removes_cached_session(self):
+        session = self.create_session()
+
+        session.logout()
+
+        self.assertIsNone(self.cache.load(session.session_cache_key))
+        self.assertEqual(ManagerHandler.requests["/logout"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import csv
+import io
+import unittest
+from typing import List, Optional
+
+from parameterized import parameterized  # type: ignore
+from pydantic import BaseModel, Field
+
+from catalystwan.dataclasses import Device
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.creation_tools import create_dataclass
+from catalystwan.utils.personality import Personality
+from catalystwan.utils.table import Column, CsvTableWriter, ParquetTableWriter, TableWriter, model_columns
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:
+    pyarrow = None
+
+
+class OmpRoute(BaseModel):
+    prefix: str
+    vpn_id: int = Field(alias="vpn-id")
+    originator: Optional[str] = None
+
+
+def devices(count: int) -> DataSequence[Device]:
+    return DataSequence(
+        Device,
+        [
+            create_dataclass(
+                Device,
+                {
+                    "deviceId": f"10.0.0.{index}",
+                    "uuid": f"uuid-{index}",
+                    "personality": "vsmart" if index % 2 else "vedge",
+                    "host-name": f"edge-{index}",
+                    "reachability": "reachable",
+                    "local-system-ip": f"10.0.0.{index}",
+                },
+            )
+            for index in range(count)
+        ],
+    )
+
+
+ROUTES = DataSequence(OmpRoute, [OmpRoute.model_validate({"prefix": f"10.{i}.0.0/16", "vpn-id": i}) for i in range(3)])
+
+
+class TestTable(unittest.TestCase):
+    def test_model_columns(self):
+        self.assertEqual(
+            model_columns(OmpRoute),
+            [Column("prefix", "prefix"), Column("vpn_id", "vpn-id"), Column("originator", "originator")],
+        )
+        self.assertIn(Column("hostname", "host-name"), model_columns(Device))
+
+    def test_to_columns(self):
+        columns = devices(3).to_columns(["hostname", "personality", "deviceId"])
+
+        self.assertEqual(
+            columns,
+            {
+                "hostname": ["edge-0", "edge-1", "edge-2"],
+                "personality": ["vedge", "vsmart", "vedge"],
+                "id": ["10.0.0.0", "10.0.0.1", "10.0.0.2"],
+            },
+        )
+        self.assertIs(type(columns["personality"][0]), str)
+
+    @parameterized.expand([(False, ["prefix", "vpn_id"]), (True, ["prefix", "vpn-id"])])
+    def test_to_columns_by_alias(self, by_alias: bool, names: List[str]):
+        self.assertEqual(list(ROUTES.to_columns(["prefix", "vpn_id"], by_alias=by_alias)), names)
+
+    def test_to_records(self):
+        self.assertEqual(
+            ROUTES.to_records(["vpn-id", "prefix"]), [(0, "10.0.0.0/16"), (1, "10.1.0.0/16"), (2, "10.2.0.0/16")]
+        )
+        self.assertEqual(DataSequence(OmpRoute).to_records(), [])
+
+    def test_csv_writer_streams_chunks(self):
+        file = io.StringIO()
+        iterator = iter(devices(5))
+
+        with CsvTableWriter(file, Device, ["uuid", "personality"], by_alias=True, chunk_size=2) as writer:
+            writer.write(iterator)
+
+        rows = list(csv.reader(io.StringIO(file.getvalue())))
+        self.assertEqual(rows[0], ["uuid", "personality"])
+        self.assertEqual(rows[1:], [[f"uuid-{i}", "vsmart" if i % 2 else "vedge"] for i in range(5)])
+        self.assertEqual(writer.rows_written, 5)
+
+    def test_writer_without_write_columns_cannot_be_created(self):
+        class IncompleteWriter(TableWriter):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteWriter(Device)  # type: ignore[abstract]
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ROUTES.to_columns(format="xml")  # type: ignore[arg-type]
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_to_numpy(self):
+        columns = ROUTES.to_columns(format="numpy")
+
+        self.assertEqual(columns["vpn_id"].tolist(), [0, 1, 2])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow not installed")
+    def test_to_arrow_and_parquet(self):
+        import pyarrow.parquet  # type: ignore
+
+        table = devices(4).to_columns(["hostname", "personality"], format="arrow")
+        self.assertEqual(
+            table.column("personality").to_pylist(), [p.value for p in [Personality.EDGE, Personality.VSMART] * 2]
+        )
+
+        sink = pyarrow.BufferOutputStream()
+        with ParquetTableWriter(sink, OmpRoute, chunk_size=2) as writer:
+            writer.write(ROUTES)
+        self.assertEqual(pyarrow.parquet.read_table(pyarrow.BufferReader(sink.getvalue())).num_rows, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,12 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
 import unittest
-from unittest.mock import patch
+from collections import Counter
+from threading import Lock
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
 
-from catalystwan.api.task_status_api import Task
+from catalystwan.api.task_status_api import Task, TaskWatcher
 from catalystwan.endpoints.configuration_dashboard_status import ConfigurationDashboardStatus, TaskData
 from catalystwan.exceptions import TaskValidationError
 
@@ -376,3 +379,79 @@ class TestTaskStatusApi(unittest.TestCase):
 
         # Act&Assert
         self.assertRaises(TaskValidationError, self.task.wait_for_completed)
+
+
+def task_data(*statuses: str) -> TaskData:
+    return TaskData.parse_obj(
+        {
+            "data": [
+                {"status": status, "statusId": status.lower(), "activity": [], "uuid": f"device-{index}"}
+                for index, status in enumerate(statuses)
+            ]
+        }
+    )
+
+
+class TestTaskWatcher(unittest.TestCase):
+    def setUp(self):
+        self.lock = Lock()
+        self.polls: Counter = Counter()
+        # statuses returned by consecutive polls of each task, last one is repeated
+        self.responses: Dict[str, List[TaskData]] = {}
+        self.watcher = TaskWatcher(MagicMock(), min_interval=0.01, max_interval=0.05, timeout_seconds=5)
+
+    def tearDown(self):
+        self.watcher.close()
+
+    def find_status(self, task_id: str) -> TaskData:
+        with self.lock:
+            self.polls[task_id] += 1
+            responses = self.responses[task_id]
+            return responses[min(self.polls[task_id], len(responses)) - 1]
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_as_completed(self, mock_find_status):
+        mock_find_status.side_effect = self.find_status
+        for index in range(50):
+            self.responses[f"task-{index}"] = [task_data("In progress")] * (index % 5) + [task_data("Success")]
+        self.responses["failed"] = [task_data("Success", "Failure")]
+
+        results = list(self.watcher.as_completed([*self.responses, "task-0"]))
+
+        self.assertEqual(len(results), 51)
+        self.assertEqual({result.task_id for result in results if not result.result}, {"failed"})
+        self.assertEqual(self.polls["task-0"], 1)  # duplicate task ID is polled once
+        self.assertEqual(self.polls["task-4"], 5)
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_interval_backs_off_while_status_does_not_change(self, mock_find_status):
+        mock_find_status.side_effect = self.find_status
+        self.responses["long"] = [task_data("In progress")]
+
+        result = self.watcher.watch("long", timeout_seconds=0.5).result(timeout=5)
+
+        self.assertFalse(result.result)
+        # polling with min_interval only would take 50 polls
+        self.assertLess(self.polls["long"], 20)
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    def test_callback_and_error(self, mock_find_status):
+        mock_find_status.side_effect = self.find_status
+        self.responses["ok"] = [task_data("Success")]
+        self.responses["invalid"] = [TaskData.parse_obj({"validation": {"status": "Failure", "statusId": "failure"}})]
+        callback = MagicMock()
+
+        self.watcher.watch("ok", callback=callback).result(timeout=5)
+        with self.assertRaises(TaskValidationError):
+            self.watcher.watch("invalid", callback=callback).result(timeout=5)
+
+        callback.assert_called_once()
+        self.assertEqual(callback.call_args[0][0].task_id, "ok")
+
+    def test_closed_watcher_cancels_pending_tasks(self):
+        self.watcher.min_interval = 60
+        with patch.object(ConfigurationDashboardStatus, "find_status", return_value=task_data("In progress")):
+            future = self.watcher.watch("pending")
+            self.watcher.close()
+
+        self.assertTrue(future.cancelled())
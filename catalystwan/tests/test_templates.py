@@ -1,8 +1,9 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from attr import evolve  # type: ignore
 from parameterized import parameterized  # type: ignore
 
 from catalystwan.api.task_status_api import SubTaskData, TaskResult
@@ -12,7 +13,9 @@ from catalystwan.api.templates.device_template.device_template import DeviceTemp
 from catalystwan.api.templates.feature_template import FeatureTemplate
 from catalystwan.api.templates.models.cisco_aaa_model import CiscoAAAModel
 from catalystwan.api.templates.payloads.aaa.aaa_model import AAAModel, AuthenticationOrder
-from catalystwan.dataclasses import Device, FeatureTemplateInfo, TemplateInfo
+from catalystwan.dataclasses import Device, DeviceTemplateInfo, FeatureTemplateInfo, TemplateInfo
+from catalystwan.endpoints.configuration_dashboard_status import ConfigurationDashboardStatus, TaskData
+from catalystwan.exceptions import TemplateNotFoundError
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
 from catalystwan.utils.device_model import DeviceModel
@@ -262,6 +265,130 @@ class TestTemplatesAPI(unittest.TestCase):
         assert not mock_create_by_generator.called
 
     # @patch.object(TemplatesAPI, "templates")
+    def attach_many_session(self, statuses):
+        """Session answering to attach_many requests, attach task statuses are given by device UUID
+        ("Rejected" fails attach request, "Invalid" fails validation of attach task)"""
+        session = MagicMock()
+        self.attached = {}
+
+        columns = [{"property": "csv-deviceId"}, {"property": "//system/site-id"}]
+
+        def post(url, json):
+            if url.endswith("exportcsv"):
+                return MagicMock(json=lambda: {"header": {"columns": columns}})
+            uuids = [device["csv-deviceId"] for device in json["deviceTemplateList"][0]["device"]]
+            if any(statuses[uuid] == "Rejected" for uuid in uuids):
+                raise ConnectionError("rejected")
+            task_id = f"task-{len(self.attached)}"
+            self.attached[task_id] = uuids
+            return MagicMock(json=lambda: {"id": task_id})
+
+        def find_status(task_id):
+            if any(statuses[uuid] == "Invalid" for uuid in self.attached[task_id]):
+                return TaskData.parse_obj({"validation": {"status": "Failure", "statusId": "failure"}})
+            data = [
+                {"status": statuses[uuid], "statusId": "done", "activity": [], "uuid": uuid}
+                for uuid in self.attached[task_id]
+            ]
+            return TaskData.parse_obj({"data": data})
+
+        session.post.side_effect = post
+        return session, find_status
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    @patch.object(TemplatesAPI, "get")
+    def test_attach_many(self, mock_get, mock_find_status):
+        # Arrange
+        template = dict(self.data_template[0], configType="template")
+        mock_get.return_value = DataSequence(DeviceTemplateInfo, [create_dataclass(DeviceTemplateInfo, template)])
+        devices = [evolve(self.device_info, uuid=f"uuid-{i}") for i in range(5)]
+        statuses = {device.uuid: "Success" for device in devices}
+        statuses["uuid-3"] = "Failure"
+        session, mock_find_status.side_effect = self.attach_many_session(statuses)
+        variables = {device.uuid: {"//system/site-id": i} for i, device in enumerate(devices)}
+
+        # Act
+        results = TemplatesAPI(session).attach_many("template_1", devices, variables, chunk_size=2)
+
+        # Assert
+        self.assertEqual(results, {device.uuid: device.uuid != "uuid-3" for device in devices})
+        self.assertEqual(list(self.attached.values()), [["uuid-0", "uuid-1"], ["uuid-2", "uuid-3"], ["uuid-4"]])
+        mock_get.assert_called_once()
+        self.assertEqual(session.post.call_count, 1 + 3)  # single exportcsv and attach request per chunk
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    @patch.object(TemplatesAPI, "get")
+    def test_attach_many_failed_chunks(self, mock_get, mock_find_status):
+        # Arrange
+        template = dict(self.data_template[0], configType="template")
+        mock_get.return_value = DataSequence(DeviceTemplateInfo, [create_dataclass(DeviceTemplateInfo, template)])
+        devices = [evolve(self.device_info, uuid=f"uuid-{i}") for i in range(6)]
+        statuses = {"uuid-0": "Invalid", "uuid-1": "Success", "uuid-2": "Rejected", "uuid-3": "Success"}
+        statuses.update({"uuid-4": "Success", "uuid-5": "Success"})
+        session, mock_find_status.side_effect = self.attach_many_session(statuses)
+        variables = {device.uuid: {"//system/site-id": 1} for device in devices}
+
+        # Act
+        with self.assertLogs("catalystwan.api.template_api", level="ERROR") as logs:
+            results = TemplatesAPI(session).attach_many("template_1", devices, variables, chunk_size=2)
+
+        # Assert
+        expected = {"uuid-0": False, "uuid-1": False, "uuid-2": False, "uuid-3": False, "uuid-4": True, "uuid-5": True}
+        self.assertEqual(results, expected)
+        self.assertEqual(list(self.attached.values()), [["uuid-0", "uuid-1"], ["uuid-4", "uuid-5"]])
+        self.assertTrue(any("attach tasks already submitted: ['task-0']" in line for line in logs.output))
+        self.assertTrue(any("TaskValidationError" in line for line in logs.output))
+
+    @patch.object(TemplatesAPI, "get")
+    def test_attach_many_errors(self, mock_get):
+        # Arrange
+        template = dict(self.data_template[0], configType="template")
+        mock_get.return_value = DataSequence(DeviceTemplateInfo, [create_dataclass(DeviceTemplateInfo, template)])
+        session, _ = self.attach_many_session({})
+
+        # Act & Assert
+        with self.assertRaises(TemplateNotFoundError):
+            TemplatesAPI(session).attach_many("no_exist_template", [self.device_info])
+        with self.assertRaises(TypeError):  # value of //system/site-id not provided
+            TemplatesAPI(session).attach_many("template_1", [self.device_info])
+        self.assertEqual(self.attached, {})
+
+    @patch.object(TemplatesAPI, "_attach_cli")
+    @patch.object(TemplatesAPI, "get")
+    def test_attach_many_cli_template(self, mock_get, mock_attach_cli):
+        # Arrange
+        template = dict(self.data_template[0], configType="file")
+        mock_get.return_value = DataSequence(DeviceTemplateInfo, [create_dataclass(DeviceTemplateInfo, template)])
+        devices = [evolve(self.device_info, uuid=f"uuid-{i}") for i in range(3)]
+        mock_attach_cli.side_effect = lambda name, device, timeout_seconds: device.uuid != "uuid-1"
+        session, _ = self.attach_many_session({})
+
+        # Act
+        results = TemplatesAPI(session).attach_many("template_1", devices, timeout_seconds=60)
+
+        # Assert
+        self.assertEqual(results, {"uuid-0": True, "uuid-1": False, "uuid-2": True})
+        self.assertEqual([call.args[1] for call in mock_attach_cli.call_args_list], devices)
+        session.post.assert_not_called()
+
+    @patch.object(ConfigurationDashboardStatus, "find_status")
+    @patch.object(TemplatesAPI, "get")
+    def test_attach_feature_template_resolved_once(self, mock_get, mock_find_status):
+        # Arrange
+        template = dict(self.data_template[0], configType="template")
+        mock_get.return_value = DataSequence(DeviceTemplateInfo, [create_dataclass(DeviceTemplateInfo, template)])
+        session, mock_find_status.side_effect = self.attach_many_session({self.device_info.uuid: "Success"})
+
+        # Act
+        result = TemplatesAPI(session).attach(
+            "template_1", self.device_info, device_specific_vars={"//system/site-id": 1}
+        )
+
+        # Assert
+        self.assertTrue(result)
+        mock_get.assert_called_once()
+        self.assertEqual(list(self.attached.values()), [[self.device_info.uuid]])
+
     # @patch("catalystwan.api.template_api.wait_for_completed")
     # @patch("catalystwan.session.ManagerSession")
     # def test_attach_exist_template(self, mock_session, mock_wait_for_completed, mock_templates):
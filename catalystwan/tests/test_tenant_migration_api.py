@@ -9,8 +9,9 @@ from packaging.version import Version  # type: ignore
 
 from catalystwan.api.task_status_api import Task
 from catalystwan.api.tenant_migration_api import ImportTask, TenantMigrationAPI
-from catalystwan.endpoints.tenant_migration import ImportInfo, MigrationInfo
+from catalystwan.endpoints.tenant_migration import ImportInfo, MigrationInfo, TenantMigration
 from catalystwan.models.tenant import Tenant, TenantExport
+from catalystwan.utils.session_type import SessionType
 
 
 class TestTenantMigrationAPI(unittest.TestCase):
@@ -37,12 +38,11 @@ class TestTenantMigrationAPI(unittest.TestCase):
         self.assertIsInstance(task, Task)
 
     def test_download(self):
-        content = b"\xFFtest_data"
-        with tempfile.TemporaryDirectory() as tmpdir:
-            download_path = Path(tmpdir) / "test.tar.gz"
-            self.session.endpoints.tenant_migration.download_tenant_data = MagicMock(return_value=content)
-            self.api.download(download_path)
-            assert open(download_path, "rb").read() == content
+        download_path = Path("test.tar.gz")
+        self.api.download(download_path, "exports/tenant 1.tar.gz")
+        self.session.endpoints.tenant_migration.download_tenant_data_to_file.assert_called_once_with(
+            download_path, "exports/tenant%201.tar.gz"
+        )
 
     def test_import_tenant(self):
         self.session.api_version = Version("20.12")
@@ -105,3 +105,29 @@ class TestTenantMigrationAPI(unittest.TestCase):
             )
             task = self.api.migrate_network(token_file)
             self.assertIsInstance(task, Task)
+
+
+class TestTenantMigrationEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock(api_version=Version("20.9"), session_type=SessionType.PROVIDER)
+        self.endpoints = TenantMigration(self.client)
+
+    def test_download_to_file_uses_url_of_download_endpoint(self):
+        download_path = Path("test.tar.gz")
+
+        self.endpoints.download_tenant_data("exports/tenant%201.tar.gz")
+        self.endpoints.download_tenant_data_to_file(download_path, "exports/tenant%201.tar.gz")
+
+        url = self.client.request.call_args.args[1]
+        self.assertEqual(url, "/dataservice/tenantmigration/download/exports/tenant%201.tar.gz")
+        self.client.get_file.assert_called_once_with(url, download_path)
+
+    def test_download_to_file_checks_version_and_view(self):
+        self.client.api_version = Version("20.5")
+        self.client.session_type = SessionType.TENANT
+
+        with self.assertLogs("catalystwan.endpoints", level="WARNING") as logs:
+            self.endpoints.download_tenant_data_to_file(Path("test.tar.gz"))
+
+        self.assertEqual(len(logs.records), 2)
+        self.client.get_file.assert_called_once()
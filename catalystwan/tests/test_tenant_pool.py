@@ -0,0 +1,215 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict
+from unittest.mock import MagicMock
+
+from catalystwan.connection_pool import PoolConfig
+from catalystwan.exceptions import ManagerHTTPError, SessionNotCreatedError, TenantSubdomainNotFound
+from catalystwan.tenant_pool import TenantSessionPool, create_tenant_session_pool
+from catalystwan.utils.session_type import SessionType
+
+TENANTS = 20
+
+
+class ProviderHandler(BaseHTTPRequestHandler):
+    """Multitenant vManage answering VSessionId of tenant on /dataservice/whoami"""
+
+    protocol_version = "HTTP/1.1"
+    lock = Lock()
+    requests: Counter = Counter()
+    jsessionid = "session-1"
+    vsessions: Dict[str, str] = {}  # VSessionId: tenant ID
+    expire_jsessionid = False
+
+    def do_POST(self):
+        self.route()
+
+    def do_GET(self):
+        self.route()
+
+    def route(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        path = self.path.split("?")[0]
+        with self.lock:
+            self.requests[path.rsplit("/", 2)[-1] if path.endswith("vsessionid") else path] += 1
+            if path == "/j_security_check":
+                ProviderHandler.jsessionid = f"session-{self.requests[path]}"
+                return self.reply(b"", {"Set-Cookie": f"JSESSIONID={self.jsessionid}; Path=/"})
+            if path == "/dataservice/client/token":
+                return self.reply(b"token")
+            if f"JSESSIONID={self.jsessionid}" not in self.headers.get("Cookie", ""):
+                return self.reply(b"", status=401)
+            if ProviderHandler.expire_jsessionid:
+                ProviderHandler.expire_jsessionid = False
+                expired = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/"
+                return self.reply(b"{}", {"Set-Cookie": expired})
+            if path == "/dataservice/client/server":
+                modes = {"tenancyMode": "MultiTenant", "userMode": "provider", "viewMode": "provider"}
+                return self.reply({"data": {**modes, "platformVersion": "20.12.1"}})
+            if path == "/dataservice/tenant":
+                return self.reply({"data": [tenant(index) for index in range(TENANTS)]})
+            if path.endswith("/vsessionid"):
+                vsession_id = f"vsession-{sum(self.requests.values())}"
+                self.vsessions[vsession_id] = path.split("/")[-2]
+                return self.reply({"VSessionId": vsession_id})
+            if path == "/dataservice/whoami":
+                if (tenant_id := self.vsessions.get(self.headers.get("VSessionId", ""))) is None:
+                    return self.reply(
+                        {"error": {"message": "Invalid VSessionId", "details": "", "code": "403"}}, status=403
+                    )
+                return self.reply({"tenantId": tenant_id})
+            if path == "/logout":
+                return self.reply(b"")
+        self.reply(b"", status=404)
+
+    def reply(self, body, headers: Dict[str, str] = {}, status: int = 200):
+        content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def tenant(index: int) -> dict:
+    return {
+        "name": f"t{index}",
+        "desc": "",
+        "orgName": "org",
+        "subDomain": f"t{index}.example.com",
+        "tenantId": str(index),
+    }
+
+
+def whoami(session) -> str:
+    return session.get("/dataservice/whoami").json()["tenantId"]
+
+
+class TestTenantSessionPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ProviderHandler)
+        cls.server.daemon_threads = True
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ProviderHandler.requests = Counter()
+        ProviderHandler.vsessions = {}
+        ProviderHandler.expire_jsessionid = False
+        self.pool = create_tenant_session_pool(
+            f"http://127.0.0.1:{self.server.server_address[1]}",
+            "provider",
+            "<>",
+            pool_config=PoolConfig(pool_maxsize=4, pool_block=True),
+            max_workers=4,
+        )
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_map_over_tenants_with_single_provider_login(self):
+        results = self.pool.map(whoami)
+
+        self.assertEqual(results, {f"t{index}.example.com": str(index) for index in range(TENANTS)})
+        self.assertEqual(ProviderHandler.requests["/j_security_check"], 1)
+        self.assertEqual(ProviderHandler.requests["/dataservice/tenant"], 1)
+        self.assertEqual(ProviderHandler.requests["vsessionid"], TENANTS)
+        self.assertEqual(self.pool.session("t3.example.com").session_type, SessionType.PROVIDER_AS_TENANT)
+        self.assertLess(self.pool.provider.pool_stats.created, TENANTS // 2)  # connections shared by all tenants
+
+    def test_view_shares_provider_connection_pool(self):
+        provider = self.pool.provider
+        view = self.pool.session("t1.example.com")
+
+        for session in (view, view._auth_session):
+            self.assertTrue(all(adapter is provider._adapter for adapter in session.adapters.values()))
+        self.assertIs(view.pool_stats, provider.pool_stats)
+        self.assertIs(view.pool_config, provider.pool_config)
+
+    def test_virtual_session_is_reused(self):
+        view = self.pool.session("t1.example.com")
+
+        for _ in range(3):
+            self.assertEqual(whoami(view), "1")
+
+        self.assertIs(self.pool.session("t1.example.com"), view)
+        self.assertEqual(ProviderHandler.requests["vsessionid"], 1)
+
+    def test_rejected_virtual_session_is_obtained_again(self):
+        view = self.pool.session("t2.example.com")
+        whoami(view)
+        ProviderHandler.vsessions.clear()
+
+        self.assertEqual(whoami(view), "2")
+        self.assertEqual(ProviderHandler.requests["vsessionid"], 2)
+
+    def test_expired_provider_session_logs_in_once(self):
+        self.pool.map(whoami, ["t1.example.com", "t2.example.com"])
+        ProviderHandler.expire_jsessionid = True
+
+        self.assertEqual(whoami(self.pool.session("t1.example.com")), "1")
+        self.assertEqual(whoami(self.pool.session("t2.example.com")), "2")
+
+        self.assertEqual(ProviderHandler.requests["/j_security_check"], 2)
+        self.assertEqual(ProviderHandler.requests["vsessionid"], 4)  # obtained in previous provider session
+
+    def test_vsession_ttl(self):
+        self.pool.vsession_ttl = 0
+        view = self.pool.session("t1.example.com")
+
+        whoami(view)
+        whoami(view)
+
+        self.assertEqual(ProviderHandler.requests["vsessionid"], 2)
+
+    def test_unknown_subdomain(self):
+        with self.assertRaises(TenantSubdomainNotFound):
+            whoami(self.pool.session("unknown.example.com"))
+        self.assertEqual(ProviderHandler.requests["/dataservice/tenant"], 2)
+
+    def test_map_return_exceptions(self):
+        results = self.pool.map(whoami, ["t0.example.com", "unknown.example.com"], return_exceptions=True)
+
+        self.assertEqual(results["t0.example.com"], "0")
+        self.assertIsInstance(results["unknown.example.com"], TenantSubdomainNotFound)
+
+    def test_map_raises_first_error(self):
+        def fail(session):
+            session.get("/dataservice/unknown")
+
+        with self.assertRaises(ManagerHTTPError):
+            self.pool.map(fail)
+
+    def test_view_close_keeps_provider_session(self):
+        view = self.pool.session("t1.example.com")
+        whoami(view)
+
+        view.close()
+
+        self.assertEqual(whoami(self.pool.session("t2.example.com")), "2")
+        self.assertEqual(ProviderHandler.requests["/logout"], 0)
+
+    def test_requires_provider_session(self):
+        session = MagicMock(session_type=SessionType.TENANT)
+
+        with self.assertRaises(SessionNotCreatedError):
+            TenantSessionPool(session)
+
+
+if __name__ == "__main__":
+    unittest.main()
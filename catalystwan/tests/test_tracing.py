@@ -0,0 +1,101 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import logging
+import unittest
+from datetime import timedelta
+from timeit import timeit
+from unittest.mock import MagicMock
+
+from requests import Request, Response
+
+from catalystwan.response import RequestTrace, response_history_debug
+from catalystwan.session import ManagerSession
+from catalystwan.tests.benchmark import benchmark
+
+
+def create_response(status_code: int = 200, stream: bool = False) -> Response:
+    body = json.dumps({"header": {"generatedOn": 0}, "data": [{"deviceId": f"10.0.0.{i}"} for i in range(50)]})
+    response = Response()
+    response.status_code = status_code
+    response.request = Request(
+        method="POST", url="https://example.com/dataservice/device?x=1", data=b"0123456789"
+    ).prepare()
+    response.headers["Content-Type"] = "application/json"
+    response.headers["Content-Length"] = str(len(body))
+    response.elapsed = timedelta(milliseconds=125)
+    response._content = False if stream else body.encode()  # type: ignore[assignment]
+    return response
+
+
+class TestRequestTrace(unittest.TestCase):
+    def test_create_from_response(self):
+        response = create_response()
+
+        trace = RequestTrace.create(response, None)
+
+        self.assertEqual(trace, RequestTrace("POST", "/dataservice/device", 200, 0.125, 10, len(response.content)))
+        self.assertEqual(str(trace), f"POST /dataservice/device <200> 0.125s sent=10 received={len(response.content)}")
+
+    def test_create_from_streamed_response_does_not_read_body(self):
+        response = create_response(stream=True)
+
+        trace = RequestTrace.create(response, None)
+
+        self.assertEqual(trace.response_bytes, int(response.headers["Content-Length"]))
+        self.assertIs(response._content, False)
+
+    def test_create_without_response(self):
+        request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+
+        trace = RequestTrace.create(None, request)
+
+        self.assertEqual(trace, RequestTrace("GET", "/dataservice/device", None, None, None, None))
+        self.assertIsNone(RequestTrace.create(None, None))
+
+
+class TestSessionTracing(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(url="example.com", username="admin", password="admin")
+        self.session.logger = logging.getLogger("catalystwan.tests.tracing")
+        self.session.logger.setLevel(logging.WARNING)
+        self.response = create_response()
+
+    def test_trace_not_formatted_when_debug_disabled(self):
+        self.session.response_trace = MagicMock()
+
+        self.session._trace(self.response, None)
+
+        self.session.response_trace.assert_not_called()
+
+    def test_trace_formatted_when_debug_enabled(self):
+        self.session.logger.setLevel(logging.DEBUG)
+
+        with self.assertLogs(self.session.logger, level=logging.DEBUG) as log:
+            self.session._trace(self.response, None)
+
+        self.assertIn("/dataservice/device", log.output[0])
+
+    def test_request_tracer_receives_record(self):
+        self.session.request_tracer = MagicMock()
+
+        self.session._trace(self.response, None)
+
+        self.session.request_tracer.assert_called_once_with(RequestTrace.create(self.response, None))
+
+    @benchmark
+    def test_benchmark_per_request_tracing_overhead(self):
+        number = 200
+        eager = timeit(lambda: response_history_debug(self.response, None), number=number) / number
+        disabled = timeit(lambda: self.session._trace(self.response, None), number=number) / number
+        self.session.request_tracer = lambda record: None
+        structured = timeit(lambda: self.session._trace(self.response, None), number=number) / number
+
+        # formatting history with pformat and extract_stack() costs hundreds of microseconds per request
+        # while disabled tracing is a single logger level check and structured record a few attribute reads
+        self.assertLess(disabled * 20, eager)
+        self.assertLess(structured * 5, eager)
+
+
+if __name__ == "__main__":
+    unittest.main()
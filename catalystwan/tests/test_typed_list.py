@@ -10,7 +10,8 @@ from parameterized import parameterized
 
 from catalystwan.dataclasses import DataclassBase, Device, User
 from catalystwan.exceptions import InvalidOperationError
-from catalystwan.typed_list import DataSequence, TypedList
+from catalystwan.typed_list import DataSequence, LazyDataSequence, TypedList
+from catalystwan.utils.personality import Personality
 
 
 @define
@@ -366,5 +367,176 @@ class TestDataSequence(TestCase):
             self.data_sequence.filter(does_not="exists")
 
 
+@define
+class FakeDevice(DataclassBase):
+    uuid: str
+    personality: Personality
+    site: int
+
+
+class NotScannable(list):
+    def __iter__(self):
+        raise AssertionError("sequence was scanned")
+
+
+class TestDataSequenceIndex(TestCase):
+    def setUp(self):
+        personalities = [Personality.EDGE, Personality.EDGE, Personality.VSMART]
+        self.devices = [FakeDevice(f"uuid-{i}", personalities[i % 3], i % 2) for i in range(9)]
+        self.data_sequence = DataSequence(FakeDevice, self.devices)
+
+    def test_get_by(self):
+        # Arrange, Act, Assert
+        self.assertIs(self.data_sequence.get_by(uuid="uuid-4"), self.devices[4])
+        self.assertIsNone(self.data_sequence.get_by(uuid="uuid-9"))
+        with self.assertRaises(InvalidOperationError):
+            self.data_sequence.get_by(site=1)
+
+    @parameterized.expand(
+        [
+            ({"personality": Personality.EDGE},),
+            ({"personality": "vsmart"},),
+            ({"personality": Personality.EDGE, "site": 1},),
+            ({"site": 0, "personality": "vedge"},),
+            ({"site": 2},),
+        ]
+    )
+    def test_filter_uses_index_with_same_result(self, kwargs):
+        # Arrange
+        expected = self.data_sequence.filter(**kwargs)
+
+        # Act
+        self.data_sequence.index_by(*kwargs.keys())
+        self.data_sequence.data = NotScannable(self.data_sequence.data)
+        indexed = self.data_sequence.filter(**kwargs)
+
+        # Assert
+        self.assertEqual(indexed, expected)
+
+    def test_group_by(self):
+        # Arrange, Act
+        by_personality = self.data_sequence.group_by("personality")
+        by_two = self.data_sequence.group_by("personality", "site")
+
+        # Assert
+        self.assertEqual(list(by_personality.keys()), [Personality.EDGE, Personality.VSMART])
+        self.assertEqual(by_personality[Personality.EDGE], self.data_sequence.filter(personality=Personality.EDGE))
+        self.assertEqual(len(by_two), 4)
+        self.assertEqual(by_two[(Personality.VSMART, 1)], DataSequence(FakeDevice, [self.devices[5]]))
+
+    @parameterized.expand(
+        [
+            ("append", lambda seq, device: seq.append(device)),
+            ("insert", lambda seq, device: seq.insert(0, device)),
+            ("setitem", lambda seq, device: seq.__setitem__(4, device)),
+            ("iadd", lambda seq, device: seq.__iadd__([device])),
+        ]
+    )
+    def test_index_invalidated_by_mutation(self, _, mutate):
+        # Arrange
+        device = FakeDevice("uuid-new", Personality.VBOND, 0)
+        self.data_sequence.index_by("uuid")
+
+        # Act
+        mutate(self.data_sequence, device)
+
+        # Assert
+        self.assertIs(self.data_sequence.get_by(uuid="uuid-new"), device)
+        self.assertEqual(self.data_sequence.filter(uuid="uuid-new"), DataSequence(FakeDevice, [device]))
+
+    def test_index_invalidated_by_delete(self):
+        # Arrange
+        self.data_sequence.index_by("uuid")
+
+        # Act
+        del self.data_sequence[4]
+
+        # Assert
+        self.assertIsNone(self.data_sequence.get_by(uuid="uuid-4"))
+
+    def test_unhashable_filter_value_falls_back_to_scan(self):
+        # Arrange
+        self.data_sequence.index_by("site")
+
+        # Act, Assert
+        self.assertEqual(len(self.data_sequence.filter(site=[0])), 0)
+
+
+class TestLazyDataSequence(TestCase):
+    def setUp(self):
+        self.rows = [{"name": f"User{index}", "weight": index} for index in range(5)]
+        self.created = []
+
+        def factory(row):
+            self.created.append(row["name"])
+            return FakeUser(**row)
+
+        self.lazy = LazyDataSequence(FakeUser, self.rows, factory)
+        self.eager = DataSequence(FakeUser, [FakeUser(**row) for row in self.rows])
+
+    def test_elements_created_on_access(self):
+        # Arrange, Act
+        length = len(self.lazy)
+        first = self.lazy.first()
+        last = self.lazy[-1]
+        again = self.lazy[0]
+
+        # Assert
+        self.assertEqual(length, 5)
+        self.assertEqual(first, FakeUser(name="User0", weight=0))
+        self.assertEqual(last, FakeUser(name="User4", weight=4))
+        self.assertIs(again, first)
+        self.assertEqual(self.created, ["User0", "User4"])
+        self.assertEqual(self.lazy.created, 2)
+
+    def test_slice_shares_created_elements(self):
+        # Arrange
+        first = self.lazy[0]
+
+        # Act
+        sliced = self.lazy[:2]
+
+        # Assert
+        self.assertIsInstance(sliced, LazyDataSequence)
+        self.assertIs(sliced[0], first)
+        self.assertEqual(self.created, ["User0"])
+
+    def test_behaves_like_data_sequence(self):
+        # Arrange, Act, Assert
+        self.assertIsInstance(self.lazy, DataSequence)
+        self.assertEqual(list(self.lazy), list(self.eager))
+        self.assertEqual(self.lazy.filter(name="User3"), self.eager.filter(name="User3"))
+        self.assertEqual(self.lazy, self.eager)
+        self.assertEqual(self.created, [f"User{index}" for index in range(5)])
+
+    def test_mutation_creates_all_elements(self):
+        # Arrange
+        user = FakeUser(name="User5", weight=5)
+
+        # Act
+        self.lazy.append(user)
+        del self.lazy[0]
+
+        # Assert
+        self.assertEqual(self.lazy, self.eager[1:] + [user])
+        with self.assertRaises(TypeError):
+            self.lazy.append(User(username="User6"))
+
+    def test_single_or_default(self):
+        # Arrange, Act, Assert
+        self.assertIsNone(LazyDataSequence(FakeUser, [], FakeUser).single_or_default())
+        self.assertEqual(self.lazy[1:2].single_or_default(), FakeUser(name="User1", weight=1))
+        with self.assertRaises(InvalidOperationError):
+            self.lazy.single_or_default()
+
+    def test_factory_type_is_checked(self):
+        # Arrange
+        lazy = LazyDataSequence(FakeUser, [{"username": "User1"}], lambda row: User(**row))
+
+        # Act, Assert
+        with self.assertRaises(TypeError):
+            lazy.first()
+
+
 if __name__ == "__main__":
     unittest.main()
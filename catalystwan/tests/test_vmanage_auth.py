@@ -1,10 +1,14 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
 from unittest import TestCase, mock
 from uuid import uuid4
 
 from requests import Request
+from requests.cookies import RequestsCookieJar
 
 from catalystwan import USER_AGENT
 from catalystwan.vmanage_auth import UnauthorizedAccessError, vManageAuth
@@ -108,6 +112,58 @@ class TestvManageAuth(TestCase):
             cookies=cookies,
         )
 
+    @mock.patch("requests.post")
+    def test_get_cookie_uses_session(self, mock_post):
+        # Arrange
+        session = mock.MagicMock()
+        session.post.side_effect = mocked_requests_method
+        auth = vManageAuth(self.base_url, "admin", self.password, session=session)
+
+        # Act
+        auth.get_cookie()
+
+        # Assert
+        session.cookies.clear.assert_called_once()
+        session.post.assert_called_once_with(
+            url="https://1.1.1.1:1111/j_security_check",
+            data={"j_username": "admin", "j_password": self.password},
+            verify=False,
+            headers={"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT},
+        )
+        mock_post.assert_not_called()
+
+    @mock.patch("catalystwan.vmanage_auth.vManageAuth.fetch_token")
+    @mock.patch("catalystwan.vmanage_auth.vManageAuth.get_cookie")
+    def test_concurrent_requests_authenticate_once(self, mock_get_cookie, mock_fetch_token):
+        # Arrange
+        threads = 8
+        barrier = Barrier(threads)
+
+        def get_cookie():
+            sleep(0.05)
+            jar = RequestsCookieJar()
+            jar.set("JSESSIONID", "xyz")
+            return jar
+
+        def call_auth(_):
+            barrier.wait()
+            return auth(Request("GET", f"{self.base_url}/dataservice/device").prepare())
+
+        mock_get_cookie.side_effect = get_cookie
+        mock_fetch_token.return_value = "token"
+        auth = vManageAuth(self.base_url, "admin", self.password)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            prepared_requests = list(executor.map(call_auth, range(threads)))
+
+        # Assert
+        mock_get_cookie.assert_called_once()
+        mock_fetch_token.assert_called_once()
+        for prepared_request in prepared_requests:
+            self.assertEqual(prepared_request.headers["x-xsrf-token"], "token")
+            self.assertEqual(prepared_request.headers["Cookie"], "JSESSIONID=xyz")
+
 
 if __name__ == "__main__":
     unittest.main()
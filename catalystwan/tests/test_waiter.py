@@ -0,0 +1,168 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from itertools import count, islice
+from threading import Barrier, Event, Lock, Timer
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+
+from catalystwan.exceptions import WaitAbortedError, WaitCancelledError, WaitTimeoutError
+from catalystwan.waiter import Backoff, Waiter, WaitOutcome, wait_many, wait_until
+
+
+class TestBackoff(unittest.TestCase):
+    def test_delays_grow_up_to_max_delay(self):
+        backoff = Backoff(initial_delay=1, multiplier=2, max_delay=5, jitter=0)
+
+        self.assertEqual(list(islice(backoff.delays(), 5)), [1, 2, 4, 5, 5])
+
+    def test_jitter_shortens_delay(self):
+        backoff = Backoff(initial_delay=1, multiplier=1, max_delay=1, jitter=0.5)
+
+        for delay in islice(backoff.delays(), 100):
+            self.assertGreaterEqual(delay, 0.5)
+            self.assertLessEqual(delay, 1)
+
+    @parameterized.expand([(0.01, 0.01, 0.02), (10, 1.0, 20)])
+    def test_from_interval(self, interval, initial_delay, max_delay):
+        backoff = Backoff.from_interval(interval)
+
+        self.assertEqual((backoff.initial_delay, backoff.max_delay), (initial_delay, max_delay))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.now += delay
+
+
+class TestWaiter(unittest.TestCase):
+    def setUp(self):
+        self.backoff = Backoff(initial_delay=0.01, multiplier=2, max_delay=0.02, jitter=0)
+        self.clock = FakeClock()
+        for name in ("monotonic", "sleep"):
+            patcher = patch(f"catalystwan.waiter.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def poll_times(self, times):
+        def poll():
+            times.append(round(self.clock.now, 6))
+            return False
+
+        return poll
+
+    def test_satisfied(self):
+        polls = count(1)
+
+        result = wait_until(lambda: next(polls), until=lambda value: value == 3, timeout=5, backoff=self.backoff)
+
+        self.assertEqual(result.outcome, WaitOutcome.SATISFIED)
+        self.assertEqual((result.value, result.attempts), (3, 3))
+        self.assertEqual(result.value_or_raise(), 3)
+
+    def test_timeout(self):
+        backoff = Backoff(initial_delay=4, max_delay=4, jitter=0)
+        times = []
+
+        result = wait_until(self.poll_times(times), until=bool, timeout=10, backoff=backoff)
+
+        self.assertEqual(result.outcome, WaitOutcome.TIMEOUT)
+        self.assertEqual(times, [0, 4, 8, 10])  # last delay is shortened to poll at deadline
+        self.assertEqual((result.attempts, result.elapsed), (4, 10))
+        with self.assertRaises(WaitTimeoutError):
+            result.value_or_raise()
+
+    def test_abort(self):
+        polls = count(1)
+
+        result = wait_until(
+            lambda: next(polls), until=lambda value: value > 5, abort_if=lambda value: value == 2, timeout=5
+        )
+
+        self.assertEqual((result.outcome, result.attempts), (WaitOutcome.ABORTED, 2))
+        with self.assertRaises(WaitAbortedError):
+            result.value_or_raise()
+
+    def test_cancel_interrupts_sleep(self):
+        cancel = Event()
+        timer = Timer(0.01, cancel.set)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        with patch("catalystwan.waiter.sleep", side_effect=AssertionError("cancellable wait must not sleep")):
+            result = wait_until(
+                lambda: False, until=bool, timeout=600, backoff=Backoff(initial_delay=300), cancel=cancel
+            )
+
+        self.assertEqual((result.outcome, result.attempts), (WaitOutcome.CANCELLED, 1))
+        with self.assertRaises(WaitCancelledError):
+            result.value_or_raise()
+
+    def test_retry_on(self):
+        polls = count(1)
+
+        def poll():
+            if (value := next(polls)) < 3:
+                raise ConnectionError()
+            return value
+
+        result = wait_until(poll, until=bool, timeout=5, backoff=self.backoff, retry_on=(ConnectionError,))
+
+        self.assertEqual((result.value, result.attempts), (3, 3))
+        with self.assertRaises(ValueError):
+            wait_until(lambda: int("x"), until=bool, timeout=5, retry_on=(ConnectionError,))
+
+    def test_consecutive_waits_share_deadline(self):
+        waiter = Waiter(10, Backoff(initial_delay=4, max_delay=4, jitter=0))
+        first, second = [], []
+
+        waiter.wait(self.poll_times(first), until=bool)
+        result = waiter.wait(self.poll_times(second), until=bool)
+
+        self.assertEqual((first, second), ([0, 4, 8, 10], [10]))
+        self.assertEqual(result.outcome, WaitOutcome.TIMEOUT)
+
+
+class TestWaitMany(unittest.TestCase):
+    def test_targets_are_awaited_concurrently(self):
+        lock = Lock()
+        polls = {target: 0 for target in range(8)}
+        first_polls = Barrier(len(polls), timeout=10)  # broken (poll raises) unless all targets are polled at once
+
+        def poll(target):
+            with lock:
+                polls[target] += 1
+                value = polls[target]
+            if value == 1:
+                first_polls.wait()
+            return value
+
+        results = wait_many(
+            polls, poll, until=lambda value: value == 2, timeout=60, backoff=Backoff(initial_delay=0.01), max_workers=8
+        )
+
+        self.assertEqual(list(results), list(polls))
+        self.assertTrue(all(result.satisfied and result.attempts == 2 for result in results.values()))
+
+    def test_exception_is_raised(self):
+        def poll(target):
+            if target == 2:
+                raise ValueError(target)
+            return True
+
+        with self.assertRaises(ValueError):
+            wait_many([1, 2, 3], poll, until=bool, timeout=1)
+
+    def test_no_targets(self):
+        self.assertEqual(wait_many([], lambda target: True, until=bool, timeout=1), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
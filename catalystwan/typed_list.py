@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any, Generic, Iterable, MutableSequence, Type, TypeVar, overload
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
 from pydantic import BaseModel as BaseModelV2
 from pydantic.v1 import BaseModel as BaseModelV1
 
 from catalystwan.exceptions import InvalidOperationError
 from catalystwan.utils.creation_tools import AttrsInstance, asdict
+from catalystwan.utils.table import ColumnsFormat, to_columns, to_records
 
 T = TypeVar("T")
 D = TypeVar("D")
 
+_NOT_CREATED: Any = object()
+
+
+def _index_value(value: Any) -> Any:
+    """Enum members mixed with their value type (eg. str) are equal to their values but hashed by name,
+    so they are indexed by value to keep index lookups consistent with equality used by filter"""
+    if isinstance(value, Enum) and value == value.value:
+        return value.value
+    return value
+
 
 class TypedList(MutableSequence[T], Generic[T]):
     """A list where all elements are of the same data type.
@@ -97,7 +124,7 @@ class TypedList(MutableSequence[T], Generic[T]):
         return TypedList(self._type, self.data + [*__value.__iter__()])
 
     def __iadd__(self, __value: Iterable[T]) -> TypedList[T]:
-        self.data = TypedList(self._type, self.data + [*__value.__iter__()]).data
+        self.data.extend(TypedList(self._type, __value).data)  # only added items are checked
         return self
 
     def __eq__(self, __o: object) -> bool:
@@ -160,7 +187,7 @@ class DataSequence(TypedList[T], Generic[T]):
             raise TypeError(
                 f"Expected {AttrsInstance.__name__} or {BaseModelV1.__name__} item type, got {_type.__name__}."
             )
-
+        self._indexes: Dict[Tuple[str, ...], Dict[Any, List[T]]] = {}
         super().__init__(_type, _iterable)
 
     def __eq__(self, __o: object) -> bool:
@@ -188,9 +215,143 @@ class DataSequence(TypedList[T], Generic[T]):
         return DataSequence(self._type, self.data + [*__value.__iter__()])
 
     def __iadd__(self, __value: Iterable[T]) -> DataSequence[T]:
+        self._indexes.clear()
         self.data = DataSequence(self._type, self.data + [*__value.__iter__()]).data
         return self
 
+    def __setitem__(self, i, item):
+        self._indexes.clear()
+        super().__setitem__(i, item)
+
+    def __delitem__(self, i):
+        self._indexes.clear()
+        super().__delitem__(i)
+
+    def append(self, item: T) -> None:
+        self._indexes.clear()
+        super().append(item)
+
+    def insert(self, i: int, item: T) -> None:
+        self._indexes.clear()
+        super().insert(i, item)
+
+    def pop(self, i: int = -1) -> T:
+        self._indexes.clear()
+        return super().pop(i)
+
+    def remove(self, item: T) -> None:
+        self._indexes.clear()
+        super().remove(item)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        super().clear()
+
+    def reverse(self) -> None:
+        self._indexes.clear()
+        super().reverse()
+
+    def to_columns(
+        self, fields: Optional[Sequence[str]] = None, by_alias: bool = False, format: ColumnsFormat = "list"
+    ) -> Any:
+        """Returns column-oriented values read directly from elements (no intermediate dict per element).
+
+        ## Example:
+        >>> devices.to_columns(["hostname", "personality"])
+        {'hostname': ['vm1', 'vm2'], 'personality': ['vmanage', 'vedge']}
+        >>> devices.to_columns(by_alias=True, format="arrow")  # requires pyarrow
+        pyarrow.Table
+
+        Args:
+            fields: attribute names or aliases of exported columns (in that order), all fields when not given
+            by_alias: use aliases (names used in JSON) as column names
+            format: "list" (dict of lists), "numpy" (dict of NumPy arrays) or "arrow" (pyarrow.Table)
+        """
+        return to_columns(self, self._type, fields, by_alias, format)
+
+    def to_records(self, fields: Optional[Sequence[str]] = None) -> List[Tuple[Any, ...]]:
+        """Returns tuple of values for each element (in order of fields, all fields when not given)"""
+        return to_records(self, self._type, fields)
+
+    def index_by(self, *attributes: str) -> DataSequence[T]:
+        """Builds hash index on given attributes (unless already built), so filter() with exactly the same
+        attributes, get_by() and group_by() are resolved in constant time instead of scanning whole sequence.
+
+        Index is dropped when sequence is modified (eg. append, insert, item assignment or deletion).
+        Changing attributes of elements already in the sequence is not detected.
+
+        ## Example:
+        >>> devices = session.api.devices.get().index_by("uuid")
+        >>> [devices.get_by(uuid=uuid) for uuid in uuids]
+
+        Raises:
+            TypeError: when values of given attributes are not hashable
+
+        Returns:
+            DataSequence: self
+        """
+        self._index(attributes)
+        return self
+
+    def get_by(self, **kwargs) -> Optional[T]:
+        """Returns the only element with given attribute values or None when there is no such element.
+        Index on given attributes is built on first use.
+
+        ## Example:
+        >>> seq = DataSequence(User, [User(username="User1"), User(username="User2")])
+        >>> seq.get_by(username="User2")
+        User(username='User2', password=None, group=[], locale=None, description=None, resource_group=None)
+
+        Raises:
+            InvalidOperationError: Raises when there is more than one matching element.
+        """
+        names = tuple(sorted(kwargs.keys()))
+        elements = self._index(names).get(self._index_key([kwargs[name] for name in names]), [])
+        if len(elements) > 1:
+            raise InvalidOperationError("The input sequence contains more than one matching element.")
+        return elements[0] if elements else None
+
+    def group_by(self, *attributes: str) -> Dict[Any, DataSequence[T]]:
+        """Groups elements by values of given attributes (tuple of values is the key for multiple attributes).
+        Order of elements in groups is preserved.
+
+        ## Example:
+        >>> devices.group_by("personality")
+        {Personality.EDGE: DataSequence(Device, [...]), Personality.VSMART: DataSequence(Device, [...])}
+        """
+        names = tuple(sorted(attributes))
+        groups: Dict[Any, DataSequence[T]] = {}
+        for elements in self._index(names).values():
+            values = tuple(getattr(elements[0], attribute) for attribute in attributes)
+            groups[values[0] if len(values) == 1 else values] = DataSequence(self._type, elements)
+        return groups
+
+    @staticmethod
+    def _index_key(values: Sequence[Any]) -> Any:
+        if len(values) == 1:
+            return _index_value(values[0])
+        return tuple(_index_value(value) for value in values)
+
+    def _index(self, attributes: Sequence[str]) -> Dict[Any, List[T]]:
+        names = tuple(sorted(attributes))
+        if (index := self._indexes.get(names)) is None:
+            index = {}
+            for element in self:
+                index.setdefault(self._index_key([getattr(element, name) for name in names]), []).append(element)
+            self._indexes[names] = index
+        return index
+
+    def _filter_by_index(self, kwargs: Dict[str, Any]) -> Optional[DataSequence[T]]:
+        """Filters with index built on exactly the same attributes, returns None when there is no such index"""
+        names = tuple(sorted(kwargs.keys()))
+        if (index := self._indexes.get(names)) is None:
+            return None
+        try:
+            key = self._index_key([kwargs[name] for name in names])
+            return DataSequence(self._type, index.get(key, []))
+        except TypeError:  # unhashable value
+            return None
+
     @overload
     def single_or_default(self) -> T:
         ...
@@ -236,9 +397,14 @@ class DataSequence(TypedList[T], Generic[T]):
             User(username='User1', password=None, group=[], locale=None, description=None, resource_group=None)
         ])
 
+        Index built with index_by() on exactly the same attributes is used instead of scanning the sequence.
+
         Returns:
             DataSequence: Filtered DataSequence.
         """
+        if (indexed := self._filter_by_index(kwargs)) is not None:
+            return indexed
+
         annotations = set(kwargs.keys())
 
         return DataSequence(
@@ -264,3 +430,93 @@ class DataSequence(TypedList[T], Generic[T]):
             raise InvalidOperationError("The input sequence contains no elements.")
 
         return self.data[0]
+
+
+class LazyDataSequence(DataSequence[T], Generic[T]):
+    """DataSequence which keeps raw rows (eg. decoded JSON objects) and creates elements only when accessed.
+
+    Created elements are cached, so each row is validated at most once. Length, indexing, slicing, iteration,
+    first() and single_or_default() create only elements they return, filter() creates elements it examines.
+    Any other operation (including mutation) creates all remaining elements first and then behaves exactly
+    like DataSequence.
+
+    ## Example:
+    >>> devices = LazyDataSequence(Device, response.json()["data"], lambda row: create_dataclass(Device, row))
+    >>> devices[0]  # only first device is created
+    """
+
+    def __init__(self, _type: Type[T], rows: Sequence[Any], factory: Callable[[Any], T], /):
+        super().__init__(_type)
+        self._rows: List[Any] = list(rows)
+        self._items: List[T] = [_NOT_CREATED] * len(self._rows)
+        self._factory = factory
+        self._data: Optional[List[T]] = None
+
+    @property  # type: ignore[override]
+    def data(self) -> List[T]:
+        """All elements, remaining rows are created on first access"""
+        if self._data is None:
+            self._data = [self._element(i) for i in range(len(self._items))]
+            self._rows = []  # raw rows are no longer needed
+        return self._data
+
+    @data.setter
+    def data(self, value: List[T]) -> None:
+        self._data = value
+
+    @property
+    def created(self) -> int:
+        """Number of elements created so far"""
+        if self._data is not None:
+            return len(self._data)
+        return sum(item is not _NOT_CREATED for item in self._items)
+
+    def _element(self, i: int) -> T:
+        if self._data is not None:
+            return self._data[i]
+        item = self._items[i]
+        if item is _NOT_CREATED:
+            item = self._factory(self._rows[i])
+            if not isinstance(item, self._type):
+                raise TypeError(f"Expected {self._type.__name__} item type, " f"got {type(item).__name__}.")
+            self._items[i] = item
+        return item
+
+    def __len__(self) -> int:
+        if self._data is not None:
+            return len(self._data)
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self)):
+            yield self._element(i)
+
+    def __getitem__(self, i):
+        if self._data is not None:
+            return DataSequence(self._type, self._data[i]) if isinstance(i, slice) else self._data[i]
+        if isinstance(i, slice):
+            sliced: LazyDataSequence[T] = LazyDataSequence(self._type, self._rows[i], self._factory)
+            sliced._items = self._items[i]
+            return sliced
+        return self._element(i)
+
+    def __repr__(self) -> str:
+        if self._data is not None:
+            return super().__repr__()
+        return f"LazyDataSequence({self._type.__name__}, created={self.created}, length={len(self)})"
+
+    def single_or_default(self, default=None):
+        if len(self) > 1:
+            raise InvalidOperationError("The input sequence contains more than one element.")
+        return self._element(0) if len(self) == 1 else default
+
+    def filter(self, **kwargs) -> DataSequence[T]:
+        if (indexed := self._filter_by_index(kwargs)) is not None:
+            return indexed
+        annotations = set(kwargs.keys())
+        return DataSequence(self._type, filter(lambda x: all(getattr(x, a) == kwargs[a] for a in annotations), self))
+
+    def first(self) -> T:
+        if len(self) < 1:
+            raise InvalidOperationError("The input sequence contains no elements.")
+        return self._element(0)
@@ -0,0 +1,75 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, Type, TypeVar, Union, cast, overload
+
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+T = TypeVar("T")
+
+
+class LazyMember(Generic[T]):
+    """Container attribute created on first access from container session and cached in container instance.
+
+    Containers (eg. session.api, session.endpoints) expose dozens of API objects, most of which are never used
+    by given session, so they are not created in advance. Cached value is stored in instance __dict__,
+    so following accesses are plain attribute lookups and member can still be replaced by assignment.
+
+    Factory can be given as module and attribute names, then module is imported on first access only
+    (annotation keeps member type known to type checkers).
+
+    Example:
+        >>> class APIContainer:
+        >>>     alarms: LazyMember[AlarmsAPI] = LazyMember("catalystwan.api.alarms_api", "AlarmsAPI")
+        >>>     devices = LazyMember(DevicesAPI)
+        >>>
+        >>>     def __init__(self, session: ManagerSession):
+        >>>         self._session = session
+    """
+
+    @overload
+    def __init__(self, factory: Callable[[ManagerSession], T], /) -> None:
+        ...
+
+    @overload
+    def __init__(self, module: str, attribute: str, /) -> None:
+        ...
+
+    def __init__(self, factory, attribute=None, /):
+        self._factory: Union[Callable[[ManagerSession], T], str] = factory
+        self._attribute: str = attribute or ""
+        self.name = ""
+
+    @property
+    def factory(self) -> Callable[[ManagerSession], T]:
+        if isinstance(self._factory, str):
+            self._factory = cast(
+                "Callable[[ManagerSession], T]", getattr(import_module(self._factory), self._attribute)
+            )
+        return self._factory
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[Type[Any]] = None) -> LazyMember[T]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[Type[Any]] = None) -> T:
+        ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.factory(instance._session)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def lazy_members(container_type: type) -> List[str]:
+    """Names of all lazily created members of given container type"""
+    return [name for name in dir(container_type) if isinstance(getattr(container_type, name, None), LazyMember)]
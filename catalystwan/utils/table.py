@@ -0,0 +1,211 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Column-oriented export of Dataclass/BaseModel objects (eg. DataSequence[Device]) for reporting and analytics.
+
+Values are read directly from object attributes column by column, without building intermediate dict per row.
+Enum members are exported as their values. NumPy arrays and Arrow tables require optional packages
+(pip install catalystwan[analytics]).
+
+Objects can also be streamed to CSV (or Parquet) in chunks, eg. directly from paginated iterator:
+>>> with open("alarms.csv", "w", newline="") as file, CsvTableWriter(file, AlarmData) as writer:
+>>>     writer.write(session.api.alarms.iterate(from_time=24))
+"""
+from __future__ import annotations
+
+import csv
+from abc import ABC, abstractmethod
+from enum import Enum
+from inspect import isclass
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Literal, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+from attr import fields as attrs_fields
+from pydantic import BaseModel as BaseModelV2
+from pydantic.v1 import BaseModel as BaseModelV1
+
+from catalystwan.utils.creation_tools import FIELD_NAME, AttrsInstance
+
+ColumnsFormat = Literal["list", "numpy", "arrow"]
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class Column(NamedTuple):
+    attribute: str
+    alias: str
+
+
+def model_columns(cls: type) -> List[Column]:
+    """Returns columns for all fields of given Dataclass/BaseModel type (alias is the name used in JSON)"""
+    if isclass(cls) and issubclass(cls, BaseModelV2):
+        return [
+            Column(name, field.serialization_alias or field.alias or name) for name, field in cls.model_fields.items()
+        ]
+    if isclass(cls) and issubclass(cls, BaseModelV1):
+        return [Column(name, field.alias) for name, field in cls.__fields__.items()]
+    if isinstance(cls, AttrsInstance):
+        return [Column(field.name, field.metadata.get(FIELD_NAME, field.name)) for field in attrs_fields(cls)]
+    raise TypeError(f"Expected {AttrsInstance.__name__} or BaseModel type, got {cls.__name__}.")
+
+
+def select_columns(cls: type, fields: Optional[Sequence[str]] = None) -> List[Column]:
+    """Selects columns by attribute names or aliases (all fields when not given).
+    Names which are not model fields (eg. properties) are exported as attributes with the same name.
+    """
+    columns = model_columns(cls)
+    if fields is None:
+        return columns
+    by_name = {column.attribute: column for column in columns}
+    by_name.update({column.alias: column for column in columns if column.alias not in by_name})
+    return [by_name.get(name, Column(name, name)) for name in fields]
+
+
+def _plain(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def extract_columns(items: Sequence[Any], columns: Sequence[Column]) -> List[List[Any]]:
+    """Reads values of given columns from items, one list per column"""
+    result = []
+    for column in columns:
+        values = [getattr(item, column.attribute) for item in items]
+        if any(isinstance(value, Enum) for value in values):
+            values = [_plain(value) for value in values]
+        result.append(values)
+    return result
+
+
+def header(columns: Sequence[Column], by_alias: bool = False) -> List[str]:
+    return [column.alias if by_alias else column.attribute for column in columns]
+
+
+def to_columns(
+    items: Sequence[Any],
+    cls: type,
+    fields: Optional[Sequence[str]] = None,
+    by_alias: bool = False,
+    format: ColumnsFormat = "list",
+) -> Any:
+    """Converts objects of given type into columns
+
+    Args:
+        items: objects to be converted
+        cls: Dataclass/BaseModel type of objects
+        fields: attribute names or aliases of exported columns (in that order), all fields when not given
+        by_alias: use aliases (names used in JSON) as column names
+        format: "list" (dict of lists), "numpy" (dict of NumPy arrays, requires numpy)
+            or "arrow" (pyarrow.Table, requires pyarrow)
+
+    Returns:
+        columns in requested format
+    """
+    columns = select_columns(cls, fields)
+    data = dict(zip(header(columns, by_alias), extract_columns(items, columns)))
+    if format == "list":
+        return data
+    if format == "numpy":
+        import numpy  # type: ignore
+
+        return {name: numpy.asarray(values) for name, values in data.items()}
+    if format == "arrow":
+        import pyarrow  # type: ignore
+
+        return pyarrow.table(data)
+    raise ValueError(f"Unknown columns format: {format}")
+
+
+def to_records(items: Sequence[Any], cls: type, fields: Optional[Sequence[str]] = None) -> List[Tuple[Any, ...]]:
+    """Converts objects of given type into tuples of values (in order of fields)"""
+    return list(zip(*extract_columns(items, select_columns(cls, fields)))) if items else []
+
+
+class TableWriter(ABC):
+    """Base class for streaming writers, objects are converted and written in chunks of given size"""
+
+    def __init__(
+        self,
+        cls: type,
+        fields: Optional[Sequence[str]] = None,
+        by_alias: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.columns = select_columns(cls, fields)
+        self.header = header(self.columns, by_alias)
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+
+    def write(self, items: Iterable[Any]) -> None:
+        """Writes all given objects, items are consumed lazily so iterator can be passed"""
+        iterator = iter(items)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            self._write_columns(extract_columns(chunk, self.columns))
+            self.rows_written += len(chunk)
+
+    @abstractmethod
+    def _write_columns(self, columns: List[List[Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> TableWriter:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class CsvTableWriter(TableWriter):
+    """Writes objects as CSV rows to given text file (header row is written first)"""
+
+    def __init__(
+        self,
+        file: TextIO,
+        cls: type,
+        fields: Optional[Sequence[str]] = None,
+        by_alias: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        write_header: bool = True,
+        **fmtparams: Any,
+    ):
+        super().__init__(cls, fields, by_alias, chunk_size)
+        self._writer = csv.writer(file, **fmtparams)
+        if write_header:
+            self._writer.writerow(self.header)
+
+    def _write_columns(self, columns: List[List[Any]]) -> None:
+        self._writer.writerows(zip(*columns))
+
+
+class ParquetTableWriter(TableWriter):
+    """Writes objects to Parquet file, each chunk is written as a row group (requires pyarrow package).
+    Schema is inferred from first chunk unless given explicitly."""
+
+    def __init__(
+        self,
+        where: Any,
+        cls: type,
+        fields: Optional[Sequence[str]] = None,
+        by_alias: bool = False,
+        chunk_size: int = 10 * DEFAULT_CHUNK_SIZE,
+        schema: Any = None,
+    ):
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore
+
+        super().__init__(cls, fields, by_alias, chunk_size)
+        self._pyarrow = pyarrow
+        self._where = where
+        self._schema = schema
+        self._writer: Any = None
+
+    def _write_columns(self, columns: List[List[Any]]) -> None:
+        data: Dict[str, List[Any]] = dict(zip(self.header, columns))
+        table = self._pyarrow.table(data, schema=self._schema)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = self._pyarrow.parquet.ParquetWriter(self._where, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -1,11 +1,12 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import logging
+from threading import Lock
 from typing import Optional
 from urllib.parse import urljoin
 
 import requests
-from requests import PreparedRequest, Response
+from requests import PreparedRequest, Response, Session
 from requests.auth import AuthBase
 from requests.cookies import RequestsCookieJar
 
@@ -54,10 +55,15 @@ class vManageAuth(AuthBase):
         expiration_time (int): Expiration token time in seconds.
                 Defaults to None (unlimited).
         token (str): Access token
+        session (Optional[Session]): session used to send authentication requests (eg. sharing connection pool
+                with ManagerSession), when not provided each request opens new connection
 
+    Authentication is performed once, even when many threads send requests concurrently with the same instance.
     """
 
-    def __init__(self, base_url: str, username: str, password: str, verify: bool = False):
+    def __init__(
+        self, base_url: str, username: str, password: str, verify: bool = False, session: Optional[Session] = None
+    ):
         self.base_url = base_url
         self.username = username
         self.password = password
@@ -65,7 +71,9 @@ class vManageAuth(AuthBase):
         self.expiration_time: Optional[int] = None  # Unlimited
         self.set_cookie = RequestsCookieJar()
         self.token: str = ""
+        self.session = session
         self.logger = logging.getLogger(__name__)
+        self._lock = Lock()
 
     def get_cookie(self) -> RequestsCookieJar:
         """Check whether a user is successfully authenticated.
@@ -86,13 +94,16 @@ class vManageAuth(AuthBase):
         }
         full_url = urljoin(self.base_url, "/j_security_check")
         headers = {"Content-Type": "application/x-www-form-urlencoded", "User-Agent": USER_AGENT}
-        response = requests.post(
+        if self.session is not None:
+            self.session.cookies.clear()  # cookies from previous login must not be sent
+        response = self._sender.post(
             url=full_url,
             data=security_payload,
             verify=self.verify,
             headers=headers,
         )
-        self.logger.debug(self._auth_request_debug(response, include_reponse_text=True))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response, include_reponse_text=True))
         if response.text != "":
             raise UnauthorizedAccessError(self.username, self.password)
         return response.cookies
@@ -111,20 +122,29 @@ class vManageAuth(AuthBase):
         """
         full_url = urljoin(self.base_url, "/dataservice/client/token")
         headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT}
-        response = requests.get(
+        response = self._sender.get(
             url=full_url,
             cookies=cookies,
             verify=self.verify,
             headers=headers,
         )
-        self.logger.debug(self._auth_request_debug(response))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._auth_request_debug(response))
         return response.text
 
+    @property
+    def _sender(self):
+        """Session or requests module (new connection for each request) used to send authentication requests"""
+        return self.session if self.session is not None else requests
+
     def __call__(self, prepared_request: PreparedRequest) -> PreparedRequest:
         if self.expiration_time is None:
             if self.token == "":
-                self.set_cookie = self.get_cookie()
-                self.token = self.fetch_token(self.set_cookie)
+                with self._lock:
+                    # other thread could complete authentication while we were waiting for the lock
+                    if self.token == "":
+                        self.set_cookie = self.get_cookie()
+                        self.token = self.fetch_token(self.set_cookie)
 
         prepared_request.prepare_cookies(self.set_cookie)
         prepared_request.headers.update({"x-xsrf-token": self.token})
@@ -0,0 +1,237 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Waiting for device and server state with deadline and exponential backoff.
+
+State is polled first time immediately, then with delay growing from initial_delay to max_delay,
+so waiting ends soon after quick state changes and few requests are sent while nothing changes:
+>>> result = wait_until(
+>>>     lambda: session.api.devices.get_reachability(device_id),
+>>>     until=lambda reachability: reachability is Reachability.REACHABLE,
+>>>     timeout=600,
+>>> )
+>>> reachability = result.value_or_raise(f"Device {device_id} is not reachable")
+
+Many targets (eg. devices) can be awaited concurrently, each with its own backoff and common deadline:
+>>> results = wait_many(device_ids, get_reachability, until=is_reachable, timeout=600)
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from enum import Enum
+from random import random
+from threading import Event
+from time import monotonic, sleep
+from typing import Callable, Dict, Generic, Hashable, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+from catalystwan.exceptions import WaitAbortedError, WaitCancelledError, WaitTimeoutError
+from catalystwan.fan_out import DEFAULT_MAX_WORKERS
+
+P = TypeVar("P", bound=Hashable)
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Backoff:
+    """Delays between polls
+
+    Attributes:
+        initial_delay (float): seconds to wait before second poll
+        multiplier (float): delay is multiplied by this value after each poll
+        max_delay (float): maximum seconds to wait between polls
+        jitter (float): fraction of delay which is randomized (0 disables jitter), spreads polls of concurrent waits
+    """
+
+    initial_delay: float = 1.0
+    multiplier: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.1
+
+    @classmethod
+    def from_interval(cls, interval: float) -> Backoff:
+        """Replaces fixed polling interval: first delay is at most 1 second and delays grow up to twice the interval"""
+        return cls(initial_delay=min(1.0, interval), max_delay=2 * interval)
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_delay
+        while True:
+            yield delay - delay * self.jitter * random()
+            delay = min(self.max_delay, delay * self.multiplier)
+
+
+class WaitOutcome(str, Enum):
+    SATISFIED = "satisfied"
+    TIMEOUT = "timeout"
+    ABORTED = "aborted"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class WaitResult(Generic[T]):
+    """Outcome of waiting
+
+    Attributes:
+        outcome (WaitOutcome): why waiting ended
+        value (Optional[T]): last polled value (None when no poll succeeded)
+        attempts (int): number of polls
+        elapsed (float): seconds spent waiting
+    """
+
+    outcome: WaitOutcome
+    value: Optional[T]
+    attempts: int
+    elapsed: float
+
+    @property
+    def satisfied(self) -> bool:
+        return self.outcome is WaitOutcome.SATISFIED
+
+    def value_or_raise(self, message: str = "") -> T:
+        """Returns value satisfying awaited condition
+
+        Raises:
+            WaitTimeoutError: condition was not met before deadline
+            WaitAbortedError: abort predicate was met
+            WaitCancelledError: waiting was cancelled
+        """
+        if self.outcome is WaitOutcome.SATISFIED:
+            return self.value  # type: ignore[return-value]
+        details = f"{message or 'Condition not met'} ({self.outcome.value} after {self.elapsed:.1f} seconds)"
+        if self.outcome is WaitOutcome.ABORTED:
+            raise WaitAbortedError(details)
+        if self.outcome is WaitOutcome.CANCELLED:
+            raise WaitCancelledError(details)
+        raise WaitTimeoutError(details)
+
+
+class Waiter:
+    """Polls state until predicate is met, deadline passes or waiting is cancelled.
+
+    Deadline is set when waiter is created, so consecutive waits (eg. for server reachable and then ready)
+    share the same timeout. Delay before last poll is shortened so that state is polled at deadline,
+    no poll is started after it.
+
+    Args:
+        timeout: seconds from now until deadline
+        backoff: delays between polls
+        cancel: event interrupting waiting when set (eg. from other thread)
+    """
+
+    def __init__(self, timeout: float, backoff: Optional[Backoff] = None, cancel: Optional[Event] = None):
+        self.deadline = monotonic() + timeout
+        self.backoff = backoff or Backoff()
+        self.cancel = cancel
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - monotonic())
+
+    def wait(
+        self,
+        poll: Callable[[], T],
+        until: Callable[[T], bool],
+        abort_if: Optional[Callable[[T], bool]] = None,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> WaitResult[T]:
+        """Polls state until it satisfies given predicate
+
+        Args:
+            poll: gets current state
+            until: checks if state is the awaited one
+            abort_if: checks if awaited state cannot be reached anymore (eg. task failed), ends waiting early
+            retry_on: exceptions raised by poll which mean state is not available yet, other exceptions are raised
+
+        Returns:
+            WaitResult: outcome with last polled state
+        """
+        begin = monotonic()
+        delays = self.backoff.delays()
+        attempts = 0
+        last = False
+        value: Optional[T] = None
+
+        def result(outcome: WaitOutcome) -> WaitResult[T]:
+            return WaitResult(outcome, value, attempts, monotonic() - begin)
+
+        while True:
+            if self.cancel is not None and self.cancel.is_set():
+                return result(WaitOutcome.CANCELLED)
+            attempts += 1
+            try:
+                value = poll()
+            except retry_on as error:
+                logger.debug(f"State not available yet: {error!r}")
+            else:
+                if until(value):
+                    return result(WaitOutcome.SATISFIED)
+                if abort_if is not None and abort_if(value):
+                    return result(WaitOutcome.ABORTED)
+            remaining = self.deadline - monotonic()
+            if remaining <= 0 or last:
+                return result(WaitOutcome.TIMEOUT)
+            delay = next(delays)
+            last = delay >= remaining
+            delay = min(delay, remaining)  # last poll is sent at deadline
+            logger.debug(f"Awaited state not reached after {attempts} polls, next poll in {delay:.2f} seconds")
+            if self._sleep(delay):
+                return result(WaitOutcome.CANCELLED)
+
+    def _sleep(self, delay: float) -> bool:
+        """Sleeps for given seconds, returns True when waiting was cancelled"""
+        if self.cancel is not None:
+            return self.cancel.wait(delay)
+        sleep(delay)
+        return False
+
+
+def wait_until(
+    poll: Callable[[], T],
+    until: Callable[[T], bool],
+    timeout: float,
+    backoff: Optional[Backoff] = None,
+    abort_if: Optional[Callable[[T], bool]] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (),
+    cancel: Optional[Event] = None,
+) -> WaitResult[T]:
+    """Polls state until it satisfies given predicate (see Waiter.wait)"""
+    return Waiter(timeout, backoff, cancel).wait(poll, until, abort_if, retry_on)
+
+
+def wait_many(
+    targets: Iterable[P],
+    poll: Callable[[P], T],
+    until: Callable[[T], bool],
+    timeout: float,
+    backoff: Optional[Backoff] = None,
+    abort_if: Optional[Callable[[T], bool]] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (),
+    cancel: Optional[Event] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Dict[P, WaitResult[T]]:
+    """Waits for state of many targets concurrently, each target has its own backoff and all share one deadline
+
+    Args:
+        targets: awaited objects (eg. device IDs)
+        poll: gets current state of target
+        max_workers: maximum number of targets polled at the same time
+
+    Returns:
+        outcome of waiting by target (in order of targets)
+
+    Raises:
+        Exception: first exception raised by poll (not listed in retry_on), in order of targets
+    """
+    waiters = {target: Waiter(timeout, backoff, cancel) for target in targets}
+    if not waiters:
+        return {}
+
+    def wait(target: P) -> WaitResult[T]:
+        return waiters[target].wait(lambda: poll(target), until, abort_if, retry_on)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(waiters)), thread_name_prefix="catalystwan-wait") as pool:
+        futures = {target: pool.submit(copy_context().run, wait, target) for target in waiters}
+        return {target: future.result() for target, future in futures.items()}
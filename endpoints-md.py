@@ -15,6 +15,7 @@ from packaging.specifiers import SpecifierSet  # type: ignore
 
 from catalystwan import __package__
 from catalystwan.endpoints import BASE_PATH, APIEndpointRequestMeta, TypeSpecifier, request, versions, view
+from catalystwan.utils.lazy_member import lazy_members
 from catalystwan.utils.session_type import SessionType  # type: ignore
 
 SOURCE_BASE_PATH = "https://github.com/CiscoDevNet/catalystwan/blob/main/"
@@ -153,7 +154,7 @@ class Endpoint(MarkdownRenderer):
         )
 
     def __lt__(self, other: Endpoint):
-        self.method_link < other.method_link
+        return self.method_link < other.method_link
 
     def md(self) -> str:
         return "|".join(
@@ -194,20 +195,31 @@ class EndpointRegistry(MarkdownRenderer):
         return info + table_header + table_content + "\n"
 
 
-if __name__ == "__main__":
+def resolve_lazy_members(container: Any) -> None:
+    """Creates all lazy members of container and nested containers.
+    Endpoint modules are imported on first access only, importing them registers decorated methods meta data."""
+    for name in lazy_members(type(container)):
+        resolve_lazy_members(getattr(container, name))
+
+
+def create_endpoint_registry() -> EndpointRegistry:
     from unittest.mock import MagicMock
 
     from catalystwan.endpoints.endpoints_container import APIEndpointContainter
 
     # this instantiates APIEndpoints classes triggering method decorators
     # endpoints not attached to container will be not documented !
-    _ = APIEndpointContainter(MagicMock())
+    resolve_lazy_members(APIEndpointContainter(MagicMock()))
 
-    endpoint_registry = EndpointRegistry(
+    return EndpointRegistry(
         meta_lookup=request.request_lookup,
         versions_lookup=versions.versions_lookup,
         tenancy_modes_lookup=view.view_lookup,
     )
+
+
+if __name__ == "__main__":
+    endpoint_registry = create_endpoint_registry()
     if environ.get("catalystwan_export_endpoints") is not None:
         with open("ENDPOINTS.md", "w") as f:
             f.write("**THIS FILE WAS AUTO-GENERATED DO NOT EDIT**\n\n")